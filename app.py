@@ -1,8 +1,12 @@
 # app.py (수정될 내용)
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, g
 # from apscheduler.schedulers.background import BackgroundScheduler # 제거
 from dotenv import load_dotenv
 import predictor
+import prebuilt_response
+import instrumentation
+import profiling
+import numpy as np
 # from tasks import run_daily_prediction_job # tasks 모듈 임포트도 제거
 import os
 import datetime
@@ -25,10 +29,20 @@ cached_data = {
     'hitter_data': None,
     'pitcher_data': None,
     'win_probability_df': None,
+    'win_probability_matrix': None,
     'predicted_team_rankings_df': None,
-    'last_update': None
+    'last_update': None,
+    'checked_at': None,  # database 모드에서 DB 변경 여부를 마지막으로 확인한 시각 (변경이 없으면 스냅샷은 그대로)
+    'snapshot': None  # 위 값들을 한 번에 담은 최신 스냅샷 (predictor가 원자적으로 교체)
 }
 
+# database 모드에서는 워커 시작 시 DB 스냅샷을 미리 읽어 둡니다 (실패하면 첫 요청에서 다시 시도).
+if predictor.PREDICTION_SOURCE == 'database':
+    try:
+        predictor.get_snapshot(cached_data)
+    except Exception as e:
+        print(f"❌ 시작 시 DB 스냅샷 로드 실패 (첫 요청에서 다시 시도합니다): {e}")
+
 # --- 스케줄러와 초기 실행 로직은 여기서 완전히 제거됩니다 ---
 # scheduler = BackgroundScheduler(daemon=True, timezone='Asia/Seoul')
 # scheduler.add_job(run_daily_prediction_job, 'cron', hour=5, minute=0)
@@ -40,60 +54,248 @@ cached_data = {
 #     print("✅ 초기 데이터 로드 및 예측 작업 완료.")
 # --- 제거 끝 ---
 
-@app.route('/predict_win_probability', methods=['POST'])
-def predict_win_probability():
-    data = request.get_json()
-    if not data or 'team1' not in data or 'team2' not in data:
-        return jsonify({'error': '두 팀 이름을 제공해야 합니다. 예: {"team1": "LG", "team2": "삼성"}'}), 400
+# --- 라우트 처리 로직 ---
+# 각 handle_* 함수는 Flask에 의존하지 않고 (상태 코드, 본문, 헤더)를 반환합니다.
+# 본문이 dict/list면 app.json으로 직렬화하고(jsonify와 같은 바이트), bytes면 그대로, None이면 본문 없이 응답합니다.
+# Flask 라우트와 asgi.py가 같은 함수를 사용하므로 두 서버의 응답은 항상 같습니다.
+# get_snapshot은 스냅샷을 반환하는 함수로, 새로고침이 필요하면 호출한 스레드를 막을 수 있습니다.
+
+def handle_predict_win_probability(data, get_snapshot):
+    if not isinstance(data, dict) or 'team1' not in data or 'team2' not in data:
+        return 400, {'error': '두 팀 이름을 제공해야 합니다. 예: {"team1": "LG", "team2": "삼성"}'}, {}
 
     team1 = data['team1']
     team2 = data['team2']
+    # 팀 이름은 행렬의 팀 인덱스(dict)로 찾으므로 문자열이 아니면(목록 등) 조회 전에 거절
+    if not isinstance(team1, str) or not isinstance(team2, str):
+        return 400, {'error': '팀 이름은 문자열이어야 합니다. 예: {"team1": "LG", "team2": "삼성"}'}, {}
 
     try:
         # API 요청 시에는 캐시 기반으로 예측 결과 제공
         # predictor.py 내부에서 24시간이 지났다면 데이터를 새로고침하고 캐시를 업데이트합니다.
-        win_probability_df = predictor.get_win_probability_df(cached_data) # cached_data를 인자로 넘김
+        win_probability_matrix = get_snapshot()['win_probability_matrix']
 
-        valid_teams = win_probability_df.index.tolist()
+        valid_teams = list(win_probability_matrix.teams)
 
-        if team1 not in valid_teams:
-            return jsonify({'error': f"'{team1}'은(는) 유효한 팀 이름이 아닙니다. 유효한 팀 목록: {', '.join(valid_teams)}", 'valid_teams': valid_teams}), 400
-        if team2 not in valid_teams:
-            return jsonify({'error': f"'{team2}'은(는) 유효한 팀 이름이 아닙니다. 유효한 팀 목록: {', '.join(valid_teams)}", 'valid_teams': valid_teams}), 400
+        if team1 not in win_probability_matrix:
+            return 400, {'error': f"'{team1}'은(는) 유효한 팀 이름이 아닙니다. 유효한 팀 목록: {', '.join(valid_teams)}", 'valid_teams': valid_teams}, {}
+        if team2 not in win_probability_matrix:
+            return 400, {'error': f"'{team2}'은(는) 유효한 팀 이름이 아닙니다. 유효한 팀 목록: {', '.join(valid_teams)}", 'valid_teams': valid_teams}, {}
         if team1 == team2:
-            return jsonify({'error': "같은 팀 간의 승률은 계산할 수 없습니다."}), 400
+            return 400, {'error': "같은 팀 간의 승률은 계산할 수 없습니다."}, {}
 
-        win_prob = win_probability_df.loc[team1, team2]
-        if win_prob == '-':
-            return jsonify({'error': "승률을 계산할 수 없습니다."}), 400
+        win_prob = win_probability_matrix.get(team1, team2)
+        if np.isnan(win_prob):
+            return 400, {'error': "승률을 계산할 수 없습니다."}, {}
 
-        return jsonify({
+        return 200, {
             'team1': team1,
             'team2': team2,
-            'win_probability': float(win_prob),
+            'win_probability': win_prob,
             'message': f"{team1}이(가) {team2}을(를) 상대로 승리할 예측 승률은 {win_prob}% 입니다."
-        })
+        }, {}
 
     except Exception as e:
-        return jsonify({'error': f"승률 예측 중 오류가 발생했습니다: {str(e)}"}), 500
+        return 500, {'error': f"승률 예측 중 오류가 발생했습니다: {str(e)}"}, {}
 
-@app.route('/predict_team_rankings', methods=['GET'])
-def predict_team_rankings():
-    """예측된 팀 순위를 반환하는 API 엔드포인트"""
+# 한 번에 요청할 수 있는 최대 대진 수 / 일정 조회 일수
+MAX_BATCH_MATCHUPS = 200
+MAX_SCHEDULE_DAYS = 14
+
+def handle_predict_win_probabilities(data, get_snapshot):
+    """여러 대진(또는 특정 날짜부터의 경기 일정)의 승률을 한 번에 계산
+
+    요청 예: {"matchups": [{"team1": "LG", "team2": "삼성"}, ...]} 또는 {"date": "2025-05-01", "days": 7}
+    """
+    if not isinstance(data, dict) or ('matchups' not in data and 'date' not in data):
+        return 400, {'error': '대진 목록 또는 날짜를 제공해야 합니다. 예: {"matchups": [{"team1": "LG", "team2": "삼성"}]} 또는 {"date": "2025-05-01", "days": 7}'}, {}
+
+    try:
+        if 'matchups' in data:
+            matchups = data['matchups']
+            # 팀 이름은 행렬의 팀 인덱스(dict)로 찾으므로 문자열만 허용 (목록 등은 조회 중 TypeError)
+            if not isinstance(matchups, list) or not all(
+                    isinstance(m, dict) and isinstance(m.get('team1'), str) and isinstance(m.get('team2'), str)
+                    for m in matchups):
+                return 400, {'error': 'matchups는 {"team1": "팀 이름", "team2": "팀 이름"} 객체의 목록이어야 합니다.'}, {}
+            matchups = [{'team1': m['team1'], 'team2': m['team2']} for m in matchups]
+        else:
+            try:
+                start_date = datetime.date.fromisoformat(str(data['date']))
+                days = int(data.get('days', 1))
+            except (TypeError, ValueError):
+                # days가 null/목록/객체면 TypeError
+                return 400, {'error': "date는 'YYYY-MM-DD' 형식, days는 정수여야 합니다."}, {}
+            if not 1 <= days <= MAX_SCHEDULE_DAYS:
+                return 400, {'error': f"days는 1 이상 {MAX_SCHEDULE_DAYS} 이하여야 합니다."}, {}
+
+            # 일정 조회에만 필요하므로 이 경로에서만 크롤러를 불러옵니다.
+            import crawler
+            schedule = crawler.crawl_schedule(start_date, days)
+            # 일정은 원정 대 홈 순서이며, 승률은 원정팀(team1)이 홈팀(team2)을 이길 확률입니다.
+            matchups = [{'date': game.date, 'time': game.time, 'team1': game.away, 'team2': game.home}
+                        for game in schedule.itertuples(index=False)]
+
+        if len(matchups) > MAX_BATCH_MATCHUPS:
+            return 400, {'error': f"한 번에 최대 {MAX_BATCH_MATCHUPS}개 대진까지 요청할 수 있습니다."}, {}
+
+        # 모든 대진을 같은 스냅샷 하나로 계산
+        snapshot = get_snapshot()
+        win_probability_matrix = snapshot['win_probability_matrix']
+
+        # 팀 이름은 행렬의 팀 인덱스(dict)로 검증하고, 유효한 대진만 한 번에 조회
+        valid = []
+        for matchup in matchups:
+            team1, team2 = matchup['team1'], matchup['team2']
+            if team1 not in win_probability_matrix or team2 not in win_probability_matrix:
+                invalid = [team for team in (team1, team2) if team not in win_probability_matrix]
+                matchup['error'] = f"'{', '.join(map(str, invalid))}'은(는) 유효한 팀 이름이 아닙니다."
+            elif team1 == team2:
+                matchup['error'] = "같은 팀 간의 승률은 계산할 수 없습니다."
+            else:
+                valid.append(matchup)
+
+        win_probs = win_probability_matrix.get_many([m['team1'] for m in valid], [m['team2'] for m in valid])
+        for matchup, win_prob in zip(valid, win_probs.tolist()):
+            if np.isnan(win_prob):
+                matchup['error'] = "승률을 계산할 수 없습니다."
+            else:
+                matchup['win_probability'] = win_prob
+
+        return 200, {
+            'matchups': matchups,
+            'valid_teams': list(win_probability_matrix.teams),
+            'last_update': snapshot['last_update'].strftime('%Y-%m-%d %H:%M:%S'),
+        }, {}
+
+    except Exception as e:
+        return 500, {'error': f"승률 예측 중 오류가 발생했습니다: {str(e)}"}, {}
+
+# 팀 순위 응답 캐시 설정 (순위는 하루 한 번 바뀌므로 짧게 캐시하고 이후에는 ETag로 재검증)
+RANKINGS_CACHE_CONTROL = os.getenv('RANKINGS_CACHE_CONTROL', 'public, max-age=300')
+
+def _serialize_team_rankings(snapshot):
+    """스냅샷의 팀 순위를 jsonify와 같은 바이트로 직렬화 (스냅샷당 한 번)"""
+    predicted_rankings_df = snapshot['predicted_team_rankings_df']
+    if predicted_rankings_df is None:
+        raise ValueError('팀 순위 예측 데이터가 없습니다.')
+    return app.json.response(predicted_rankings_df.to_dict(orient='records')).get_data()
+
+team_rankings_responses = prebuilt_response.SnapshotResponseCache(_serialize_team_rankings)
+
+def handle_predict_team_rankings(get_snapshot, accept_encoding, if_none_match):
+    """예측된 팀 순위 (스냅샷별로 미리 직렬화/압축한 본문)"""
     try:
-        predicted_rankings_df = predictor.get_predicted_team_rankings_df(cached_data) # cached_data를 인자로 넘김
-        if predicted_rankings_df is None:
-            return jsonify({'error': '팀 순위 예측 데이터를 불러올 수 없습니다. 데이터 로딩 중이거나 오류가 발생했습니다.'}), 500
+        snapshot = get_snapshot()
+        if snapshot is None or snapshot['predicted_team_rankings_df'] is None:
+            return 500, {'error': '팀 순위 예측 데이터를 불러올 수 없습니다. 데이터 로딩 중이거나 오류가 발생했습니다.'}, {}
+
+        # 스냅샷별로 미리 직렬화/압축한 본문 중 Accept-Encoding에 맞는 것을 선택
+        prebuilt = team_rankings_responses.get(snapshot)
+        encoding, body, etag = prebuilt.negotiate(accept_encoding)
+        headers = prebuilt.headers(encoding, etag, RANKINGS_CACHE_CONTROL)
 
-        # DataFrame을 JSON 형식으로 변환하여 반환
-        return jsonify(predicted_rankings_df.to_dict(orient='records'))
+        if prebuilt_response.etag_matches(if_none_match, etag):
+            return 304, None, headers
+        headers['Content-Type'] = prebuilt.content_type
+        return 200, body, headers
 
     except Exception as e:
-        return jsonify({'error': f"팀 순위 예측 결과를 가져오는 중 오류가 발생했습니다: {str(e)}"}), 500
+        return 500, {'error': f"팀 순위 예측 결과를 가져오는 중 오류가 발생했습니다: {str(e)}"}, {}
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def handle_metrics():
+    """단계별 계측 누적값과 새로고침 통계 (Prometheus 텍스트 형식)"""
+    body = instrumentation.render_prometheus(predictor.get_refresh_stats()).encode('utf-8')
+    return 200, body, {'Content-Type': METRICS_CONTENT_TYPE}
+
+# 요청 자체가 잘못된 경우(JSON 형식, Content-Type, 경로, 메서드, 본문 크기)의 오류 응답
+# Flask는 errorhandler로, asgi.py는 직접 이 함수를 불러 두 서버가 같은 JSON 본문으로 응답합니다.
+HTTP_ERROR_MESSAGES = {
+    400: '요청 본문이 올바른 JSON이 아닙니다.',
+    404: '요청한 경로를 찾을 수 없습니다.',
+    405: '허용되지 않는 메서드입니다.',
+    413: '요청 본문이 너무 큽니다.',
+    415: "요청 본문은 'application/json' 형식이어야 합니다.",
+}
+
+# 요청 본문 최대 크기 (바이트)
+MAX_BODY_BYTES = 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = MAX_BODY_BYTES
+
+def handle_http_error(status):
+    return status, {'error': HTTP_ERROR_MESSAGES[status]}, {}
+
+HOME_MESSAGE = "환영합니다! KBO 승률 예측 API입니다. /predict_win_probability (POST), /predict_win_probabilities (POST) 또는 /predict_team_rankings (GET) 엔드포인트를 사용하세요."
+
+# --- Flask 라우트 ---
+
+def _get_cached_snapshot():
+    return predictor.get_snapshot(cached_data) # cached_data를 인자로 넘김
+
+def _flask_response(result):
+    """handle_* 결과를 Flask 응답으로 변환"""
+    status, body, headers = result
+    if isinstance(body, (dict, list)):
+        return jsonify(body), status, headers
+    return Response(body, status=status, headers=headers)
+
+def _http_error(e):
+    # Werkzeug 기본 HTML 오류 페이지 대신 asgi.py와 같은 JSON 오류 본문으로 응답
+    return _flask_response(handle_http_error(e.code))
+
+for _status in HTTP_ERROR_MESSAGES:
+    app.register_error_handler(_status, _http_error)
+
+# --- 프로파일링 (PROFILING=1 또는 관리자 X-Profile-Token 헤더일 때만) ---
+
+@app.before_request
+def _start_profiling():
+    force = profiling.is_admin_token(request.headers.get(profiling.PROFILE_TOKEN_HEADER))
+    g.profiling_session = profiling.start(f"{request.method} {request.path}", force=force)
+
+@app.after_request
+def _stop_profiling(response):
+    session = g.pop('profiling_session', None)
+    if session is not None:
+        path = session.stop()
+        # 관리자 요청에는 저장된 프로파일 파일 이름을 알려줌
+        if path is not None and session.force:
+            response.headers['X-Profile-File'] = os.path.basename(path)
+    return response
+
+@app.teardown_request
+def _discard_profiling(exc):
+    # 처리되지 않은 예외로 after_request가 건너뛰어진 경우에도 프로파일러를 멈춥니다.
+    session = g.pop('profiling_session', None)
+    if session is not None:
+        session.stop()
+
+@app.route('/predict_win_probability', methods=['POST'])
+def predict_win_probability():
+    return _flask_response(handle_predict_win_probability(request.get_json(), _get_cached_snapshot))
+
+@app.route('/predict_win_probabilities', methods=['POST'])
+def predict_win_probabilities():
+    """여러 대진(또는 특정 날짜부터의 경기 일정)의 승률을 한 번에 반환하는 API 엔드포인트"""
+    return _flask_response(handle_predict_win_probabilities(request.get_json(silent=True), _get_cached_snapshot))
+
+@app.route('/predict_team_rankings', methods=['GET'])
+def predict_team_rankings():
+    """예측된 팀 순위를 반환하는 API 엔드포인트"""
+    return _flask_response(handle_predict_team_rankings(
+        _get_cached_snapshot, request.headers.get('Accept-Encoding'), request.headers.get('If-None-Match')
+    ))
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus 스크레이프용 계측 지표"""
+    return _flask_response(handle_metrics())
 
 @app.route('/')
 def home():
-    return "환영합니다! KBO 승률 예측 API입니다. /predict_win_probability (POST) 또는 /predict_team_rankings (GET) 엔드포인트를 사용하세요."
+    return HOME_MESSAGE
 
 if __name__ == '__main__':
     # 이 블록은 gunicorn 사용 시 실행되지 않지만, 로컬 개발을 위해 남겨둘 수 있습니다.
@@ -0,0 +1,152 @@
+# asgi.py
+# 예측 API의 비동기(ASGI) 서빙 모드 (선택 사항)
+#
+# app.py의 handle_* 함수를 그대로 사용하므로 응답 본문은 Flask 라우트와 같습니다.
+# - 새로고침이 필요 없으면 현재 스냅샷(불변)으로 이벤트 루프에서 바로 응답합니다.
+# - 요청 스레드에서 새로고침해야 하거나 일정 크롤링이 필요한 요청은 스레드 풀에서 처리해 이벤트 루프를 막지 않습니다.
+#
+# 실행: python asgi.py  (uvicorn 필요)
+#       gunicorn -k uvicorn.workers.UvicornWorker asgi:application
+import asyncio
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import app as api
+import predictor
+
+# 새로고침/크롤링처럼 블로킹되는 작업을 실행할 스레드 수
+BLOCKING_WORKERS = int(os.getenv('ASGI_BLOCKING_WORKERS', '4'))
+
+blocking_executor = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix='asgi-blocking')
+
+
+class _BadRequest(Exception):
+    # 응답 본문은 Flask errorhandler와 같은 app.handle_http_error(status)를 사용
+    def __init__(self, status):
+        super().__init__(api.HTTP_ERROR_MESSAGES[status])
+        self.status = status
+
+
+async def _read_body(receive):
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise _BadRequest(400)
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > api.MAX_BODY_BYTES:
+            raise _BadRequest(413)
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+def _parse_json(body, headers, silent):
+    """Flask request.get_json(silent=...)과 같은 규칙으로 JSON 본문 파싱"""
+    mimetype = headers.get('content-type', '').split(';')[0].strip().lower()
+    if mimetype != 'application/json' and not (mimetype.startswith('application/') and mimetype.endswith('+json')):
+        if silent:
+            return None
+        raise _BadRequest(415)
+    try:
+        return json.loads(body)
+    except ValueError:
+        if silent:
+            return None
+        raise _BadRequest(400)
+
+
+async def _call_with_snapshot(handler, needs_blocking=False, **kwargs):
+    """스냅샷을 바로 쓸 수 있으면 이벤트 루프에서, 새로고침 등 블로킹 작업이 필요하면 스레드 풀에서 handler 실행"""
+    if not needs_blocking:
+        snapshot = predictor.get_snapshot_nowait(api.cached_data)
+        if snapshot is not None:
+            return handler(get_snapshot=lambda: snapshot, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        blocking_executor, functools.partial(handler, get_snapshot=api._get_cached_snapshot, **kwargs)
+    )
+
+
+async def _dispatch(method, path, headers, receive):
+    """(상태 코드, 본문, 헤더) 반환. 본문 형식은 app.handle_* 와 같음"""
+    if path == '/predict_win_probability' and method == 'POST':
+        data = _parse_json(await _read_body(receive), headers, silent=False)
+        return await _call_with_snapshot(api.handle_predict_win_probability, data=data)
+
+    if path == '/predict_win_probabilities' and method == 'POST':
+        data = _parse_json(await _read_body(receive), headers, silent=True)
+        # 날짜 요청은 일정 크롤링(네트워크)이 필요하므로 스레드 풀에서 처리
+        needs_blocking = isinstance(data, dict) and 'date' in data and 'matchups' not in data
+        return await _call_with_snapshot(api.handle_predict_win_probabilities, needs_blocking, data=data)
+
+    if path == '/predict_team_rankings' and method in ('GET', 'HEAD'):
+        return await _call_with_snapshot(api.handle_predict_team_rankings,
+                                         accept_encoding=headers.get('accept-encoding'),
+                                         if_none_match=headers.get('if-none-match'))
+
+    if path == '/metrics' and method in ('GET', 'HEAD'):
+        return api.handle_metrics()
+
+    if path == '/' and method in ('GET', 'HEAD'):
+        return 200, api.HOME_MESSAGE, {}
+
+    if path in ('/', '/predict_win_probability', '/predict_win_probabilities', '/predict_team_rankings', '/metrics'):
+        return api.handle_http_error(405)
+    return api.handle_http_error(404)
+
+
+def _encode(status, body, headers):
+    """handle_* 결과를 (본문 바이트, 헤더 목록)으로 변환 (Flask 응답과 같은 바이트/Content-Type)"""
+    headers = dict(headers)
+    if isinstance(body, (dict, list)):
+        body_bytes = api.app.json.response(body).get_data()
+        headers.setdefault('Content-Type', api.app.json.mimetype)
+    elif isinstance(body, str):
+        body_bytes = body.encode('utf-8')
+        headers.setdefault('Content-Type', 'text/html; charset=utf-8')
+    else:
+        body_bytes = body or b''
+
+    if status != 304:
+        headers['Content-Length'] = str(len(body_bytes))
+    return body_bytes, [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()]
+
+
+async def application(scope, receive, send):
+    """ASGI 진입점"""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                blocking_executor.shutdown(wait=False, cancel_futures=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    if scope['type'] != 'http':
+        return
+
+    headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+    try:
+        status, body, response_headers = await _dispatch(scope['method'], scope['path'], headers, receive)
+    except _BadRequest as e:
+        status, body, response_headers = api.handle_http_error(e.status)
+
+    body_bytes, raw_headers = _encode(status, body, response_headers)
+    await send({'type': 'http.response.start', 'status': status, 'headers': raw_headers})
+    await send({'type': 'http.response.body', 'body': b'' if scope['method'] == 'HEAD' else body_bytes})
+
+
+if __name__ == '__main__':
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("ASGI 모드에는 uvicorn이 필요합니다: pip install uvicorn")
+    uvicorn.run('asgi:application', host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
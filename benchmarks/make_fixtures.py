@@ -0,0 +1,79 @@
+# benchmarks/make_fixtures.py
+# 벤치마크용 KBO 기록 페이지 HTML 픽스처 생성
+#
+# 기록 페이지(Record/Player/*Basic/Basic1.aspx)와 같은 마크업(record_result 테이블, hidden 폼 값,
+# 시즌 드롭다운, __doPostBack 페이저)으로 data/*_historical.tsv의 최근 시즌 기록을 페이지당 30행씩 저장합니다.
+# 셀 값은 원본 텍스트를 그대로 사용합니다 (이닝 "149 1/3" 등 기록 페이지와 같은 표기).
+# 파일 이름: fixtures/<유형>_basic1_p<페이지>.html
+#
+# 사용법: python benchmarks/make_fixtures.py
+import html
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import historical_store  # noqa: E402
+
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+ROWS_PER_PAGE = 30
+
+# 유형별로 픽스처에 사용할 시즌 (역대 데이터에 있는 가장 최근 시즌)
+FIXTURE_SEASONS = {'hitter': 2025, 'pitcher': 2024}
+
+_PAGER_TARGET = 'ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ucPager$btnNo{page}'
+_SEASON_FIELD = 'ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeason$ddlSeason'
+
+
+def _page_html(df, season, page, n_pages):
+    rows = df.iloc[(page - 1) * ROWS_PER_PAGE: page * ROWS_PER_PAGE]
+    head = ''.join(f'<th>{html.escape(str(column))}</th>' for column in ['순위'] + list(rows.columns))
+    body = ''.join(
+        '<tr>' + f'<td>{(page - 1) * ROWS_PER_PAGE + i + 1}</td>'
+        + ''.join(f'<td>{html.escape(str(value))}</td>' for value in row) + '</tr>\n'
+        for i, row in enumerate(rows.values.tolist())
+    )
+    pager = ''.join(
+        f'<a id="btnNo{n}"{" class=on" if n == page else ""} '
+        f'href="javascript:__doPostBack(&#39;{_PAGER_TARGET.format(page=n)}&#39;,&#39;&#39;)">{n}</a>'
+        for n in range(1, n_pages + 1)
+    )
+    options = ''.join(f'<option value="{year}"{" selected" if year == season else ""}>{year}</option>'
+                      for year in range(season, 1981, -1))
+    return (
+        '<!DOCTYPE html>\n<html lang="ko"><head><meta charset="utf-8"><title>KBO 기록실</title></head><body>\n'
+        '<form method="post" id="mainForm">\n'
+        f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="fixture-{season}-{page}" />\n'
+        '<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="fixture" />\n'
+        f'<select name="{_SEASON_FIELD}">{options}</select>\n'
+        '<div class="record_result"><table class="tData01 tt"><thead><tr>' + head + '</tr></thead>\n'
+        '<tbody>\n' + body + '</tbody></table></div>\n'
+        f'<div class="paging">{pager}</div>\n'
+        '</form></body></html>\n'
+    )
+
+
+def read_season(kind, season):
+    """원본 TSV에서 한 시즌 기록을 문자열 그대로 읽음 (historical_store의 dtype 변환 전 값)"""
+    source = historical_store.SOURCES[kind]
+    df = pd.read_csv(source['path'], header=None, names=source['columns'], dtype=str, **source['read_csv'])
+    return df[df['연도'] == str(season)].drop(columns=['연도']).reset_index(drop=True)
+
+
+def build_fixtures(fixture_dir=DEFAULT_FIXTURE_DIR):
+    os.makedirs(fixture_dir, exist_ok=True)
+    for kind, season in FIXTURE_SEASONS.items():
+        df = read_season(kind, season)
+        n_pages = (len(df) + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE
+        for page in range(1, n_pages + 1):
+            path = os.path.join(fixture_dir, f'{kind}_basic1_p{page}.html')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(_page_html(df, season, page, n_pages))
+        print(f"✅ {kind} 픽스처 {n_pages}페이지 생성 ({len(df)}행, {season} 시즌)")
+
+
+if __name__ == '__main__':
+    build_fixtures()
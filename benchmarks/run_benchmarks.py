@@ -0,0 +1,341 @@
+# benchmarks/run_benchmarks.py
+# 새로고침 파이프라인과 API 응답 경로 벤치마크
+#
+# - 네트워크 없이 실행: 크롤링은 fixtures/의 기록 페이지 HTML을 돌려주는 가짜 세션으로,
+#   DB 저장은 임시 SQLite 파일로 대신합니다. 학습 캐시/모델 저장소/페이지 캐시도 임시 디렉터리를 사용합니다.
+# - 선수 기록은 배수(기본 1, 10, 100배)만큼 복제해 처리/저장 단계의 확장성을 봅니다.
+# - 단계별 소요 시간(초), 최대 메모리(tracemalloc, MB), 처리량(행/초 또는 요청/초)을 기록합니다.
+# - --baseline의 결과와 비교해 허용 범위(--tolerance)보다 느려지거나 메모리가 늘면 종료 코드 1로 끝납니다.
+#   기준 결과 파일이 없으면 종료 코드 2로 끝납니다 (비교 없이 측정만 하려면 --no-compare).
+#
+# 사용법:
+#   python benchmarks/run_benchmarks.py                       # 결과: benchmarks/results/latest.json
+#   python benchmarks/run_benchmarks.py --save-baseline       # 결과를 benchmarks/baseline.json으로 저장
+#   python benchmarks/run_benchmarks.py --no-compare          # 기준 결과와 비교하지 않음
+#   python benchmarks/run_benchmarks.py --scales 1,10 --repeat 3
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, 'fixtures')
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, 'results')
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+# 모듈을 불러오기 전에 모든 저장 위치를 임시 디렉터리로 돌려 실제 캐시/DB/모델을 건드리지 않도록 합니다.
+WORK_DIR = tempfile.mkdtemp(prefix='kbo-bench-')
+os.environ['DB_URI'] = 'sqlite:///' + os.path.join(WORK_DIR, 'bench.db')
+os.environ['KBO_PAGE_CACHE_DIR'] = os.path.join(WORK_DIR, 'pages')
+os.environ['TRAINING_CACHE_DIR'] = os.path.join(WORK_DIR, 'training')
+os.environ['MODEL_REGISTRY_DIR'] = os.path.join(WORK_DIR, 'models')
+os.environ['KBO_CRAWLER_OFFLINE'] = ''
+# 페이지 넘김 경로까지 측정하도록 픽스처의 모든 페이지를 크롤링
+os.environ['KBO_CRAWL_MAX_PAGES'] = '0'
+os.environ.pop('PREDICTION_SHARED_SNAPSHOT_PATH', None)
+os.environ['PREDICTION_SOURCE'] = 'compute'
+
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+import pandas as pd  # noqa: E402
+import requests  # noqa: E402
+
+import crawl_engine  # noqa: E402
+import crawler  # noqa: E402
+import data_processor  # noqa: E402
+import db_utils  # noqa: E402
+import historical_store  # noqa: E402
+import predictor  # noqa: E402
+import season_simulator  # noqa: E402
+from page_cache import PageCache  # noqa: E402
+
+# 시간 차이가 이보다 작으면 비율이 커도 회귀로 보지 않음 (짧은 단계의 측정 잡음)
+MIN_REGRESSION_SECONDS = 0.05
+MIN_REGRESSION_MB = 1.0
+
+
+class FixtureSession:
+    """기록 페이지 요청에 fixtures/의 HTML을 돌려주는 가짜 세션 (페이저 postback의 btnNo<n>으로 페이지 선택)"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def request(self, method, url, headers=None, data=None, timeout=None):
+        self.requests += 1
+        kind = 'hitter' if 'Hitter' in url else 'pitcher'
+        target = (data or {}).get('__EVENTTARGET', '')
+        page = int(target.rsplit('btnNo', 1)[1]) if 'btnNo' in target else 1
+
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+        path = os.path.join(FIXTURE_DIR, f'{kind}_basic1_p{page}.html')
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                response._content = f.read()
+            response.status_code = 200
+        else:
+            response._content = b''
+            response.status_code = 404
+        return response
+
+
+def _fixture_crawler(ttl_seconds):
+    """임시 페이지 캐시와 가짜 세션을 쓰는 KboCrawler를 crawler 모듈에 연결"""
+    cache = PageCache(cache_dir=tempfile.mkdtemp(prefix='pages-', dir=WORK_DIR), ttl_seconds=ttl_seconds)
+    engine = crawl_engine.KboCrawler(cache=cache)
+    engine.session = FixtureSession()
+    crawler.kbo_crawler = engine
+    return engine
+
+
+def scale_frame(df, factor):
+    """선수 기록을 factor배로 복제 (복제본 선수명에는 접미사를 붙여 서로 다른 선수로 취급)"""
+    if factor == 1:
+        return df.copy()
+    frames = []
+    for i in range(factor):
+        copy = df.copy()
+        if i:
+            copy['선수명'] = copy['선수명'].astype(str) + f'#{i}'
+        frames.append(copy)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _fresh_training_state():
+    """학습 캐시를 비워 매번 전체 학습을 측정"""
+    data_processor._memory_cache.clear()
+    data_processor.TRAINING_CACHE_DIR = tempfile.mkdtemp(prefix='training-', dir=WORK_DIR)
+
+
+class Recorder:
+    def __init__(self, repeat, verbose):
+        self.repeat = repeat
+        self.verbose = verbose
+        self.results = {}
+
+    def measure(self, name, fn, rows=None, setup=None, track_memory=True, unit='rows'):
+        """fn을 repeat번 실행해 최소 시간과 최대 메모리를 기록하고 마지막 결과 반환"""
+        best_seconds = None
+        peak_bytes = 0
+        result = None
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            gc.collect()
+            if track_memory:
+                tracemalloc.start()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(sys.stdout if self.verbose else output):
+                start = time.perf_counter()
+                result = fn()
+                seconds = time.perf_counter() - start
+            if track_memory:
+                peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+            best_seconds = seconds if best_seconds is None else min(best_seconds, seconds)
+
+        record = {'seconds': round(best_seconds, 4)}
+        if track_memory:
+            record['peak_mb'] = round(peak_bytes / 1024 / 1024, 2)
+        if rows is not None:
+            record[unit] = rows
+            record[f'{unit}_per_second'] = round(rows / best_seconds, 1) if best_seconds else None
+        self.results[name] = record
+
+        summary = ', '.join(f'{key}={value}' for key, value in record.items())
+        print(f"⏱️ {name}: {summary}")
+        return result
+
+
+def bench_crawl(recorder):
+    """픽스처 기록 페이지 크롤링 (빈 캐시 / 캐시 적중) 및 역대 데이터 로드"""
+    def crawl_both():
+        return crawler.crawl_hitter_data(), crawler.crawl_pitcher_data()
+
+    hitter_2025, pitcher_2025 = recorder.measure('crawl/cold', crawl_both,
+                                                 setup=lambda: _fixture_crawler(ttl_seconds=0))
+    rows = len(hitter_2025) + len(pitcher_2025)
+    recorder.results['crawl/cold'].update(rows=rows, rows_per_second=round(rows / recorder.results['crawl/cold']['seconds'], 1))
+
+    # 같은 캐시로 한 번 받아 둔 뒤 캐시 적중 경로 측정
+    _fixture_crawler(ttl_seconds=3600)
+    with contextlib.redirect_stdout(io.StringIO()):
+        crawl_both()
+    recorder.measure('crawl/cached', crawl_both, rows=rows)
+
+    historical = recorder.measure('load_historical_data', crawler.load_historical_data,
+                                  setup=historical_store._load_columns.cache_clear)
+    return hitter_2025, pitcher_2025, historical
+
+
+def bench_scale(recorder, factor, hitter_2025, pitcher_2025, historical):
+    """factor배로 늘린 선수 기록으로 처리/예측/DB 저장 단계 측정"""
+    prefix = f'x{factor}'
+    hitter_his, pitcher_his = (scale_frame(df, factor) for df in historical)
+    hitter_2025, pitcher_2025 = scale_frame(hitter_2025, factor), scale_frame(pitcher_2025, factor)
+
+    all_hitter_data = recorder.measure(
+        f'{prefix}/process_hitter_data', lambda: data_processor.process_hitter_data(hitter_2025, hitter_his),
+        rows=len(hitter_2025) + len(hitter_his), setup=_fresh_training_state)
+    all_pitcher_data = recorder.measure(
+        f'{prefix}/process_pitcher_data', lambda: data_processor.process_pitcher_data(pitcher_2025, pitcher_his),
+        rows=len(pitcher_2025) + len(pitcher_his), setup=_fresh_training_state)
+
+    win_probability_df, rankings_df = recorder.measure(
+        f'{prefix}/generate_win_probability_df',
+        lambda: predictor.generate_win_probability_df(all_hitter_data, all_pitcher_data),
+        rows=len(all_hitter_data) + len(all_pitcher_data))
+
+    recorder.measure(f'{prefix}/save_hitter_data', lambda: db_utils.save_hitter_data(all_hitter_data),
+                     rows=len(all_hitter_data))
+    recorder.measure(f'{prefix}/save_pitcher_data', lambda: db_utils.save_pitcher_data(all_pitcher_data),
+                     rows=len(all_pitcher_data))
+    recorder.measure(f'{prefix}/save_win_probabilities', lambda: db_utils.save_win_probabilities(win_probability_df),
+                     rows=win_probability_df.size)
+    recorder.measure(f'{prefix}/save_team_rankings', lambda: db_utils.save_team_rankings(rankings_df.copy()),
+                     rows=len(rankings_df))
+    return all_hitter_data, all_pitcher_data
+
+
+def bench_api(recorder, all_hitter_data, all_pitcher_data, n_requests):
+    """Flask 테스트 클라이언트로 엔드포인트별 처리량 측정 (스냅샷은 미리 적재)"""
+    import app as api
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        matrix, rankings_df = predictor.generate_win_probability_matrix(all_hitter_data, all_pitcher_data)
+    predictor._swap_snapshot(api.cached_data, {
+        'hitter_data': all_hitter_data,
+        'pitcher_data': all_pitcher_data,
+        'win_probability_matrix': matrix,
+        'win_probability_df': matrix.to_frame(),
+        'predicted_team_rankings_df': rankings_df,
+        'prediction_date': None,
+        'last_update': datetime.datetime.now(),
+    })
+
+    client = api.app.test_client()
+    teams = list(matrix.teams)
+    matchups = [{'team1': a, 'team2': b} for a in teams for b in teams if a != b]
+    calls = {
+        'api/predict_win_probability': lambda: client.post('/predict_win_probability',
+                                                           json={'team1': teams[0], 'team2': teams[1]}),
+        'api/predict_win_probabilities': lambda: client.post('/predict_win_probabilities', json={'matchups': matchups}),
+        'api/predict_team_rankings': lambda: client.get('/predict_team_rankings'),
+        'api/predict_team_rankings_gzip': lambda: client.get('/predict_team_rankings',
+                                                             headers={'Accept-Encoding': 'gzip'}),
+    }
+    for name, call in calls.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            status = call().status_code
+        if status != 200:
+            raise RuntimeError(f"{name} 응답 코드 {status}")
+        recorder.measure(name, lambda: [call() for _ in range(n_requests)], rows=n_requests,
+                         track_memory=False, unit='requests')
+
+
+def bench_season_simulation(recorder, all_hitter_data, all_pitcher_data, n_seasons):
+    """정규시즌 전체 일정(팀 간 16경기, 홈/원정 8경기씩)을 시즌 수별로 시뮬레이션 (한 프로세스)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        matrix, _ = predictor.generate_win_probability_matrix(all_hitter_data, all_pitcher_data)
+    schedule = pd.DataFrame([(away, home) for away in matrix.teams for home in matrix.teams if away != home] * 8,
+                            columns=['away', 'home'])
+    for seasons in n_seasons:
+        recorder.measure(f'simulate/{seasons}_seasons',
+                         lambda: season_simulator.simulate_season(matrix, schedule, n_seasons=seasons, seed=0,
+                                                                  processes=1),
+                         rows=seasons, unit='seasons')
+
+
+def compare(results, baseline, tolerance):
+    """baseline 대비 느려지거나 메모리가 늘어난 항목 목록"""
+    regressions = []
+    for name, record in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if record['seconds'] > base['seconds'] * (1 + tolerance) \
+                and record['seconds'] - base['seconds'] > MIN_REGRESSION_SECONDS:
+            regressions.append(f"{name}: {base['seconds']}s → {record['seconds']}s")
+        if 'peak_mb' in record and 'peak_mb' in base and record['peak_mb'] > base['peak_mb'] * (1 + tolerance) \
+                and record['peak_mb'] - base['peak_mb'] > MIN_REGRESSION_MB:
+            regressions.append(f"{name}: {base['peak_mb']}MB → {record['peak_mb']}MB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 예측 파이프라인/API 벤치마크')
+    parser.add_argument('--scales', default='1,10,100', help='선수 기록 배수 목록 (기본: 1,10,100)')
+    # 한 번만 재면 측정 잡음이 허용 범위를 넘을 수 있어 기본은 세 번 중 최소 시간
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수 (최소 시간 기록)')
+    parser.add_argument('--api-requests', type=int, default=2000, help='엔드포인트별 요청 수')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='비교할 기준 결과 JSON')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준 결과로 저장')
+    parser.add_argument('--no-compare', action='store_true', help='기준 결과와 비교하지 않음')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 비율 (0.25 = 25%%까지 허용)')
+    parser.add_argument('--seasons', default='10000,100000', help='시즌 시뮬레이션 횟수 목록 (기본: 10000,100000)')
+    parser.add_argument('--verbose', action='store_true', help='파이프라인 로그 출력')
+    args = parser.parse_args(argv)
+
+    recorder = Recorder(repeat=args.repeat, verbose=args.verbose)
+    try:
+        hitter_2025, pitcher_2025, historical = bench_crawl(recorder)
+        processed = None
+        for factor in [int(scale) for scale in args.scales.split(',')]:
+            result = bench_scale(recorder, factor, hitter_2025, pitcher_2025, historical)
+            if factor == 1:
+                processed = result
+        if processed is not None:
+            bench_api(recorder, *processed, n_requests=args.api_requests)
+            bench_season_simulation(recorder, *processed, n_seasons=[int(n) for n in args.seasons.split(',')])
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    report = {
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        # 커밋되는 기준 결과에 실행한 사람의 절대 경로가 남지 않도록 저장소 기준 상대 경로로 기록
+        'args': dict(vars(args), baseline=os.path.relpath(args.baseline, os.path.dirname(BENCHMARK_DIR))),
+        'results': recorder.results,
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, 'latest.json'), 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 기준 결과 저장: {args.baseline}")
+        return 0
+
+    if args.no_compare:
+        return 0
+    if not os.path.exists(args.baseline):
+        # 비교 없이 0으로 끝나면 회귀를 놓치므로 실패로 처리
+        print(f"❌ 기준 결과가 없습니다 ({args.baseline}). --save-baseline으로 생성하거나 --no-compare로 실행하세요.")
+        return 2
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    regressions = compare(recorder.results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ 성능 회귀 {len(regressions)}건 (허용: +{args.tolerance:.0%})")
+        for line in regressions:
+            print(f"   - {line}")
+        return 1
+    print(f"✅ 기준 결과 대비 회귀 없음 (허용: +{args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
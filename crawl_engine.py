@@ -0,0 +1,243 @@
+# crawl_engine.py
+# KBO 기록 페이지 크롤링 엔진
+# - 모든 페이지(페이저 postback)와 Basic1/Basic2 탭, 여러 시즌을 순회
+# - 연결을 재사용하는 requests.Session (커넥션 풀 + 재시도/백오프)
+# - 호스트별 요청 간격 제한과 동시 작업 수 제한
+# - 모든 요청은 page_cache를 거치므로 캐시된 페이지는 네트워크 요청 없이 재사용됩니다.
+import datetime
+import json
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from instrumentation import span, traced
+import schema_registry
+from page_cache import PageCache
+from table_extract import extract_record_page
+
+BASE_URL = 'https://www.koreabaseball.com/Record/Player'
+
+# 선수 유형별 기록 페이지 경로
+RECORD_PAGES = {
+    'hitter': 'HitterBasic',
+    'pitcher': 'PitcherBasic',
+}
+
+# 월별 경기 일정 조회 API (JSON)
+SCHEDULE_URL = 'https://www.koreabaseball.com/ws/Schedule.asmx/GetScheduleList'
+
+# 헤더 추가 (403 에러 방지)
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
+}
+
+# 파싱 결과 캐시 키. _parse_record_page의 출력 형식이나 RECORD_TABLE_SCHEMAS가 바뀌면 버전을 올려야 합니다.
+RECORD_PAGE_PARSER_KEY = 'record_page_v2'
+
+# 타입을 선언한 기록 테이블 (유형, 탭) -> 스키마. 헤더가 다르면 TableSchemaError, 선언되지 않은 테이블은 문자열 그대로
+RECORD_TABLE_SCHEMAS = {(kind, 'Basic1'): schema_registry.record_table_schema(kind) for kind in RECORD_PAGES}
+
+# 한 테이블에서 따라갈 최대 페이지 수 (페이저 파싱이 잘못되었을 때 무한 반복 방지)
+MAX_PAGES_PER_TABLE = 100
+
+# 일정 파싱 결과 캐시 키. _parse_schedule의 출력 형식이 바뀌면 버전을 올려야 합니다.
+SCHEDULE_PARSER_KEY = 'schedule_v1'
+
+_POSTBACK_TARGET = re.compile(r"__doPostBack\('([^']+)'")
+
+# 크롤링한 페이지는 디스크에 캐시되어 일일 작업과 웹 앱이 재사용합니다 (KBO_CRAWLER_OFFLINE=1이면 캐시만 재생).
+page_cache = PageCache()
+
+
+@traced('html_parse', rows_out=lambda page: len(page['table']))
+def _parse_record_page(html, schema=None):
+    """기록 페이지 HTML에서 테이블(스키마가 있으면 타입 변환된 DataFrame)과 postback에 필요한 폼 상태를 추출"""
+    table, hidden, selects, anchors = extract_record_page(html, schema)
+
+    # 페이저: 숫자 버튼은 페이지 번호, 그 외(다음 묶음 등)는 이름으로 저장
+    pager = {}
+    current_page = 1
+    for href, label, classes in anchors:
+        match = _POSTBACK_TARGET.search(href)
+        if label.isdigit() and 'on' in classes:
+            current_page = int(label)
+        if match:
+            key = int(label) if label.isdigit() else match.group(1).rsplit('$', 1)[-1]
+            pager[key] = match.group(1)
+
+    return {
+        'table': table,
+        'hidden': hidden,
+        'selects': selects,
+        'pager': pager,
+        'current_page': current_page,
+    }
+
+
+def _parse_schedule(text, season):
+    """일정 API 응답(JSON)에서 경기 목록 DataFrame(date, time, away, home) 추출"""
+    games = []
+    game_date = None
+    for row in json.loads(text).get('rows', []):
+        cells = {cell.get('Class'): cell.get('Text', '') for cell in row.get('row', [])}
+        # 날짜 칸은 그날 첫 경기 행에만 있고(RowSpan), 나머지 행은 앞의 날짜를 이어서 사용
+        if cells.get('day'):
+            month, day = re.match(r'(\d+)\.(\d+)', BeautifulSoup(cells['day'], 'html.parser').get_text()).groups()
+            game_date = datetime.date(int(season), int(month), int(day))
+        if not cells.get('play') or game_date is None:
+            continue
+
+        # 'play' 칸: <span>원정</span><em>점수/vs</em><span>홈</span>
+        teams = BeautifulSoup(cells['play'], 'html.parser').find_all('span', recursive=False)
+        if len(teams) < 2:
+            continue
+        games.append({
+            'date': game_date.isoformat(),
+            'time': BeautifulSoup(cells.get('time', ''), 'html.parser').get_text(strip=True),
+            'away': teams[0].get_text(strip=True),
+            'home': teams[-1].get_text(strip=True),
+        })
+    return pd.DataFrame(games, columns=['date', 'time', 'away', 'home'])
+
+
+def _record_page_parser(kind, tab):
+    """(파싱 결과 캐시 키, 파서) - 같은 HTML이라도 적용하는 스키마가 다르면 다른 캐시 항목"""
+    schema = RECORD_TABLE_SCHEMAS.get((kind, tab))
+    key = f"{RECORD_PAGE_PARSER_KEY}-{kind}-{tab}" if schema is not None else RECORD_PAGE_PARSER_KEY
+    return key, lambda html: _parse_record_page(html, schema)
+
+
+class _HostRateLimiter:
+    """호스트별 최소 요청 간격을 지키도록 대기 (여러 스레드에서 공유)"""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_allowed = {}
+
+    def wait(self, host):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class _RateLimitedSession(requests.Session):
+    """실제 네트워크 요청에만 호스트별 요청 간격 제한을 적용하는 Session (캐시 적중 시에는 대기하지 않음)"""
+
+    def __init__(self, rate_limiter):
+        super().__init__()
+        self._rate_limiter = rate_limiter
+
+    def request(self, method, url, *args, **kwargs):
+        self._rate_limiter.wait(urllib.parse.urlsplit(url).netloc)
+        return super().request(method, url, *args, **kwargs)
+
+
+class KboCrawler:
+    """KBO 기록 테이블 크롤러. 테이블(유형, 탭, 시즌) 단위로 병렬 처리하고, 한 테이블의 페이지는 순서대로 따라갑니다."""
+
+    def __init__(self, max_workers=4, requests_per_second=4.0, retries=3, backoff_factor=0.5, cache=None):
+        self.max_workers = max_workers
+        self.cache = cache or page_cache
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,  # postback(POST)도 조회 요청이므로 재시도
+        )
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session = _RateLimitedSession(_HostRateLimiter(requests_per_second))
+        self.session.headers.update(HEADERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def crawl_table(self, kind, tab='Basic1', season=None, max_pages=None):
+        """한 기록 테이블의 모든 페이지를 합친 DataFrame 반환 (season=None이면 사이트 기본 시즌, max_pages로 페이지 수 제한)"""
+        url = f"{BASE_URL}/{RECORD_PAGES[kind]}/{tab}.aspx"
+        parse = _record_page_parser(kind, tab)
+        page = self._load(url, parse)
+
+        # 다른 시즌은 시즌 드롭다운 postback으로 1페이지를 다시 받아옵니다.
+        season_field = next((name for name in page['selects'] if name.endswith('ddlSeason$ddlSeason')), None)
+        if season is not None and season_field is not None and page['selects'][season_field] != str(season):
+            page = self._postback(url, parse, page, season_field, f"season={season}&page=1", {season_field: str(season)})
+
+        max_pages = min(max_pages or MAX_PAGES_PER_TABLE, MAX_PAGES_PER_TABLE)
+        tables = [page['table']]
+        while len(tables) < max_pages:
+            next_page = page['current_page'] + 1
+            target = page['pager'].get(next_page) or page['pager'].get('btnNext')
+            if target is None:
+                break
+            page = self._postback(url, parse, page, target, f"season={season}&page={next_page}")
+            # 마지막 페이지에서 '다음' 버튼이 같은 페이지를 돌려주면 종료
+            if page['current_page'] != next_page:
+                break
+            tables.append(page['table'])
+
+        with span('concat', rows_in=sum(len(table) for table in tables), kind=kind) as current:
+            df = pd.concat(tables, ignore_index=True)
+            current.rows_out = len(df)
+        print(f"✅ {kind}/{tab} {season or '기본'} 시즌: {len(tables)}페이지, {len(df)}행")
+        return df
+
+    def crawl_tables(self, kinds=('hitter', 'pitcher'), tabs=('Basic1', 'Basic2'), seasons=(None,), max_pages=None):
+        """(유형, 탭, 시즌) 조합을 동시에 크롤링하여 {(kind, tab, season): DataFrame} 반환"""
+        jobs = [(kind, tab, season) for kind in kinds for tab in tabs for season in seasons]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {job: executor.submit(self.crawl_table, *job, max_pages=max_pages) for job in jobs}
+            return {job: future.result() for job, future in futures.items()}
+
+    def crawl_season_stats(self, kind, seasons, tabs=('Basic1', 'Basic2'), max_pages=None):
+        """유형별로 여러 시즌의 Basic1/Basic2 기록을 선수 단위로 합치고 '연도' 컬럼을 붙여 반환"""
+        tables = self.crawl_tables(kinds=(kind,), tabs=tabs, seasons=seasons, max_pages=max_pages)
+
+        frames = []
+        for season in seasons:
+            merged = None
+            for tab in tabs:
+                df = tables[(kind, tab, season)].drop(columns=['순위'], errors='ignore')
+                if merged is None:
+                    merged = df
+                else:
+                    # 두 탭에 모두 있는 기록(AVG 등)은 첫 번째 탭 값을 사용
+                    extra = [c for c in df.columns if c not in merged.columns]
+                    merged = merged.merge(df[['선수명', '팀명'] + extra], on=['선수명', '팀명'], how='left')
+            merged['연도'] = season
+            frames.append(merged)
+        return pd.concat(frames, ignore_index=True)
+
+    def crawl_schedule(self, season, month):
+        """한 달의 정규시즌 경기 일정 DataFrame(date, time, away, home) 반환"""
+        data = {'leId': '1', 'srIdList': '0,9,6', 'seasonId': str(season), 'gameMonth': f"{int(month):02d}", 'teamId': ''}
+        page = self.cache.fetch(SCHEDULE_URL, session=self.session, method='POST', data=data,
+                                variant=f"season={season}&month={int(month)}")
+        return self.cache.load_table(page, f"{SCHEDULE_PARSER_KEY}-{season}",
+                                     lambda text: _parse_schedule(text, season))
+
+    def _load(self, url, parse):
+        page = self.cache.fetch(url, session=self.session)
+        return self.cache.load_table(page, *parse)
+
+    def _postback(self, url, parse, page, target, variant, overrides=None):
+        data = dict(page['hidden'])
+        data.update(page['selects'])
+        data.update(overrides or {})
+        data['__EVENTTARGET'] = target
+        data['__EVENTARGUMENT'] = ''
+        response = self.cache.fetch(url, session=self.session, method='POST', data=data, variant=variant)
+        return self.cache.load_table(response, *parse)
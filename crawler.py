@@ -1,899 +1,52 @@
-from bs4 import BeautifulSoup
 import pandas as pd
-import io
 import datetime
-import requests
+import os
+from crawl_engine import KboCrawler
+import historical_store
+import schema_registry
 
-def crawl_hitter_data():
-    """타자 데이터 크롤링 (requests 사용)"""
-    url = 'https://www.koreabaseball.com/Record/Player/HitterBasic/Basic1.aspx'
-    
-    # 헤더 추가 (403 에러 방지)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
-    }
-    
-    # 페이지 요청
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()  # HTTP 에러 확인
-    
-    # HTML 파싱
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    # 테이블 추출
-    table = soup.select_one('div.record_result > table')
-    
-    # 헤더 처리
-    headers = [th.get_text(strip=True) for th in table.select('thead th')]
-    
-    # 행 데이터 처리
-    rows = []
-    for tr in table.select('tbody tr'):
-        row = [td.get_text(strip=True) for td in tr.select('td')]
-        rows.append(row)
-    
-    # DataFrame 생성
-    df = pd.DataFrame(rows, columns=headers)
-    df = df.set_index('순위')
-    df['연도'] = 2025
-    
-    return df
+# 커넥션 풀과 요청 간격 제한을 공유하는 크롤러 (페이지는 crawl_engine.page_cache에 캐시됨)
+kbo_crawler = KboCrawler()
 
-def crawl_pitcher_data():
-    """투수 데이터 크롤링 (requests 사용)"""
-    url = 'https://www.koreabaseball.com/Record/Player/PitcherBasic/Basic1.aspx'
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
-    }
-    
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    
-    soup = BeautifulSoup(response.text, 'html.parser')
-    table = soup.select_one('div.record_result > table')
-    
-    headers = [th.get_text(strip=True) for th in table.select('thead th')]
-    
-    rows = []
-    for tr in table.select('tbody tr'):
-        row = [td.get_text(strip=True) for td in tr.select('td')]
-        rows.append(row)
-    
-    df = pd.DataFrame(rows, columns=headers)
-    df = df.set_index('순위')
-    df['연도'] = 2025
-    
-    return df
+# 기본으로 크롤링할 기록 페이지 수 (0이면 모든 페이지)
+# 1이면 기존과 같이 첫 페이지(상위 선수)만 읽습니다. 뒤 페이지의 타석/이닝이 적은 선수는 '-' 기록이 많습니다.
+CRAWL_MAX_PAGES = int(os.getenv('KBO_CRAWL_MAX_PAGES', '1'))
 
 
+def crawl_hitter_data(max_pages=None):
+    """타자 데이터 크롤링 (Basic1 탭, 기본 CRAWL_MAX_PAGES페이지. max_pages=0이면 모든 페이지)"""
+    max_pages = CRAWL_MAX_PAGES if max_pages is None else max_pages
+    df = kbo_crawler.crawl_table('hitter', 'Basic1', max_pages=max_pages)
+    df = df.set_index('순위')
+    df['연도'] = 2025
 
-def load_historical_data():
-    """역대 데이터 로드"""
-    # 타자 역대 데이터
-    hitter_historical_data = """
-전민재	롯데	0.4	18	58	50	7	20	5	0	0	25	4	4	0	2025
-손아섭	NC	0.389	16	60	54	9	21	2	2	0	27	10	0	1	2025
-강민호	삼성	0.371	17	69	62	7	23	7	0	0	30	13	0	0	2025
-김현수	LG	0.362	17	54	47	7	17	3	0	1	23	9	0	0	2025
-문보경	LG	0.349	17	75	63	15	22	3	0	4	37	18	0	2	2025
-카디네스	키움	0.333	13	58	45	7	15	1	0	3	25	16	0	2	2025
-박동원	LG	0.327	17	60	49	12	16	3	0	3	28	11	0	0	2025
-최형우	KIA	0.321	15	62	56	9	18	7	0	2	31	7	0	0	2025
-이주형	키움	0.316	16	68	57	8	18	3	0	2	27	6	0	0	2025
-에레디아	SSG	0.313	13	57	48	6	15	0	0	1	18	6	0	1	2025
-김민혁	KT	0.31	16	64	58	7	18	3	0	0	21	4	0	0	2025
-류지혁	삼성	0.309	18	68	55	9	17	0	0	0	17	10	1	2	2025
-레이예스	롯데	0.307	19	83	75	6	23	6	0	0	29	13	0	3	2025
-오스틴	LG	0.306	17	73	62	17	19	4	0	5	38	14	0	1	2025
-오지환	LG	0.302	17	60	53	9	16	4	0	2	26	11	2	2	2025
-김태연	한화	0.3	19	78	70	11	21	1	0	1	25	7	1	0	2025
-최주환	키움	0.297	17	72	64	6	19	7	1	1	31	12	0	1	2025
-정수빈	두산	0.294	19	82	68	14	20	3	0	0	23	3	2	1	2025
-김영웅	삼성	0.292	18	78	72	8	21	2	0	3	32	14	0	2	2025
-박민우	NC	0.289	13	51	45	6	13	4	1	0	19	3	0	0	2025
-양의지	두산	0.286	19	77	63	10	18	4	0	2	28	14	0	2	2025
-양석환	두산	0.284	18	76	67	7	19	2	0	3	30	11	0	3	2025
-최지훈	SSG	0.283	15	68	60	8	17	1	0	1	21	7	1	2	2025
-허경민	KT	0.281	16	72	64	5	18	0	0	1	21	5	0	1	2025
-데이비슨	NC	0.281	16	65	57	9	16	4	0	4	32	14	0	3	2025
-권희동	NC	0.273	16	64	44	10	12	0	0	1	15	3	0	0	2025
-나성범	KIA	0.271	17	73	59	12	16	3	0	4	31	13	0	0	2025
-위즈덤	KIA	0.268	17	71	56	16	15	1	0	7	37	13	0	1	2025
-김상수	KT	0.267	15	59	45	7	12	2	0	1	17	3	0	0	2025
-홍창기	LG	0.265	14	64	49	9	13	1	0	0	14	7	1	1	2025
-김민성	롯데	0.264	14	60	53	7	14	1	0	1	18	11	0	0	2025
-박성한	SSG	0.261	14	60	46	6	12	3	0	1	18	8	1	0	2025
-이지영	SSG	0.261	15	52	46	4	12	3	0	1	18	3	2	1	2025
-배정대	KT	0.259	17	66	58	4	15	3	1	1	23	8	2	2	2025
-디아즈	삼성	0.257	18	75	70	8	18	4	0	4	34	12	0	1	2025
-신민재	LG	0.255	17	61	51	10	13	1	0	0	14	9	0	0	2025
-이재현	삼성	0.254	18	80	63	18	16	4	0	3	29	11	1	0	2025
-강승호	두산	0.253	19	83	75	10	19	5	1	1	29	6	0	0	2025
-이우성	KIA	0.25	16	63	56	3	14	6	0	1	23	7	0	0	2025
-김형준	NC	0.244	16	51	45	7	11	3	0	4	26	11	1	1	2025
-강백호	KT	0.243	17	77	70	6	17	5	0	2	28	8	0	0	2025
-채은성	한화	0.242	19	72	66	2	16	5	0	0	21	2	0	0	2025
-송찬의	LG	0.24	16	56	50	4	12	4	0	2	22	7	1	0	2025
-한유섬	SSG	0.24	15	56	50	5	12	0	0	1	15	7	1	0	2025
-플로리얼	한화	0.24	19	84	75	8	18	6	1	1	29	13	0	1	2025
-송성문	키움	0.239	19	81	71	14	17	5	0	3	31	9	0	0	2025
-푸이그	키움	0.234	19	86	77	12	18	2	0	3	29	11	0	0	2025
-나승엽	롯데	0.231	19	79	65	7	15	4	1	3	30	7	0	0	2025
-노시환	한화	0.23	19	80	74	9	17	2	0	3	28	10	0	0	2025
-고명준	SSG	0.229	15	54	48	2	11	1	0	1	15	5	0	1	2025
-전준우	롯데	0.227	18	73	66	2	15	3	0	0	18	9	0	2	2025
-김휘집	NC	0.222	15	52	45	6	10	1	0	3	20	8	0	0	2025
-김주원	NC	0.217	16	72	60	12	13	2	0	2	21	9	1	1	2025
-황영묵	한화	0.214	16	65	56	10	12	5	0	0	17	3	1	0	2025
-최원준	KIA	0.211	17	63	57	7	12	1	0	1	16	1	0	0	2025
-로하스	KT	0.21	17	77	62	10	13	3	0	1	19	4	0	1	2025
-김재환	두산	0.2	15	61	55	7	11	2	0	1	16	6	0	0	2025
-구자욱	삼성	0.197	18	81	71	14	14	4	0	4	30	14	1	1	2025
-박해민	LG	0.196	17	57	46	10	9	2	0	0	11	0	1	0	2025
-장성우	KT	0.185	16	63	54	5	10	2	0	1	15	10	0	2	2025
-박병호	삼성	0.175	18	73	63	10	11	2	0	5	28	12	0	0	2025
-정준재	SSG	0.17	14	57	47	9	8	1	1	0	11	3	2	0	2025
-에레디아	SSG	0.36	136	591	541	82	195	31	1	21	291	118	0	9	2024
-레이예스	롯데	0.352	144	632	574	88	202	40	3	15	293	111	0	11	2024
-김도영	KIA	0.347	141	625	544	143	189	29	10	38	352	109	1	7	2024
-구자욱	삼성	0.343	129	568	493	92	169	39	1	33	309	115	2	6	2024
-송성문	키움	0.34	142	602	527	88	179	29	4	19	273	104	0	8	2024
-홍창기	LG	0.336	139	637	524	96	176	18	3	5	215	73	1	4	2024
-로하스	KT	0.329	144	670	572	108	188	39	1	32	325	112	0	4	2024
-김선빈	KIA	0.329	116	466	423	48	139	23	0	9	189	57	7	0	2024
-박민우	NC	0.328	121	528	457	75	150	26	2	8	204	50	4	4	2024
-김혜성	키움	0.326	127	567	509	90	166	26	4	11	233	75	0	7	2024
-오스틴	LG	0.319	140	604	527	99	168	32	3	32	302	132	0	13	2024
-김지찬	삼성	0.316	135	535	453	102	143	16	3	3	174	36	12	1	2024
-양의지	두산	0.314	119	485	430	57	135	18	1	17	206	94	0	6	2024
-나승엽	롯데	0.312	121	489	407	59	127	35	4	7	191	66	2	7	2024
-소크라테스	KIA	0.31	140	602	552	92	171	30	3	26	285	97	0	5	2024
-허경민	두산	0.309	115	477	417	69	129	28	0	7	178	61	0	6	2024
-고승민	롯데	0.308	120	532	481	79	148	27	6	14	229	87	1	8	2024
-박찬호	KIA	0.307	134	577	515	86	158	24	1	5	199	61	7	6	2024
-데이비슨	NC	0.306	131	567	504	90	154	25	1	46	319	119	0	7	2024
-강민호	삼성	0.303	136	452	403	48	122	19	1	19	200	77	0	6	2024
-박성한	SSG	0.301	137	564	489	78	147	24	0	10	201	67	3	6	2024
-문보경	LG	0.301	144	602	519	80	156	35	3	22	263	101	3	13	2024
-권희동	NC	0.3	123	511	416	66	125	22	1	13	188	77	2	6	2024
-안치홍	한화	0.3	128	533	473	64	142	21	0	13	202	66	1	4	2024
-신민재	LG	0.297	128	474	387	78	115	11	6	0	138	40	15	3	2024
-김현수	LG	0.294	137	583	517	61	152	36	2	8	216	69	1	9	2024
-윤동희	롯데	0.293	141	613	532	97	156	35	4	14	241	85	2	5	2024
-전준우	롯데	0.293	109	483	423	57	124	26	2	17	205	82	1	5	2024
-최원준	KIA	0.292	136	508	438	75	128	23	3	9	184	56	7	5	2024
-최정	SSG	0.291	129	550	468	93	136	27	2	37	278	107	0	7	2024
-김태연	한화	0.291	126	472	413	59	120	24	0	12	180	61	6	4	2024
-강백호	KT	0.289	144	614	550	92	159	27	0	26	264	96	0	2	2024
-이우성	KIA	0.288	112	449	399	56	115	16	1	9	160	54	0	3	2024
-서호철	NC	0.285	141	567	512	68	146	19	3	10	201	61	6	3	2024
-정수빈	두산	0.284	136	608	510	95	145	21	3	4	184	47	10	8	2024
-김재환	두산	0.283	136	552	474	78	134	28	0	29	249	92	0	9	2024
-강승호	두산	0.28	140	566	521	81	146	34	7	18	248	81	2	4	2024
-최형우	KIA	0.28	116	487	425	67	119	23	2	22	212	109	0	5	2024
-최지훈	SSG	0.275	125	543	483	89	133	22	7	11	202	49	6	2	2024
-배정대	KT	0.275	113	473	404	49	111	25	1	7	159	59	8	7	2024
-페라자	한화	0.275	122	522	455	75	125	24	0	24	221	70	0	2	2024
-박동원	LG	0.272	130	498	434	58	118	22	0	20	200	80	2	7	2024
-노시환	한화	0.272	136	601	526	88	143	20	2	24	239	89	0	4	2024
-채은성	한화	0.271	124	498	436	61	118	24	0	20	202	83	0	5	2024
-장성우	KT	0.268	131	489	418	53	112	19	0	19	188	81	2	8	2024
-이주형	키움	0.266	115	537	473	82	126	19	3	13	190	60	0	1	2024
-박해민	LG	0.263	144	553	482	72	127	16	6	6	173	56	5	9	2024
-박승욱	롯데	0.262	139	468	405	57	106	19	1	7	148	53	3	3	2024
-이재현	삼성	0.26	109	458	389	71	101	18	1	14	163	66	0	3	2024
-황재균	KT	0.26	137	536	493	60	128	22	0	13	189	58	5	2	2024
-김휘집	NC	0.258	140	562	488	78	126	24	1	16	200	73	4	8	2024
-최주환	키움	0.257	130	544	482	49	124	23	1	13	188	84	0	9	2024
-김영웅	삼성	0.252	126	509	456	65	115	16	3	28	221	79	1	4	2024
-김주원	NC	0.252	134	475	385	61	97	18	2	9	146	49	9	5	2024
-양석환	두산	0.246	142	593	533	83	131	25	1	34	260	107	1	3	2024
-한유섬	SSG	0.235	132	523	464	64	109	29	0	24	210	87	1	3	2024
-손아섭	NC	0.339	140	609	551	97	187	36	3	5	244	65	1	5	2023
-구자욱	삼성	0.336	119	515	453	65	152	37	1	11	224	71	2	3	2023
-김혜성	키움	0.335	137	621	556	104	186	29	6	7	248	57	0	5	2023
-홍창기	LG	0.332	141	643	524	109	174	35	2	1	216	65	3	6	2023
-에레디아	SSG	0.323	122	523	473	76	153	29	0	12	218	76	1	1	2023
-김선빈	KIA	0.32	119	473	419	41	134	16	0	0	150	48	8	3	2023
-박건우	NC	0.319	130	533	458	70	146	34	2	12	220	85	1	9	2023
-박민우	NC	0.316	124	509	452	76	143	20	7	2	183	46	5	3	2023
-오스틴	LG	0.313	139	583	520	87	163	29	4	23	269	95	0	7	2023
-전준우	롯데	0.312	138	559	493	80	154	21	3	17	232	77	0	7	2023
-양의지	두산	0.305	129	510	439	56	134	23	0	17	208	68	0	3	2023
-최형우	KIA	0.302	121	508	431	64	130	27	1	17	210	81	0	4	2023
-박찬호	KIA	0.301	130	507	452	73	136	18	4	3	171	52	7	6	2023
-문보경	LG	0.301	131	542	469	77	141	29	5	10	210	72	9	4	2023
-노시환	한화	0.298	131	595	514	85	153	30	1	31	278	101	0	3	2023
-최정	SSG	0.297	128	552	471	94	140	31	0	29	258	87	1	6	2023
-김민혁	KT	0.297	113	448	397	68	118	20	3	3	153	41	7	5	2023
-황재균	KT	0.295	109	457	407	62	120	26	2	6	168	49	3	1	2023
-문성주	LG	0.294	136	534	449	77	132	21	4	2	167	57	6	4	2023
-김현수	LG	0.293	133	556	488	53	143	22	2	6	187	88	1	8	2023
-안치홍	롯데	0.292	121	494	425	57	124	20	1	8	170	63	5	5	2023
-강민호	삼성	0.29	125	495	434	60	126	19	0	16	193	77	1	5	2023
-알포드	KT	0.289	133	547	491	83	142	31	3	15	224	70	0	3	2023
-장성우	KT	0.288	131	464	410	37	118	22	0	11	173	65	3	7	2023
-정수빈	두산	0.287	137	583	498	75	143	14	11	2	185	33	12	2	2023
-피렐라	삼성	0.285	139	605	557	66	159	28	1	16	237	80	0	2	2023
-소크라테스	KIA	0.285	142	608	547	91	156	31	3	20	253	96	0	8	2023
-박해민	LG	0.285	144	558	485	80	138	14	2	6	174	59	24	1	2023
-박병호	KT	0.283	132	493	431	53	122	15	0	18	191	87	0	8	2023
-마틴	NC	0.283	118	503	435	55	123	20	2	17	198	90	0	10	2023
-양석환	두산	0.281	140	582	524	73	147	28	0	21	238	89	0	11	2023
-김현준	삼성	0.275	109	479	433	62	119	10	6	3	150	46	8	3	2023
-김상수	KT	0.271	129	512	443	58	120	19	1	3	150	56	8	3	2023
-최지훈	SSG	0.268	117	503	462	65	124	19	8	2	165	30	8	1	2023
-류지혁	삼성	0.268	132	522	455	63	122	11	1	2	141	45	10	5	2023
-허경민	두산	0.268	130	475	429	44	115	23	1	7	161	48	0	5	2023
-오지환	LG	0.268	126	502	422	65	113	24	3	8	167	62	4	4	2023
-문현빈	한화	0.266	137	481	428	47	114	22	2	5	155	49	9	5	2023
-박성한	SSG	0.266	128	529	459	53	122	19	0	9	168	47	7	4	2023
-강승호	두산	0.265	127	459	419	51	111	18	6	7	162	59	4	3	2023
-채은성	한화	0.263	137	596	521	71	137	17	0	23	223	84	0	3	2023
-김민석	롯데	0.255	129	454	400	53	102	24	0	3	135	39	12	5	2023
-추신수	SSG	0.254	112	462	382	65	97	17	1	12	152	41	0	2	2023
-로하스	두산	0.253	122	464	403	52	102	24	4	19	191	65	0	3	2023
-박동원	LG	0.249	130	481	409	54	102	17	1	20	181	75	8	8	2023
-이재현	삼성	0.249	143	538	458	61	114	19	2	12	173	60	16	6	2023
-최주환	SSG	0.235	134	478	426	48	100	24	0	20	184	63	1	3	2023
-김주원	NC	0.233	127	474	403	56	94	9	2	10	137	54	8	4	2023
-정은원	한화	0.222	122	459	388	50	86	12	0	2	104	30	5	1	2023
-김재환	두산	0.22	132	484	405	40	89	15	0	10	134	46	0	2	2023
-이정후	키움	0.349	142	627	553	85	193	36	10	23	318	113	0	3	2022
-피렐라	삼성	0.342	141	630	561	102	192	33	4	28	317	109	0	2	2022
-박건우	NC	0.336	111	463	408	52	137	18	1	10	187	61	0	3	2022
-이대호	롯데	0.331	142	591	540	53	179	23	0	23	271	101	0	6	2022
-나성범	KIA	0.32	144	649	563	92	180	39	2	21	286	97	0	5	2022
-김혜성	키움	0.318	129	566	516	81	164	18	7	4	208	48	0	3	2022
-문보경	LG	0.315	126	466	406	52	128	22	3	9	183	56	5	7	2022
-소크라테스	KIA	0.311	127	554	514	83	160	29	7	17	254	77	0	4	2022
-페르난데스	두산	0.309	139	550	508	52	157	28	0	6	203	77	0	5	2022
-조용호	KT	0.308	131	531	474	52	146	18	4	3	181	44	2	3	2022
-한동희	롯데	0.307	129	499	456	43	140	27	0	14	209	65	0	4	2022
-전준우	롯데	0.304	120	517	470	73	143	31	1	11	209	68	0	9	2022
-최지훈	SSG	0.304	144	640	569	93	173	32	4	10	243	61	13	4	2022
-박성한	SSG	0.298	140	564	494	68	147	24	4	2	185	56	6	2	2022
-마티니	NC	0.296	139	576	510	67	151	34	1	16	235	85	0	7	2022
-채은성	LG	0.296	126	526	467	48	138	26	2	12	204	83	0	11	2022
-박해민	LG	0.289	144	636	570	97	165	20	8	3	210	49	7	6	2022
-허경민	두산	0.289	121	493	432	59	125	23	0	8	172	60	2	7	2022
-터크먼	한화	0.289	144	648	575	88	166	37	4	12	247	43	0	2	2022
-김선빈	KIA	0.287	140	587	505	51	145	23	0	3	177	61	7	3	2022
-김현수	LG	0.286	141	604	524	78	150	25	2	23	248	106	0	3	2022
-홍창기	LG	0.286	118	525	437	76	125	19	4	1	155	51	5	5	2022
-안치홍	롯데	0.284	132	562	493	71	140	27	3	14	215	58	8	5	2022
-양의지	NC	0.283	130	510	427	61	121	24	0	20	205	94	0	10	2022
-노시환	한화	0.281	115	490	434	55	122	24	1	6	166	59	0	4	2022
-노진혁	NC	0.28	115	451	396	50	111	24	0	15	180	75	3	5	2022
-손아섭	NC	0.277	138	617	548	72	152	29	4	4	201	48	1	6	2022
-푸이그	키움	0.277	126	547	473	65	131	30	0	21	224	73	0	4	2022
-박병호	KT	0.275	124	487	429	72	118	17	0	35	240	98	0	6	2022
-류지혁	KIA	0.274	127	477	405	55	111	19	2	2	140	48	8	2	2022
-정은원	한화	0.274	140	601	508	67	139	20	2	8	187	49	4	3	2022
-박찬호	KIA	0.272	130	566	493	81	134	22	0	4	168	45	8	7	2022
-오지환	LG	0.269	142	569	494	75	133	16	4	25	232	87	3	3	2022
-오재일	삼성	0.268	135	536	470	57	126	42	0	21	231	94	0	7	2022
-이지영	키움	0.267	137	450	420	38	112	13	4	2	139	37	8	0	2022
-박민우	NC	0.267	104	451	390	61	104	22	1	4	140	38	6	3	2022
-배정대	KT	0.266	144	575	508	64	135	24	2	6	181	56	5	4	2022
-최정	SSG	0.266	121	505	414	80	110	21	0	26	209	87	0	6	2022
-최형우	KIA	0.264	132	530	454	55	120	27	1	14	191	71	0	2	2022
-한유섬	SSG	0.264	135	545	458	62	121	33	1	21	219	100	0	5	2022
-강승호	두산	0.264	134	487	444	54	117	28	1	10	177	62	6	5	2022
-황재균	KT	0.262	141	581	519	59	136	25	3	10	197	64	2	2	2022
-정수빈	두산	0.259	127	455	405	58	105	12	4	3	134	41	6	4	2022
-추신수	SSG	0.259	112	499	409	77	106	20	1	16	176	58	2	4	2022
-하주석	한화	0.258	125	483	445	50	115	18	2	5	152	58	1	3	2022
-황대인	KIA	0.256	129	524	476	40	122	27	0	14	191	91	0	5	2022
-유강남	LG	0.255	139	469	416	54	106	16	0	8	146	47	6	2	2022
-김재환	두산	0.248	128	517	448	64	111	24	1	23	206	72	0	4	2022
-송성문	키움	0.247	142	601	547	67	135	21	4	13	203	79	1	7	2022
-양석환	두산	0.244	107	446	405	58	99	14	1	20	175	51	0	2	2022
-박동원	KIA	0.242	123	447	385	52	93	21	0	18	168	57	7	1	2022
-김태연	한화	0.24	119	464	404	46	97	18	0	7	136	53	3	4	2022
-심우준	KT	0.24	132	449	388	69	93	8	2	4	117	34	11	4	2022
-이정후	키움	0.36	123	544	464	78	167	42	6	7	242	84	0	9	2021
-전준우	롯데	0.348	144	619	552	88	192	46	0	7	259	92	1	8	2021
-강백호	KT	0.347	142	627	516	76	179	40	1	16	269	102	0	8	2021
-홍창기	LG	0.328	144	651	524	103	172	26	2	4	214	52	0	2	2021
-박건우	두산	0.325	126	525	458	82	149	31	2	6	202	63	0	6	2021
-양의지	NC	0.325	141	570	480	81	156	29	2	30	279	111	0	10	2021
-손아섭	롯데	0.319	139	610	542	88	173	29	2	3	215	58	3	1	2021
-페르난데스	두산	0.315	141	617	540	73	170	24	0	15	239	81	0	6	2021
-김선빈	KIA	0.307	130	564	501	55	154	32	0	5	201	67	1	5	2021
-안치홍	롯데	0.306	119	490	421	58	129	30	2	10	193	82	5	9	2021
-구자욱	삼성	0.306	139	610	543	107	166	30	10	22	282	88	1	12	2021
-김혜성	키움	0.304	144	635	559	99	170	20	3	3	205	66	0	10	2021
-박성한	SSG	0.302	135	471	407	53	123	21	1	4	158	44	12	2	2021
-이용규	키움	0.296	133	547	459	88	136	16	8	1	171	43	6	6	2021
-최원준	KIA	0.295	143	668	589	82	174	21	6	4	219	44	4	3	2021
-정훈	롯데	0.292	135	561	486	70	142	27	1	14	213	79	1	3	2021
-황재균	KT	0.291	117	507	453	74	132	16	2	10	182	56	1	4	2021
-박해민	삼성	0.291	127	542	454	78	132	22	1	5	171	54	9	7	2021
-강민호	삼성	0.291	123	462	406	55	118	22	0	18	194	67	0	7	2021
-이대호	롯데	0.286	114	465	420	39	120	11	0	19	188	81	0	6	2021
-피렐라	삼성	0.286	140	621	553	102	158	25	2	29	274	97	0	3	2021
-오재일	삼성	0.285	120	484	418	64	119	20	0	25	214	97	0	8	2021
-김현수	LG	0.285	140	595	506	70	144	23	1	17	220	96	0	9	2021
-정은원	한화	0.283	139	608	495	85	140	22	5	6	190	39	4	3	2021
-나성범	NC	0.281	144	623	570	96	160	29	1	33	290	101	0	4	2021
-마차도	롯데	0.279	134	539	466	83	130	21	1	5	168	58	4	7	2021
-한유섬	SSG	0.278	135	519	442	71	123	18	1	31	236	95	1	6	2021
-허경민	두산	0.278	136	518	468	61	130	24	1	5	171	59	3	3	2021
-최정	SSG	0.278	134	555	436	92	121	17	1	35	245	100	1	12	2021
-채은성	LG	0.276	110	448	387	59	107	20	0	16	175	82	0	7	2021
-최재훈	한화	0.275	116	467	375	52	103	21	0	7	145	44	5	3	2021
-김재환	두산	0.274	137	566	475	86	130	23	2	27	238	102	0	5	2021
-양석환	두산	0.273	133	546	488	66	133	22	0	28	239	96	0	7	2021
-하주석	한화	0.272	138	594	525	84	143	27	3	10	206	68	5	3	2021
-알테어	NC	0.272	143	565	492	83	134	19	2	32	253	84	0	5	2021
-노시환	한화	0.271	107	458	380	56	103	18	1	18	177	84	0	4	2021
-심우준	KT	0.268	139	460	407	61	109	20	2	6	151	48	10	6	2021
-한동희	롯데	0.267	129	496	424	54	113	24	0	17	188	69	1	4	2021
-추신수	SSG	0.265	137	580	461	84	122	19	2	21	208	69	0	4	2021
-최지훈	SSG	0.262	136	534	461	75	121	19	6	5	167	45	8	6	2021
-배정대	KT	0.259	144	595	510	85	132	23	1	12	193	68	3	5	2021
-최주환	SSG	0.256	116	470	406	50	104	16	0	18	174	67	0	2	2021
-오지환	LG	0.254	134	532	464	62	118	19	2	8	165	57	4	5	2021
-서건창	LG	0.253	144	600	513	78	130	24	2	6	176	52	5	4	2021
-박동원	키움	0.249	131	481	413	61	103	21	0	22	190	83	5	3	2021
-강진성	NC	0.249	124	462	406	49	101	20	0	7	142	38	4	2	2021
-박찬호	KIA	0.246	131	483	418	51	103	15	5	1	131	59	8	3	2021
-터커	KIA	0.237	127	539	468	42	111	24	1	9	164	59	0	2	2021
-조용호	KT	0.236	138	515	428	71	101	14	1	0	117	48	5	5	2021
-김상수	삼성	0.235	132	496	429	46	101	17	1	3	129	42	8	4	2021
-최형우	KIA	0.233	104	446	373	52	87	15	1	12	140	55	0	2	2021
-장성우	KT	0.231	127	460	385	46	89	13	0	14	144	63	9	3	2021
-이원석	삼성	0.231	131	480	399	40	92	19	0	9	138	59	2	8	2021
-박병호	키움	0.227	118	477	409	48	93	23	0	20	176	76	0	7	2021
-최형우	KIA	0.354	140	600	522	93	185	37	1	28	308	115	0	3	2020
-손아섭	롯데	0.352	141	611	540	98	190	43	0	11	266	85	1	7	2020
-로하스	KT	0.349	142	628	550	116	192	39	1	47	374	135	0	8	2020
-박민우	NC	0.345	126	530	467	82	161	27	5	8	222	63	2	10	2020
-페르난데스	두산	0.34	144	668	586	104	199	29	0	21	291	105	0	11	2020
-이정후	키움	0.333	140	617	544	85	181	49	5	15	285	101	2	8	2020
-허경민	두산	0.332	117	487	437	70	145	25	1	7	193	58	3	7	2020
-김현수	LG	0.331	142	619	547	98	181	35	2	22	286	119	0	7	2020
-강백호	KT	0.33	129	574	500	95	165	36	1	23	272	89	0	3	2020
-양의지	NC	0.328	130	528	461	86	151	26	1	33	278	124	1	6	2020
-나성범	NC	0.324	130	584	525	115	170	37	2	34	313	112	0	1	2020
-황재균	KT	0.312	134	600	541	108	169	35	5	21	277	97	3	4	2020
-김동엽	삼성	0.312	115	451	413	60	129	21	0	20	210	74	1	4	2020
-오재일	두산	0.312	127	534	471	62	147	32	0	16	227	89	0	2	2020
-구자욱	삼성	0.307	118	510	446	70	137	27	2	15	213	78	1	4	2020
-최주환	두산	0.306	140	574	509	63	156	29	4	16	241	88	1	10	2020
-터커	KIA	0.306	142	631	542	100	166	40	0	32	302	113	0	4	2020
-박석민	NC	0.306	123	448	356	58	109	15	0	14	166	63	2	4	2020
-이명기	NC	0.306	136	540	477	82	146	18	3	2	176	45	5	4	2020
-김하성	키움	0.306	138	622	533	111	163	24	1	30	279	109	3	3	2020
-김상수	삼성	0.304	120	471	404	71	123	18	3	5	162	47	2	2	2020
-박건우	두산	0.304	129	551	487	103	148	40	0	14	230	70	3	7	2020
-오지환	LG	0.3	141	591	527	95	158	41	7	10	243	71	5	5	2020
-정수빈	두산	0.298	141	559	490	84	146	17	8	5	194	59	7	5	2020
-조용호	KT	0.296	132	482	409	73	121	15	0	0	136	32	5	2	2020
-정훈	롯데	0.295	111	476	410	72	121	19	1	11	175	58	2	4	2020
-채은성	LG	0.293	109	464	416	59	122	17	2	15	188	88	0	7	2020
-이대호	롯데	0.292	144	611	542	67	158	27	0	20	245	110	0	11	2020
-나지완	KIA	0.291	137	556	468	73	136	19	1	17	208	92	0	6	2020
-박해민	삼성	0.29	132	541	489	84	142	18	5	11	203	55	7	3	2020
-배정대	KT	0.289	144	615	533	88	154	25	3	13	224	65	5	4	2020
-김재호	두산	0.289	120	458	402	48	116	15	1	2	139	39	2	5	2020
-안치홍	롯데	0.286	124	460	412	49	118	28	0	8	170	54	4	2	2020
-이용규	한화	0.286	120	487	419	60	120	14	2	1	141	32	2	1	2020
-김혜성	키움	0.285	142	553	499	80	142	24	6	7	199	61	2	4	2020
-로맥	SK	0.282	139	586	485	85	137	32	0	32	265	91	0	4	2020
-마차도	롯데	0.28	144	560	486	79	136	31	1	12	205	67	4	8	2020
-홍창기	LG	0.279	135	507	408	87	114	29	6	5	170	39	3	3	2020
-전준우	롯데	0.279	143	628	562	95	157	34	1	26	271	96	3	3	2020
-라모스	LG	0.278	117	494	431	74	120	17	2	38	255	86	0	4	2020
-알테어	NC	0.278	136	546	482	90	134	20	7	31	261	108	0	6	2020
-한동희	롯데	0.278	135	531	461	62	128	22	0	17	201	67	5	3	2020
-장성우	KT	0.278	130	455	400	39	111	15	0	13	165	79	10	6	2020
-서건창	키움	0.277	135	595	484	79	134	28	5	5	187	52	5	10	2020
-노진혁	NC	0.274	132	484	427	70	117	22	3	20	205	82	3	0	2020
-최정	SK	0.27	133	553	452	90	122	22	0	33	243	96	0	6	2020
-이원석	삼성	0.268	121	467	403	46	108	17	0	13	164	74	1	12	2020
-김재환	두산	0.266	140	614	516	82	137	26	1	30	255	113	0	6	2020
-유강남	LG	0.261	137	478	429	51	112	18	0	16	178	74	2	2	2020
-최지훈	SK	0.258	127	520	466	66	120	19	5	1	152	27	8	3	2020
-유민상	KIA	0.246	126	456	391	38	96	23	0	8	143	65	2	4	2020
-심우준	KT	0.235	144	535	476	58	112	16	3	3	143	51	16	4	2020
-박찬호	KIA	0.223	141	531	480	63	107	16	0	3	132	36	12	3	2020
-양의지	NC	0.354	118	459	390	61	138	26	0	20	224	68	0	6	2019
-페르난데스	두산	0.344	144	645	572	87	197	34	0	15	276	88	0	6	2019
-박민우	NC	0.344	125	526	468	89	161	23	8	1	203	45	2	6	2019
-이정후	키움	0.336	140	630	574	91	193	31	10	6	262	68	3	4	2019
-강백호	KT	0.336	116	505	438	72	147	29	1	13	217	65	0	4	2019
-고종욱	SK	0.323	137	513	492	76	159	25	7	3	207	56	0	2	2019
-로하스	KT	0.322	142	578	521	68	168	30	3	24	276	104	0	5	2019
-박건우	두산	0.319	127	537	458	83	146	27	5	10	213	64	1	11	2019
-유한준	KT	0.317	139	562	501	61	159	19	1	14	222	86	0	5	2019
-채은성	LG	0.315	128	514	470	59	148	18	1	12	204	72	0	8	2019
-이천웅	LG	0.308	138	613	546	88	168	24	3	2	204	48	4	1	2019
-김하성	키움	0.307	139	625	540	112	166	38	2	19	265	104	1	7	2019
-김태균	한화	0.305	127	500	433	47	132	21	0	6	171	62	0	8	2019
-샌즈	키움	0.305	139	613	525	100	160	39	1	28	285	113	0	5	2019
-김현수	LG	0.304	140	595	526	75	160	37	0	11	230	82	0	9	2019
-전준우	롯데	0.301	141	606	545	85	164	30	1	22	262	83	1	7	2019
-서건창	키움	0.3	113	486	426	67	128	23	3	2	163	41	3	5	2019
-최형우	KIA	0.3	136	555	456	65	137	31	1	17	221	86	0	7	2019
-김헌곤	삼성	0.297	114	467	411	57	122	20	1	5	159	46	5	6	2019
-손아섭	롯데	0.295	134	568	512	78	151	22	1	10	205	63	1	2	2019
-이명기	NC	0.293	139	547	484	62	142	17	3	2	171	36	7	4	2019
-오재일	두산	0.293	130	529	467	76	137	29	1	21	231	102	0	4	2019
-러프	삼성	0.292	133	568	472	80	138	35	2	22	243	101	0	9	2019
-최정	SK	0.292	141	606	503	86	147	27	0	29	261	99	0	8	2019
-김선빈	KIA	0.292	121	447	394	55	115	22	0	3	146	40	5	4	2019
-최재훈	한화	0.29	135	451	373	47	108	18	0	3	135	31	4	4	2019
-허경민	두산	0.288	133	540	475	71	137	25	1	4	176	60	3	11	2019
-이형종	LG	0.286	120	482	419	56	120	24	1	13	185	63	1	10	2019
-이대호	롯데	0.285	135	549	485	48	138	23	1	16	211	88	0	7	2019
-호잉	한화	0.284	124	525	476	74	135	26	2	18	219	73	1	5	2019
-황재균	KT	0.283	124	507	448	78	127	16	3	20	209	67	0	5	2019
-김재환	두산	0.283	136	574	495	76	140	20	5	15	215	91	0	11	2019
-김민혁	KT	0.281	127	521	466	68	131	10	1	0	143	32	5	5	2019
-박병호	키움	0.28	122	532	432	92	121	22	0	33	242	98	0	9	2019
-박세혁	두산	0.279	137	505	441	58	123	19	9	4	172	63	10	6	2019
-로맥	SK	0.276	137	589	504	86	139	28	1	29	256	95	0	6	2019
-김상수	삼성	0.271	129	543	468	76	127	20	2	5	166	38	6	4	2019
-유강남	LG	0.27	132	468	418	44	113	22	0	16	183	49	1	6	2019
-김강민	SK	0.27	127	460	422	54	114	14	2	8	156	50	0	3	2019
-이창진	KIA	0.27	133	470	400	57	108	25	1	6	153	48	4	5	2019
-이재원	SK	0.268	139	502	451	33	121	19	0	12	176	75	1	7	2019
-김재호	두산	0.268	130	470	377	51	101	22	0	4	135	48	8	11	2019
-구자욱	삼성	0.267	122	526	475	66	127	27	6	15	211	71	0	6	2019
-정수빈	두산	0.265	123	513	441	75	117	19	5	0	146	41	4	5	2019
-한유섬	SK	0.265	125	502	427	52	113	20	0	12	169	52	0	0	2019
-송광민	한화	0.264	122	486	454	50	120	21	0	7	162	51	3	5	2019
-정은원	한화	0.262	142	624	564	83	148	27	6	8	211	57	6	6	2019
-박찬호	KIA	0.26	133	541	504	60	131	15	4	2	160	49	5	2	2019
-이성열	한화	0.256	129	476	414	60	106	21	1	21	192	85	1	4	2019
-오지환	LG	0.252	134	547	473	63	119	23	5	9	179	53	7	3	2019
-박경수	KT	0.247	137	490	421	43	104	24	0	10	158	65	4	6	2019
-김성현	SK	0.246	144	472	426	45	105	16	2	1	128	34	8	3	2019
-이원석	삼성	0.246	111	455	395	44	97	20	0	19	174	76	2	7	2019
-박해민	삼성	0.239	144	581	506	64	121	16	7	5	166	44	12	3	2019
-오선진	한화	0.224	122	453	392	37	88	16	0	3	113	36	10	3	2019
-김현수	LG	0.362	117	511	453	95	164	39	2	20	267	101	0	10	2018
-양의지	두산	0.358	133	503	439	84	157	29	1	23	257	77	0	6	2018
-이정후	넥센	0.355	109	520	459	81	163	34	2	6	219	57	3	8	2018
-박병호	넥센	0.345	113	488	400	88	138	20	0	43	287	112	0	3	2018
-안치홍	KIA	0.342	130	549	494	88	169	38	1	23	278	118	0	9	2018
-전준우	롯데	0.342	144	614	556	118	190	36	2	33	329	90	1	2	2018
-김주찬	KIA	0.34	121	471	429	71	146	23	0	18	223	93	2	10	2018
-최형우	KIA	0.339	143	609	528	92	179	34	1	25	290	103	0	8	2018
-유한준	KT	0.339	121	480	428	59	145	21	1	20	228	83	2	1	2018
-김재환	두산	0.334	139	602	527	104	176	36	1	44	346	133	0	7	2018
-최주환	두산	0.333	138	590	519	87	173	39	6	26	302	108	0	10	2018
-이대호	롯데	0.333	144	604	543	81	181	30	0	37	322	125	0	4	2018
-구자욱	삼성	0.333	116	529	478	100	159	26	5	20	255	84	1	2	2018
-채은성	LG	0.331	139	578	529	78	175	36	2	25	290	119	0	5	2018
-러프	삼성	0.33	137	597	506	97	167	32	4	33	306	125	0	8	2018
-이재원	SK	0.329	130	471	407	63	134	24	0	17	209	57	4	5	2018
-손아섭	롯데	0.329	141	625	553	109	182	32	5	26	302	93	1	1	2018
-박건우	두산	0.326	125	529	488	79	159	24	6	12	231	84	1	2	2018
-허경민	두산	0.324	133	577	516	85	167	30	5	10	237	79	5	8	2018
-박민우	NC	0.324	115	460	411	68	133	22	5	5	180	33	3	4	2018
-나성범	NC	0.318	144	620	556	110	177	36	3	23	288	91	0	5	2018
-민병헌	롯데	0.318	118	494	443	74	141	21	0	17	213	66	2	6	2018
-로맥	SK	0.316	141	616	528	102	167	19	0	43	315	107	0	6	2018
-이형종	LG	0.316	118	485	437	83	138	27	0	13	204	42	5	0	2018
-오재원	두산	0.313	132	521	473	78	148	24	1	15	219	81	3	2	2018
-노수광	SK	0.313	135	588	515	93	161	21	8	8	222	53	9	3	2018
-김재호	두산	0.311	131	467	402	78	125	20	0	16	193	75	3	6	2018
-버나디나	KIA	0.31	131	590	513	106	159	25	3	20	250	70	3	1	2018
-호잉	한화	0.306	142	590	529	85	162	47	2	30	303	110	0	5	2018
-로하스	KT	0.305	144	645	564	114	172	30	1	43	333	114	1	2	2018
-박용택	LG	0.303	134	583	524	89	159	38	1	15	244	76	0	7	2018
-이명기	KIA	0.302	120	502	447	88	135	28	6	4	187	42	11	1	2018
-이원석	삼성	0.301	128	543	479	74	144	30	1	20	236	93	0	5	2018
-김헌곤	삼성	0.3	141	586	513	77	154	26	2	11	217	71	5	4	2018
-박해민	삼성	0.299	144	649	576	114	172	30	10	9	249	68	8	6	2018
-송광민	한화	0.297	113	460	434	63	129	24	0	18	207	79	0	4	2018
-유강남	LG	0.296	132	465	425	53	126	33	0	19	216	66	2	1	2018
-황재균	KT	0.296	142	588	530	76	157	41	3	25	279	88	2	3	2018
-이성열	한화	0.295	131	528	485	76	143	21	1	34	268	102	1	2	2018
-김선빈	KIA	0.295	127	492	424	73	125	17	2	4	158	49	6	5	2018
-신본기	롯데	0.294	139	479	425	55	125	28	1	11	188	71	5	5	2018
-이용규	한화	0.293	134	575	491	82	144	14	1	1	163	36	8	5	2018
-임병욱	넥센	0.293	134	447	423	76	124	29	3	13	198	60	0	2	2018
-강백호	KT	0.29	138	585	527	108	153	32	2	29	276	84	0	3	2018
-김하성	넥센	0.288	129	576	511	95	147	27	4	20	242	84	1	5	2018
-한유섬	SK	0.284	136	562	486	97	138	31	0	41	292	115	0	8	2018
-노진혁	NC	0.283	125	458	420	52	119	21	4	11	181	42	1	2	2018
-김민성	넥센	0.283	128	465	413	46	117	24	0	10	171	45	1	5	2018
-오재일	두산	0.279	123	477	401	69	112	19	2	27	216	80	0	10	2018
-오지환	LG	0.278	144	617	533	93	148	26	2	11	211	71	12	6	2018
-김성현	SK	0.277	135	462	415	51	115	19	1	4	148	55	6	3	2018
-윤석민	KT	0.276	132	509	460	58	127	22	0	19	206	60	2	3	2018
-김혜성	넥센	0.27	136	473	430	79	116	15	6	5	158	45	3	2	2018
-강민호	삼성	0.269	129	477	427	46	115	14	0	22	195	71	0	7	2018
-번즈	롯데	0.268	133	505	462	80	124	34	5	23	237	64	1	0	2018
-양석환	LG	0.263	140	519	483	53	127	27	0	22	220	82	1	5	2018
-김상수	삼성	0.263	122	499	453	63	119	13	1	10	164	50	8	3	2018
-박경수	KT	0.262	135	528	458	65	120	21	0	25	216	74	0	3	2018
-스크럭스	NC	0.257	142	571	501	75	129	35	0	26	242	97	0	3	2018
-하주석	한화	0.254	141	517	484	67	123	20	3	9	176	52	1	0	2018
-김동엽	SK	0.252	124	446	421	58	106	15	0	27	202	76	1	3	2018
-최정	SK	0.244	115	489	406	95	99	16	1	35	222	74	0	2	2018
-김선빈	KIA	0.37	137	529	476	84	176	34	1	5	227	64	5	4	2017
-박건우	두산	0.366	131	543	483	91	177	40	2	20	281	78	5	4	2017
-박민우	NC	0.363	106	452	388	84	141	25	4	3	183	47	3	4	2017
-나성범	NC	0.347	125	561	498	103	173	42	2	24	291	99	0	3	2017
-박용택	LG	0.344	138	596	509	83	175	23	2	14	244	90	0	9	2017
-최형우	KIA	0.342	142	629	514	98	176	36	3	26	296	120	0	8	2017
-김재환	두산	0.34	144	636	544	110	185	34	2	35	328	115	0	4	2017
-로사리오	한화	0.339	119	510	445	100	151	30	1	37	294	111	0	5	2017
-손아섭	롯데	0.335	144	667	576	113	193	35	4	20	296	80	1	3	2017
-서건창	넥센	0.332	139	615	539	87	179	28	3	6	231	76	2	6	2017
-이명기	KIA	0.332	115	512	464	79	154	24	4	9	213	63	14	3	2017
-송광민	한화	0.327	117	473	437	71	143	26	0	13	208	75	4	8	2017
-이정후	넥센	0.324	144	622	552	111	179	29	8	2	230	47	2	2	2017
-전준우	롯데	0.321	110	496	455	76	146	27	1	18	229	69	2	2	2017
-이대호	롯데	0.32	142	608	540	73	173	13	0	34	288	111	0	3	2017
-버나디나	KIA	0.32	139	621	557	118	178	26	8	27	301	111	3	9	2017
-최정	SK	0.316	130	527	430	89	136	18	1	46	294	113	0	8	2017
-안치홍	KIA	0.316	132	545	487	95	154	29	2	21	250	93	6	5	2017
-러프	삼성	0.315	134	591	515	90	162	38	0	31	293	124	0	4	2017
-윤석민	KT	0.312	142	586	538	90	168	30	1	20	260	105	0	7	2017
-모창민	NC	0.312	136	527	474	64	148	25	3	17	230	90	3	9	2017
-고종욱	넥센	0.312	123	453	426	70	133	24	8	8	197	54	0	2	2017
-구자욱	삼성	0.31	144	647	564	108	175	39	10	21	297	107	0	10	2017
-김주찬	KIA	0.309	122	478	440	78	136	39	2	12	215	70	2	1	2017
-오재일	두산	0.306	128	466	412	62	126	27	0	26	231	89	1	3	2017
-유한준	KT	0.306	133	497	445	52	136	19	0	13	194	68	2	3	2017
-민병헌	두산	0.304	123	520	447	73	136	21	0	14	199	71	1	6	2017
-강한울	삼성	0.303	135	448	412	58	125	9	3	0	140	24	9	1	2017
-번즈	롯데	0.303	116	468	423	71	128	38	0	15	211	57	2	3	2017
-김하성	넥센	0.302	141	601	526	90	159	36	3	23	270	114	2	7	2017
-최주환	두산	0.301	129	452	399	65	120	16	6	7	169	57	1	5	2017
-나지완	KIA	0.301	137	551	459	85	138	20	3	27	245	94	0	7	2017
-스크럭스	NC	0.3	115	518	437	91	131	24	0	35	260	111	0	4	2017
-에반스	두산	0.296	138	581	514	82	152	19	0	27	252	90	0	3	2017
-김문호	롯데	0.292	131	448	390	49	114	17	1	2	139	35	7	1	2017
-나주환	SK	0.291	122	452	419	69	122	24	1	19	205	65	8	1	2017
-최준석	롯데	0.291	125	464	409	43	119	15	0	14	176	82	0	5	2017
-권희동	NC	0.286	141	554	472	72	135	20	2	19	216	86	7	7	2017
-강민호	롯데	0.285	130	515	456	62	130	22	1	22	220	68	0	3	2017
-하주석	한화	0.285	111	470	432	69	123	18	8	11	190	52	9	1	2017
-박해민	삼성	0.284	144	638	570	96	162	25	8	7	224	54	8	9	2017
-김민성	넥센	0.282	133	530	472	59	133	26	1	15	206	78	0	8	2017
-이승엽	삼성	0.28	135	533	472	65	132	30	5	24	244	87	0	8	2017
-이범호	KIA	0.272	115	447	382	57	104	14	0	25	193	89	0	6	2017
-이원석	삼성	0.265	121	459	411	55	109	20	1	18	185	62	4	6	2017
-양석환	LG	0.263	132	496	445	62	117	27	3	14	192	83	2	5	2017
-박경수	KT	0.262	131	511	442	62	116	27	1	15	190	66	3	3	2017
-최형우	삼성	0.376	138	618	519	99	195	46	2	31	338	144	0	7	2016
-김태균	한화	0.365	144	652	529	94	193	39	0	23	301	136	0	6	2016
-이용규	한화	0.352	113	530	452	98	159	20	4	3	196	41	7	1	2016
-김주찬	KIA	0.346	130	555	511	97	177	37	3	23	289	101	1	6	2016
-박용택	LG	0.346	138	578	509	84	176	24	0	11	233	90	0	7	2016
-구자욱	삼성	0.343	108	495	428	105	147	19	13	14	234	77	2	5	2016
-박민우	NC	0.343	121	515	435	84	149	16	6	3	186	55	10	7	2016
-유한준	KT	0.336	110	460	408	70	137	22	0	14	201	64	0	3	2016
-황재균	롯데	0.335	127	559	498	97	167	26	5	27	284	113	0	8	2016
-박건우	두산	0.335	132	540	484	95	162	36	4	20	266	83	4	5	2016
-고종욱	넥센	0.334	133	566	527	92	176	22	9	8	240	72	1	5	2016
-김재환	두산	0.325	134	568	492	107	160	32	3	37	309	124	0	5	2016
-송광민	한화	0.325	116	494	449	80	146	27	2	17	228	83	7	6	2016
-김문호	롯데	0.325	140	599	526	77	171	28	3	7	226	70	3	2	2016
-서건창	넥센	0.325	140	646	560	111	182	30	7	7	247	63	3	4	2016
-민병헌	두산	0.325	134	579	511	98	166	31	4	16	253	87	1	4	2016
-손아섭	롯데	0.323	144	672	575	118	186	33	1	16	269	81	0	2	2016
-강민호	롯데	0.323	116	460	381	65	123	26	0	20	209	72	0	3	2016
-로사리오	한화	0.321	127	532	492	78	158	31	2	33	292	120	1	2	2016
-테임즈	NC	0.321	123	529	436	118	140	30	3	40	296	121	0	7	2016
-이대형	KT	0.32	143	654	600	89	192	14	3	1	215	42	7	1	2016
-김성현	SK	0.319	138	530	479	66	153	28	0	8	205	65	5	7	2016
-오재일	두산	0.316	105	455	380	69	120	20	2	27	225	92	2	7	2016
-박경수	KT	0.313	121	476	402	64	126	22	1	20	210	80	0	4	2016
-채은성	LG	0.313	128	451	403	64	126	20	3	9	179	81	2	8	2016
-필	KIA	0.313	132	544	499	71	156	37	1	20	255	86	0	7	2016
-정의윤	SK	0.311	144	616	576	68	179	32	1	27	294	100	0	5	2016
-김재호	두산	0.31	137	496	416	69	129	27	3	7	183	78	5	13	2016
-이범호	KIA	0.31	138	560	484	93	150	23	0	33	272	108	0	7	2016
-정근우	한화	0.31	138	650	575	121	178	31	2	18	267	88	1	5	2016
-나성범	NC	0.309	144	653	572	116	177	37	2	22	284	113	1	4	2016
-이택근	넥센	0.309	127	460	398	64	123	19	1	8	168	65	0	6	2016
-나지완	KIA	0.308	118	486	380	84	117	21	2	25	217	90	0	4	2016
-히메네스	LG	0.308	135	579	523	101	161	36	0	26	275	102	1	6	2016
-에반스	두산	0.308	118	481	400	69	123	31	0	24	226	81	0	7	2016
-박석민	NC	0.307	126	506	427	77	131	20	0	32	247	104	2	4	2016
-김민성	넥센	0.306	141	579	510	76	156	39	5	17	256	90	1	12	2016
-이종욱	NC	0.305	134	517	453	73	138	24	4	5	185	57	4	5	2016
-이승엽	삼성	0.303	142	623	542	91	164	32	2	27	281	118	0	8	2016
-박해민	삼성	0.3	141	641	564	109	169	26	12	4	231	61	22	3	2016
-이호준	NC	0.298	119	472	399	46	119	20	0	21	202	87	2	4	2016
-대니돈	넥센	0.295	129	497	417	65	123	33	1	16	206	70	1	4	2016
-서동욱	KIA	0.292	124	485	411	73	120	30	3	16	204	67	6	3	2016
-이재원	SK	0.29	130	472	411	49	119	15	0	15	179	64	2	7	2016
-최정	SK	0.288	141	606	500	106	144	24	1	40	290	106	0	6	2016
-백상원	삼성	0.288	132	517	445	60	128	19	3	3	162	49	10	7	2016
-허경민	두산	0.286	144	609	538	96	154	24	4	7	207	81	6	2	2016
-고메즈	SK	0.283	117	492	456	74	129	31	0	21	223	62	2	4	2016
-김하성	넥센	0.281	144	599	526	92	148	29	7	20	251	84	2	5	2016
-오지환	LG	0.28	121	472	393	73	110	14	5	20	194	78	2	5	2016
-박정권	SK	0.277	125	468	422	59	117	17	3	18	194	59	2	4	2016
-오재원	두산	0.272	122	484	416	68	113	18	1	5	148	58	3	6	2016
-양성우	한화	0.271	108	446	384	52	104	12	4	4	136	53	8	6	2016
-김호령	KIA	0.267	124	514	453	72	121	18	3	8	169	41	13	2	2016
-박동원	넥센	0.248	127	454	411	44	102	25	1	14	171	70	6	3	2016
-테임즈	NC	0.381	142	595	472	130	180	42	5	47	373	140	0	7	2015
-유한준	넥센	0.362	139	598	520	103	188	42	1	23	301	116	1	8	2015
-구자욱	삼성	0.349	116	465	410	97	143	33	5	11	219	57	0	4	2015
-마르테	KT	0.348	115	487	425	85	148	32	1	20	242	89	0	8	2015
-박병호	넥센	0.343	140	622	528	129	181	35	1	53	377	146	0	4	2015
-이용규	한화	0.341	124	585	493	94	168	15	7	4	209	42	11	4	2015
-이승엽	삼성	0.332	122	522	470	87	156	28	1	26	264	90	0	6	2015
-박용택	LG	0.326	128	533	487	66	159	28	2	18	245	83	1	7	2015
-나성범	NC	0.326	144	622	564	112	184	34	5	28	312	135	3	8	2015
-김현수	두산	0.326	141	630	512	103	167	26	0	28	277	121	0	9	2015
-양의지	두산	0.326	132	513	442	70	144	27	0	20	231	93	2	6	2015
-필	KIA	0.325	143	591	536	81	174	35	1	22	277	101	0	9	2015
-박석민	삼성	0.321	135	559	448	90	144	25	0	26	247	116	1	8	2015
-최형우	삼성	0.318	144	637	547	94	174	33	1	33	308	123	0	8	2015
-손아섭	롯데	0.317	116	517	445	86	141	28	1	13	210	54	0	3	2015
-허경민	두산	0.317	117	453	404	64	128	20	2	1	155	41	8	3	2015
-정근우	한화	0.316	126	552	468	99	148	30	2	12	218	66	13	2	2015
-김태균	한화	0.316	133	524	408	61	129	28	0	21	220	104	1	5	2015
-이명기	SK	0.315	137	582	521	88	164	30	2	3	207	35	11	4	2015
-아두치	롯데	0.314	132	594	526	105	165	34	5	28	293	106	1	4	2015
-강민호	롯데	0.311	123	456	380	63	118	18	1	35	243	86	0	2	2015
-김재호	두산	0.307	133	488	410	63	126	24	3	3	165	50	14	7	2015
-최준석	롯데	0.306	144	618	507	78	155	18	1	31	268	109	1	1	2015
-박민우	NC	0.304	141	617	520	111	158	31	6	3	210	47	3	7	2015
-민병헌	두산	0.303	129	561	491	80	149	20	2	12	209	75	6	6	2015
-김민성	넥센	0.303	118	489	445	60	135	24	0	16	207	71	2	3	2015
-이대형	KT	0.302	140	616	546	86	165	23	3	0	194	37	10	1	2015
-정훈	롯데	0.3	135	562	486	85	146	27	2	9	204	62	7	3	2015
-김성현	SK	0.297	129	449	397	49	118	20	0	8	162	48	12	2	2015
-정수빈	두산	0.295	128	570	491	79	145	27	7	2	192	59	19	6	2015
-김종호	NC	0.295	133	486	424	90	125	16	7	4	167	36	10	3	2015
-이호준	NC	0.294	131	518	449	48	132	25	0	24	229	110	3	2	2015
-박해민	삼성	0.293	144	608	525	96	154	22	7	0	190	47	23	2	2015
-황재균	롯데	0.29	144	596	534	95	155	41	2	26	278	97	4	6	2015
-김하성	넥센	0.29	140	582	511	89	148	35	5	19	250	73	4	6	2015
-나바로	삼성	0.287	140	643	534	126	153	19	1	48	318	137	1	9	2015
-박경수	KT	0.284	137	537	440	75	125	30	1	22	223	73	6	4	2015
-장성우	KT	0.284	133	491	433	55	123	20	1	13	184	77	3	9	2015
-이재원	SK	0.282	140	559	489	58	138	18	1	17	209	100	0	5	2015
-박정권	SK	0.281	124	494	438	66	123	23	0	21	209	70	4	2	2015
-스나이더	넥센	0.281	113	487	431	88	121	26	1	26	227	71	3	5	2015
-김상현	KT	0.28	134	539	475	71	133	20	0	27	234	88	0	6	2015
-오재원	두산	0.28	120	474	411	60	115	20	2	11	172	59	7	4	2015
-김상수	삼성	0.278	132	518	449	67	125	30	4	8	187	63	13	7	2015
-오지환	LG	0.278	138	566	497	76	138	41	4	11	220	56	3	3	2015
-이범호	KIA	0.27	138	514	437	60	118	25	0	28	227	79	0	4	2015
-이종욱	NC	0.268	125	504	440	63	118	25	2	5	162	52	4	3	2015
-지석훈	NC	0.267	137	466	415	53	111	15	0	11	159	46	9	3	2015
-브라운	SK	0.261	137	539	464	82	121	21	2	28	230	76	0	2	2015
-김태군	NC	0.254	144	474	421	45	107	24	0	6	149	52	11	7	2015
-손시헌	NC	0.245	140	508	440	56	108	24	2	13	175	58	13	5	2015
+    # 수집 시점에 컬럼 계약(dtype) 적용
+    return schema_registry.apply(df, 'hitter')
 
-    
-    """
+def crawl_pitcher_data(max_pages=None):
+    """투수 데이터 크롤링 (Basic1 탭, 기본 CRAWL_MAX_PAGES페이지. max_pages=0이면 모든 페이지)"""
+    max_pages = CRAWL_MAX_PAGES if max_pages is None else max_pages
+    df = kbo_crawler.crawl_table('pitcher', 'Basic1', max_pages=max_pages)
+    df = df.set_index('순위')
+    df['연도'] = 2025
 
+    # 수집 시점에 컬럼 계약(dtype) 적용
+    return schema_registry.apply(df, 'pitcher')
 
-    # 투수 역대 데이터
-    pitcher_historical_data = """
-네일	KIA	2.53	26	12	5	0	0	0.706	149 1/3	154	11	35	9	138	69	42	1.27	2024
-하트	NC	2.69	26	13	3	0	0	0.813	157	124	11	38	11	182	51	47	1.03	2024
-반즈	롯데	3.35	25	9	6	0	0	0.6	150 2/3	140	18	46	5	171	59	56	1.23	2024
-후라도	키움	3.36	30	10	8	0	0	0.556	190 1/3	185	19	32	9	169	78	71	1.14	2024
-코너	삼성	3.43	28	11	6	0	0	0.647	160	135	21	40	19	158	67	61	1.09	2024
-원태인	삼성	3.66	28	15	6	0	0	0.714	159 2/3	150	17	42	7	119	68	65	1.2	2024
-헤이수스	키움	3.68	30	13	11	0	0	0.542	171 1/3	171	22	44	14	178	78	70	1.25	2024
-손주영	LG	3.79	28	9	10	0	1	0.474	144 2/3	157	11	54	10	112	71	61	1.46	2024
-레예스	삼성	3.81	26	11	4	0	0	0.733	144	159	15	30	7	114	65	61	1.31	2024
-윌커슨	롯데	3.84	32	12	8	0	0	0.6	196 2/3	210	18	27	2	167	90	84	1.21	2024
-류현진	한화	3.87	28	10	8	0	0	0.556	158 1/3	182	12	33	3	135	78	68	1.36	2024
-양현종	KIA	4.1	29	11	5	0	0	0.688	171 1/3	174	21	41	6	129	86	78	1.25	2024
-쿠에바스	KT	4.1	31	7	12	0	0	0.368	173 1/3	158	17	59	7	154	86	79	1.25	2024
-엔스	LG	4.19	30	13	6	0	0	0.684	167 2/3	169	16	50	6	157	84	78	1.31	2024
-곽빈	두산	4.24	30	15	9	0	0	0.625	167 2/3	142	11	76	6	154	83	79	1.3	2024
-하영민	키움	4.37	28	9	8	0	0	0.529	150 1/3	168	8	58	5	101	82	73	1.5	2024
-벤자민	KT	4.63	28	11	8	0	0	0.579	149 2/3	141	28	48	4	156	90	77	1.26	2024
-박세웅	롯데	4.78	30	6	11	0	0	0.353	173 1/3	188	13	56	11	124	103	92	1.41	2024
-엄상백	KT	4.88	29	13	10	0	0	0.565	156 2/3	164	26	42	7	159	88	85	1.31	2024
-김광현	SSG	4.93	31	12	10	0	0	0.545	162 1/3	162	24	73	6	154	95	89	1.45	2024
-페디	NC	2	30	20	6	0	0	0.769	180 1/3	137	9	35	4	209	46	40	0.95	2023
-안우진	키움	2.39	24	9	7	0	0	0.563	150 2/3	121	5	38	1	164	44	40	1.06	2023
-뷰캐넌	삼성	2.54	30	12	8	0	0	0.6	188	174	4	43	6	139	71	53	1.15	2023
-후라도	키움	2.65	30	11	8	0	0	0.579	183 2/3	164	7	41	9	147	64	54	1.12	2023
-알칸타라	두산	2.67	31	13	9	0	0	0.591	192	171	16	35	5	162	67	57	1.07	2023
-고영표	KT	2.78	28	12	7	0	0	0.632	174 2/3	181	7	19	9	114	57	54	1.15	2023
-원태인	삼성	3.24	26	7	7	0	0	0.5	150	157	15	34	6	102	61	54	1.27	2023
-반즈	롯데	3.28	30	11	10	0	0	0.524	170 1/3	171	6	56	15	147	68	62	1.33	2023
-임찬규	LG	3.42	30	14	3	0	1	0.824	144 2/3	142	10	54	5	103	63	55	1.35	2023
-박세웅	롯데	3.45	27	9	7	0	0	0.563	154	145	8	59	4	129	70	59	1.32	2023
-김광현	SSG	3.53	30	9	8	0	0	0.529	168 1/3	163	11	70	2	119	75	66	1.38	2023
-벤자민	KT	3.54	29	15	6	0	0	0.714	160	149	12	45	3	157	79	63	1.21	2023
-양현종	KIA	3.58	29	9	11	0	0	0.45	171	181	13	48	1	133	78	68	1.34	2023
-페냐	한화	3.6	32	11	11	0	0	0.5	177 1/3	149	14	59	18	147	82	71	1.17	2023
-켈리	LG	3.83	30	10	7	0	0	0.588	178 2/3	183	10	39	6	129	87	76	1.24	2023
-최원태	LG	4.3	26	9	7	0	0	0.563	146 2/3	149	12	46	7	118	73	70	1.33	2023
-오원석	SSG	5.23	28	8	10	0	0	0.444	144 2/3	158	11	69	9	88	92	84	1.57	2023
-안우진	키움	2.11	30	15	8	0	0	0.652	196	131	4	55	4	224	51	46	0.95	2022
-김광현	SSG	2.13	28	13	3	0	0	0.813	173 1/3	141	10	45	5	153	48	41	1.07	2022
-플럿코	LG	2.39	28	15	5	0	0	0.75	162	125	13	38	2	149	53	43	1.01	2022
-수아레즈	삼성	2.49	30	6	8	0	0	0.429	173 2/3	151	7	50	4	159	61	48	1.16	2022
-켈리	LG	2.54	27	16	4	0	0	0.8	166 1/3	144	10	35	2	153	50	47	1.08	2022
-요키시	키움	2.57	30	10	8	0	0	0.556	185 1/3	169	8	33	5	154	61	53	1.09	2022
-폰트	SSG	2.69	28	13	6	0	0	0.684	184	141	18	34	6	170	63	55	0.95	2022
-루친스키	NC	2.97	31	10	12	0	0	0.455	193 2/3	184	14	34	8	194	77	64	1.13	2022
-뷰캐넌	삼성	3.04	26	11	8	0	0	0.579	160	176	10	39	8	117	61	54	1.34	2022
-소형준	KT	3.05	27	13	6	0	0	0.684	171 1/3	158	8	39	5	117	68	58	1.15	2022
-고영표	KT	3.26	28	13	8	0	0	0.619	182 1/3	191	7	23	16	156	69	66	1.17	2022
-스탁	두산	3.6	29	9	10	0	0	0.474	165	162	9	83	10	138	87	66	1.48	2022
-최원준	두산	3.6	30	8	13	0	0	0.381	165	183	21	37	7	113	80	66	1.33	2022
-반즈	롯데	3.62	31	12	12	0	0	0.5	186 1/3	176	8	47	18	160	87	75	1.2	2022
-곽빈	두산	3.78	27	8	9	0	0	0.471	147 2/3	143	13	60	11	138	69	62	1.37	2022
-양현종	KIA	3.85	30	12	7	0	0	0.632	175 1/3	170	14	50	3	141	86	75	1.25	2022
-이의리	KIA	3.86	29	10	10	0	0	0.5	154	128	18	74	9	161	79	66	1.31	2022
-박세웅	롯데	3.89	28	10	11	0	0	0.476	157 1/3	179	8	32	8	146	80	68	1.34	2022
-원태인	삼성	3.92	27	10	8	0	0	0.556	165 1/3	175	16	38	4	130	75	72	1.29	2022
-김민우	한화	4.36	29	6	11	0	0	0.353	163	143	16	84	8	129	82	79	1.39	2022
-오원석	SSG	4.5	31	6	8	0	0	0.429	144	158	16	58	3	112	79	72	1.5	2022
-데스파이네	KT	4.53	30	8	12	0	0	0.4	163	198	14	48	9	123	94	82	1.51	2022
-미란다	두산	2.33	28	14	5	0	0	0.737	173 2/3	135	11	63	1	225	49	45	1.14	2021
-백정현	삼성	2.63	27	14	5	0	0	0.737	157 2/3	142	15	54	2	109	54	46	1.24	2021
-고영표	KT	2.92	26	11	6	0	1	0.647	166 2/3	147	9	27	14	130	59	54	1.04	2021
-요키시	키움	2.93	31	16	9	0	0	0.64	181 1/3	171	12	46	4	131	71	59	1.2	2021
-원태인	삼성	3.06	26	14	7	0	0	0.667	158 2/3	147	11	51	5	129	59	54	1.25	2021
-뷰캐넌	삼성	3.1	30	16	5	0	0	0.762	177	173	13	59	2	162	71	61	1.31	2021
-켈리	LG	3.15	30	13	8	0	0	0.619	177	160	12	60	11	142	64	62	1.24	2021
-루친스키	NC	3.17	30	15	10	0	0	0.6	178 2/3	160	12	55	10	177	76	63	1.2	2021
-킹험	한화	3.19	25	10	8	0	0	0.556	144	117	11	41	5	131	58	51	1.1	2021
-최원준	두산	3.3	29	12	4	0	0	0.75	158 1/3	160	15	37	10	113	65	58	1.24	2021
-데스파이네	KT	3.39	33	13	10	0	0	0.565	188 2/3	175	10	78	7	165	81	71	1.34	2021
-폰트	SSG	3.46	25	8	5	0	0	0.615	145 2/3	114	12	45	6	157	66	56	1.09	2021
-카펜터	한화	3.97	31	5	12	0	0	0.294	170	150	16	72	19	179	90	75	1.31	2021
-박세웅	롯데	3.98	28	10	9	0	0	0.526	163	141	20	53	10	125	75	72	1.19	2021
-김민우	한화	4	29	14	10	0	0	0.583	155 1/3	131	15	76	7	125	71	69	1.33	2021
-스트레일리	롯데	4.07	31	10	12	0	0	0.455	165 2/3	162	12	67	7	164	85	75	1.38	2021
-신민혁	NC	4.41	30	9	6	0	0	0.6	145	155	17	44	5	107	75	71	1.37	2021
-임기영	KIA	4.88	28	8	8	0	0	0.5	153	155	15	45	11	129	85	83	1.31	2021
-프랑코	롯데	5.4	37	9	8	0	1	0.529	150	147	20	75	20	124	97	90	1.48	2021
-요키시	키움	2.14	27	12	7	0	0	0.632	159 2/3	144	6	25	6	115	53	38	1.06	2020
-스트레일리	롯데	2.5	31	15	4	0	0	0.789	194 2/3	148	10	51	7	205	61	54	1.02	2020
-브룩스	KIA	2.5	23	11	4	0	0	0.733	151 1/3	131	4	24	3	130	43	42	1.02	2020
-알칸타라	두산	2.54	31	20	2	0	0	0.909	198 2/3	174	12	30	9	182	58	56	1.03	2020
-루친스키	NC	3.05	30	19	5	0	0	0.792	183	173	14	57	11	167	67	62	1.26	2020
-켈리	LG	3.32	28	15	7	0	0	0.682	173 1/3	160	16	40	11	134	67	64	1.15	2020
-뷰캐넌	삼성	3.45	27	15	7	0	0	0.682	174 2/3	172	16	50	7	121	71	67	1.27	2020
-최채흥	삼성	3.58	26	11	6	0	0	0.647	146	131	12	51	7	123	67	58	1.25	2020
-문승원	SK	3.65	25	6	8	0	0	0.429	145 2/3	136	13	45	6	117	64	59	1.24	2020
-임찬규	LG	4.08	27	10	9	0	0	0.526	147 2/3	143	14	65	5	138	76	67	1.41	2020
-쿠에바스	KT	4.1	27	10	8	0	0	0.556	158	152	16	46	9	110	80	72	1.25	2020
-데스파이네	KT	4.33	35	15	8	0	0	0.652	207 2/3	233	18	68	8	152	105	100	1.45	2020
-가뇽	KIA	4.34	28	11	8	0	0	0.579	159 2/3	162	7	64	9	141	86	77	1.42	2020
-윌슨	LG	4.42	25	10	8	0	0	0.556	144 2/3	161	13	39	8	109	81	71	1.38	2020
-라이트	NC	4.68	29	11	9	0	0	0.55	157 2/3	164	12	63	10	125	87	82	1.44	2020
-양현종	KIA	4.7	31	11	10	0	0	0.524	172 1/3	180	13	64	5	149	99	90	1.42	2020
-박세웅	롯데	4.7	28	8	10	0	0	0.444	147 1/3	177	20	47	8	108	85	77	1.52	2020
-박종훈	SK	4.81	29	13	11	0	0	0.542	157 1/3	146	14	78	22	134	90	84	1.42	2020
-서폴드	한화	4.91	28	10	13	0	0	0.435	165	203	19	42	13	97	107	90	1.48	2020
-핀토	SK	6.17	30	6	15	0	0	0.286	162	198	19	90	11	112	121	111	1.78	2020
-양현종	KIA	2.29	29	16	8	0	0	0.667	184 2/3	165	6	33	2	163	56	47	1.07	2019
-린드블럼	두산	2.5	30	20	3	0	0	0.87	194 2/3	165	13	29	6	189	57	54	1	2019
-김광현	SK	2.51	31	17	6	0	0	0.739	190 1/3	198	13	38	2	180	64	53	1.24	2019
-켈리	LG	2.55	29	14	12	0	0	0.538	180 1/3	164	7	41	16	126	70	51	1.14	2019
-산체스	SK	2.62	28	17	5	0	0	0.773	165	151	2	42	2	148	51	48	1.17	2019
-윌슨	LG	2.92	30	14	7	0	0	0.667	185	171	7	44	10	137	77	60	1.16	2019
-브리검	키움	2.96	28	13	5	0	0	0.722	158 1/3	148	5	46	12	130	62	52	1.23	2019
-루친스키	NC	3.05	30	9	9	0	0	0.5	177 1/3	164	13	45	11	119	68	60	1.18	2019
-요키시	키움	3.13	30	13	9	0	0	0.591	181 1/3	166	9	39	11	141	72	63	1.13	2019
-유희관	두산	3.25	28	11	8	0	0	0.579	166 1/3	171	8	42	3	64	67	60	1.28	2019
-최원태	키움	3.38	27	11	5	0	0	0.688	157 1/3	165	5	36	5	105	68	59	1.28	2019
-채드벨	한화	3.5	29	11	10	0	0	0.524	177 1/3	169	14	63	10	134	73	69	1.31	2019
-서폴드	한화	3.51	31	12	11	0	0	0.522	192 1/3	191	8	54	8	135	84	75	1.27	2019
-쿠에바스	KT	3.62	30	13	10	0	0	0.565	184	153	18	63	12	135	80	74	1.17	2019
-이영하	두산	3.64	29	17	4	0	0	0.81	163 1/3	148	5	61	10	90	70	66	1.28	2019
-문승원	SK	3.88	26	11	7	0	2	0.611	144	130	23	33	3	99	63	62	1.13	2019
-박종훈	SK	3.88	28	8	11	0	0	0.421	144	157	12	59	13	100	72	62	1.5	2019
-레일리	롯데	3.88	30	5	14	0	0	0.263	181	191	10	65	8	140	88	78	1.41	2019
-알칸타라	KT	4.01	27	11	11	0	0	0.5	172 2/3	189	15	27	8	100	80	77	1.25	2019
-이용찬	두산	4.07	26	7	10	0	0	0.412	148 1/3	168	15	45	6	102	75	67	1.44	2019
-차우찬	LG	4.12	29	13	8	0	0	0.619	168 1/3	181	16	59	5	124	87	77	1.43	2019
-백정현	삼성	4.24	28	8	10	0	0	0.444	157	158	17	56	6	82	85	74	1.36	2019
-다익손	롯데	4.34	29	6	10	0	0	0.375	149 1/3	164	15	40	6	117	81	72	1.37	2019
-윌랜드	KIA	4.75	28	8	10	0	0	0.444	165	191	17	59	5	137	95	87	1.52	2019
-윤성환	삼성	4.77	27	8	13	0	0	0.381	145 1/3	168	14	50	7	65	87	77	1.5	2019
-김민	KT	4.96	27	6	12	0	0	0.333	150 2/3	175	16	65	4	91	88	83	1.59	2019
-터너	KIA	5.46	28	7	13	0	0	0.35	153 1/3	179	12	58	17	121	107	93	1.55	2019
-린드블럼	두산	2.88	26	15	4	0	0	0.789	168 2/3	142	16	38	8	157	56	54	1.07	2018
-윌슨	LG	3.07	26	9	4	0	0	0.692	170	158	11	35	6	149	63	58	1.14	2018
-소사	LG	3.52	27	9	9	0	0	0.5	181 1/3	192	16	28	4	181	83	71	1.21	2018
-이용찬	두산	3.63	25	15	3	0	0	0.833	144	151	14	36	8	102	62	58	1.3	2018
-후랭코프	두산	3.74	28	18	3	0	0	0.857	149 1/3	118	12	55	22	134	64	62	1.16	2018
-브리검	넥센	3.84	31	11	7	0	1	0.611	199	188	19	50	19	175	89	85	1.2	2018
-켈리	SK	4.09	28	12	7	0	0	0.632	158 1/3	152	18	47	13	161	78	72	1.26	2018
-양현종	KIA	4.15	29	13	11	0	0	0.542	184 1/3	199	21	43	2	152	88	85	1.31	2018
-박종훈	SK	4.18	30	14	8	0	0	0.636	159 1/3	158	16	54	20	133	81	74	1.33	2018
-니퍼트	KT	4.25	29	8	8	0	0	0.5	175 2/3	209	26	39	9	165	88	83	1.41	2018
-피어밴드	KT	4.3	27	8	8	0	0	0.5	163 1/3	186	24	38	6	141	90	78	1.37	2018
-문승원	SK	4.6	31	8	9	1	1	0.471	150 2/3	180	24	37	4	122	86	77	1.44	2018
-헥터	KIA	4.6	29	11	10	0	0	0.524	174	209	25	36	4	137	102	89	1.41	2018
-샘슨	한화	4.68	30	13	8	0	0	0.619	161 2/3	144	17	79	5	195	91	84	1.38	2018
-레일리	롯데	4.74	30	11	13	0	0	0.458	178 1/3	180	24	54	18	178	106	94	1.31	2018
-이재학	NC	4.79	29	5	13	0	0	0.278	152 1/3	157	13	49	10	116	87	81	1.35	2018
-한현희	넥센	4.79	30	11	7	0	0	0.611	169	208	22	49	20	105	98	90	1.52	2018
-산체스	SK	4.89	29	8	8	0	1	0.5	145 1/3	161	26	39	7	124	90	79	1.38	2018
-아델만	삼성	5.05	31	8	12	0	0	0.4	171	202	20	54	11	137	101	96	1.5	2018
-베렛	NC	5.28	29	6	10	0	0	0.375	155	178	24	59	9	144	94	91	1.53	2018
-보니야	삼성	5.3	29	7	10	0	0	0.412	168	193	23	63	12	151	111	99	1.52	2018
-금민철	KT	5.41	29	8	12	0	0	0.4	156 1/3	212	19	68	7	79	104	94	1.79	2018
-임찬규	LG	5.77	29	11	11	1	0	0.5	146 2/3	195	23	47	13	125	104	94	1.65	2018
-차우찬	LG	6.09	29	12	10	0	0	0.545	170	177	27	79	10	136	119	115	1.51	2018
-김원중	롯데	6.94	30	8	7	0	0	0.533	145 1/3	173	28	77	11	137	115	112	1.72	2018
-피어밴드	KT	3.04	26	8	10	0	0	0.444	160	153	20	31	7	132	67	54	1.15	2017
-장원준	두산	3.14	29	14	9	0	0	0.609	180 1/3	172	12	51	14	125	70	63	1.24	2017
-해커	NC	3.42	26	12	7	0	0	0.632	160 1/3	159	14	29	14	97	64	61	1.17	2017
-차우찬	LG	3.43	28	10	7	0	0	0.588	175 2/3	171	20	38	7	157	75	67	1.19	2017
-양현종	KIA	3.44	31	20	6	0	0	0.769	193 1/3	209	17	45	0	158	88	74	1.31	2017
-헥터	KIA	3.48	30	20	5	0	0	0.8	201 2/3	221	21	45	5	149	83	78	1.32	2017
-켈리	SK	3.6	30	16	7	0	0	0.696	190	204	16	45	11	189	85	76	1.31	2017
-박세웅	롯데	3.68	28	12	6	0	0	0.667	171 1/3	170	21	56	9	117	74	70	1.32	2017
-레일리	롯데	3.8	30	13	7	0	0	0.65	187 1/3	199	19	44	17	156	87	79	1.3	2017
-소사	LG	3.88	30	11	11	1	0	0.5	185 1/3	189	11	38	3	153	86	80	1.22	2017
-니퍼트	두산	4.06	30	14	8	0	0	0.636	179 2/3	175	20	77	10	161	88	81	1.4	2017
-박종훈	SK	4.1	29	12	7	0	1	0.632	151 1/3	145	16	61	25	107	74	69	1.36	2017
-팻딘	KIA	4.14	30	9	7	0	0	0.563	176	211	22	39	16	143	86	81	1.42	2017
-윤성환	삼성	4.28	28	12	9	0	0	0.571	174 1/3	181	22	37	15	130	86	83	1.25	2017
-브리검	넥센	4.38	24	10	6	0	0	0.625	144	166	17	26	13	98	77	70	1.33	2017
-최원태	넥센	4.46	25	11	7	0	0	0.611	149 1/3	161	19	34	12	126	76	74	1.31	2017
-유희관	두산	4.53	30	11	6	0	1	0.647	188 2/3	228	20	41	10	106	104	95	1.43	2017
-로치	KT	4.69	28	4	15	0	0	0.211	165	200	18	60	13	99	106	86	1.58	2017
-문승원	SK	5.33	29	6	12	0	0	0.333	155 1/3	181	25	54	11	86	98	92	1.51	2017
-니퍼트	두산	2.95	28	22	3	0	0	0.88	167 2/3	151	15	57	9	142	61	55	1.24	2016
-장원준	두산	3.32	27	15	6	0	0	0.714	168	161	14	76	9	137	66	62	1.41	2016
-헥터	KIA	3.4	31	15	5	0	0	0.75	206 2/3	211	7	51	6	139	88	78	1.27	2016
-켈리	SK	3.68	31	9	8	0	0	0.529	200 1/3	205	15	60	7	152	91	82	1.32	2016
-양현종	KIA	3.68	31	10	12	0	0	0.455	200 1/3	191	19	77	2	146	96	82	1.34	2016
-보우덴	두산	3.8	30	18	7	0	0	0.72	180	159	17	54	6	160	83	76	1.18	2016
-신재영	넥센	3.9	30	15	7	0	0	0.682	168 2/3	192	19	21	11	99	76	73	1.26	2016
-류제국	LG	4.3	29	13	11	0	0	0.542	161 1/3	152	14	70	21	138	83	77	1.38	2016
-레일리	롯데	4.34	31	8	10	0	0	0.444	184 2/3	207	21	51	17	147	105	89	1.4	2016
-윤성환	삼성	4.35	28	11	10	0	0	0.524	180	202	25	41	13	85	95	87	1.35	2016
-유희관	두산	4.41	30	15	6	0	0	0.714	185 2/3	212	22	58	6	102	95	91	1.45	2016
-피어밴드	KT	4.45	31	7	13	0	0	0.35	182	231	23	48	10	144	97	90	1.53	2016
-스튜어트	NC	4.56	27	12	8	0	0	0.6	150	160	11	55	8	118	79	76	1.43	2016
-차우찬	삼성	4.73	24	12	6	0	0	0.667	152 1/3	168	16	65	8	120	87	80	1.53	2016
-소사	LG	5.16	33	10	9	0	0	0.526	199	258	12	38	9	107	121	114	1.49	2016
-지크	KIA	5.27	30	10	13	0	0	0.435	152	188	16	68	5	125	104	89	1.68	2016
-린드블럼	롯데	5.28	30	10	13	0	0	0.435	177 1/3	197	28	77	9	148	109	104	1.55	2016
-양현종	KIA	2.44	32	15	6	0	1	0.714	184 1/3	150	18	78	7	157	52	50	1.24	2015
-해커	NC	3.13	31	19	5	0	0	0.792	204	174	14	36	25	164	81	71	1.03	2015
-피가로	삼성	3.38	25	13	7	0	0	0.65	165	154	16	51	7	117	66	62	1.24	2015
-우규민	LG	3.42	25	11	9	0	0	0.55	152 2/3	163	13	17	12	119	64	58	1.18	2015
-린드블럼	롯데	3.56	32	13	11	0	0	0.542	210	196	28	52	12	180	86	83	1.18	2015
-밴헤켄	넥센	3.62	32	15	8	0	0	0.652	196 2/3	190	14	67	1	193	92	79	1.31	2015
-김광현	SK	3.72	30	14	6	0	1	0.7	176 2/3	173	19	66	3	160	86	73	1.35	2015
-윤성환	삼성	3.76	30	17	8	0	0	0.68	194	199	27	30	10	164	86	81	1.18	2015
-레일리	롯데	3.91	31	11	9	0	0	0.55	179 1/3	182	20	57	15	134	93	78	1.33	2015
-유희관	두산	3.94	30	18	5	0	0	0.783	189 2/3	193	23	44	4	126	84	83	1.25	2015
-소사	LG	4.03	32	10	12	0	1	0.455	194 1/3	199	16	36	5	177	102	87	1.21	2015
-장원준	두산	4.08	30	12	12	0	0	0.5	169 2/3	182	13	68	14	128	86	77	1.47	2015
-켈리	SK	4.13	30	11	10	0	0	0.524	181	188	16	54	5	139	87	83	1.34	2015
-옥스프링	KT	4.48	31	12	10	0	0	0.545	185	200	23	66	10	142	104	92	1.44	2015
-피어밴드	넥센	4.67	30	13	11	0	0	0.542	177 1/3	202	23	61	12	137	101	92	1.48	2015
-탈보트	한화	4.72	30	10	11	0	0	0.476	156 1/3	153	11	85	13	120	93	82	1.52	2015
-차우찬	삼성	4.79	31	13	7	0	1	0.65	173	160	28	74	5	194	98	92	1.35	2015
-루카스	LG	4.93	33	10	11	0	1	0.476	171 2/3	175	11	108	14	151	103	94	1.65	2015
-스틴슨	KIA	4.96	32	11	10	0	0	0.524	167	190	15	64	14	93	100	92	1.52	2015
-클로이드	삼성	5.19	28	11	11	0	0	0.5	159 2/3	190	24	38	12	123	103	92	1.43	2015
 
-    """
+def crawl_schedule(start_date, days=1):
+    """start_date(datetime.date)부터 days일 동안의 경기 일정 DataFrame(date, time, away, home) 반환"""
+    end_date = start_date + datetime.timedelta(days=days - 1)
 
-    # 컬럼 이름 정의
-    hitter_columns = ['선수명', '팀명', 'AVG', 'G', 'PA', 'AB', 'R', 'H', '2B', '3B', 'HR', 'TB', 'RBI', 'SAC', 'SF', '연도']
-    pitcher_columns = ['선수명', '팀명', 'ERA', 'G', 'W', 'L', 'SV', 'HLD', 'WPCT', 'IP', 'H', 'HR', 'BB', 'HBP', 'SO', 'R',
-                       'ER', 'WHIP', '연도']
+    # 기간에 걸친 달의 일정을 모두 받아 날짜로 거름
+    months = pd.period_range(start_date, end_date, freq='M')
+    schedule = pd.concat([kbo_crawler.crawl_schedule(month.year, month.month) for month in months], ignore_index=True)
+    in_range = (schedule['date'] >= start_date.isoformat()) & (schedule['date'] <= end_date.isoformat())
+    return schedule[in_range].reset_index(drop=True)
 
-    # 데이터 로드
-    hitter_data_his = pd.read_csv(io.StringIO(hitter_historical_data), sep=r'\s+', header=None, names=hitter_columns,
-                                  engine='python')
-    pitcher_data_his = pd.read_csv(io.StringIO(pitcher_historical_data), sep='\t', header=None, names=pitcher_columns)
+def load_historical_data():
+    """역대 데이터 로드 (data/*_historical.tsv에서 빌드한 컬럼형 저장소를 메모리 맵으로 읽음)"""
+    hitter_data_his = historical_store.load_frame('hitter')
+    pitcher_data_his = historical_store.load_frame('pitcher')
 
     return hitter_data_his, pitcher_data_his
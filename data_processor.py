@@ -1,8 +1,17 @@
 import pandas as pd
 import numpy as np
+import datetime
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from joblib import Parallel, delayed
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import silhouette_score
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression, Ridge, Lasso, ElasticNet
@@ -12,280 +21,414 @@ from sklearn.svm import SVR
 from xgboost import XGBRegressor
 from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+import model_registry
+import schema_registry
+from instrumentation import span, traced
+
+
+# 전처리, 모델, 하이퍼파라미터를 바꾸면 이 버전을 올려야 이전 학습 결과를 재사용하지 않습니다.
+PIPELINE_VERSION = 4
+
+# 학습 결과 캐시 디렉터리 (프로세스가 재시작되어도 재사용)
+TRAINING_CACHE_DIR = os.getenv(
+    'TRAINING_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'training')
+)
+
+# 디스크 캐시에 종류별('hitter-result' 등)로 남길 최대 파일 수. 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+TRAINING_CACHE_KEEP_FILES = int(os.getenv('TRAINING_CACHE_KEEP_FILES', '7'))
+
+# 역대 데이터가 같을 때 변수 선택/군집 개수 결과를 재사용할 최대 기간(일). 지나면 전체를 다시 학습합니다.
+SELECTION_MAX_AGE_DAYS = int(os.getenv('SELECTION_MAX_AGE_DAYS', '7'))
+
+# 군집 개수 후보
+CLUSTER_RANGE = range(2, 11)
+
+# 군집 개수 탐색과 최종 학습(선택 캐시 재사용 시)에 같이 쓰는 KMeans 난수 시드
+CLUSTER_RANDOM_STATE = 42
+
+# 이 행 수를 넘으면 MiniBatchKMeans와 표본 실루엣 점수로 탐색 (그 이하는 기존과 같은 KMeans + 전체 실루엣)
+CLUSTER_LARGE_ROWS = int(os.getenv('CLUSTER_LARGE_ROWS', '5000'))
+CLUSTER_SILHOUETTE_SAMPLE_SIZE = int(os.getenv('CLUSTER_SILHOUETTE_SAMPLE_SIZE', '2000'))
+
+# k 후보를 동시에 학습할 작업 수 (-1: 모든 코어)
+CLUSTER_SEARCH_JOBS = int(os.getenv('CLUSTER_SEARCH_JOBS', '-1'))
+
+# 프로세스 내 캐시 (디스크 캐시보다 먼저 확인). 웹 프로세스는 오래 떠 있으므로 종류별('hitter-result' 등)로
+# 가장 최근 항목 하나만 남깁니다. 이전 입력의 결과가 다시 필요하면 디스크 캐시에서 읽습니다.
+_memory_cache = {}
+_memory_cache_lock = threading.Lock()
+
+
+def _frame_fingerprint(df):
+    """DataFrame의 컬럼명과 값으로 만든 해시"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in df.columns], ensure_ascii=False).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _cache_key(*parts):
+    return hashlib.sha256(json.dumps([PIPELINE_VERSION, *parts]).encode('utf-8')).hexdigest()[:32]
+
+
+def _cache_kind(name):
+    """캐시 이름('hitter-result-<키>')에서 종류('hitter-result')"""
+    return name.rsplit('-', 1)[0]
+
+
+def _remember(name, value):
+    """메모리 캐시에 저장하고 같은 종류의 이전 항목은 삭제"""
+    kind = _cache_kind(name)
+    with _memory_cache_lock:
+        for key in [key for key in _memory_cache if _cache_kind(key) == kind]:
+            del _memory_cache[key]
+        _memory_cache[name] = value
+
+
+def _load_cached(name):
+    """메모리 → 디스크 순서로 캐시된 학습 결과를 찾음 (없으면 None)"""
+    value = _memory_cache.get(name)
+    if value is not None:
+        return value
+    path = os.path.join(TRAINING_CACHE_DIR, name + '.pkl')
+    try:
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+        os.utime(path)  # 최근 사용 시각 갱신 (정리 순서에 사용)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    _remember(name, value)
+    return value
+
+
+def _save_cached(name, value):
+    _remember(name, value)
+    try:
+        os.makedirs(TRAINING_CACHE_DIR, exist_ok=True)
+        tmp_path = os.path.join(TRAINING_CACHE_DIR, f".{name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(TRAINING_CACHE_DIR, name + '.pkl'))
+    except OSError as e:
+        print(f"⚠️ 학습 결과 캐시 저장 실패 (메모리 캐시만 사용): {e}")
+        return
+    _prune_cached(_cache_kind(name))
+
+
+def _prune_cached(kind):
+    """디스크 캐시에서 kind 종류의 파일을 최근 사용한 TRAINING_CACHE_KEEP_FILES개만 남김"""
+    files = []
+    for file_name in os.listdir(TRAINING_CACHE_DIR):
+        if file_name.endswith('.pkl') and _cache_kind(file_name[:-len('.pkl')]) == kind:
+            path = os.path.join(TRAINING_CACHE_DIR, file_name)
+            try:
+                files.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+    for _, path in sorted(files)[:max(len(files) - TRAINING_CACHE_KEEP_FILES, 0)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _run_incremental(config, data_2025, data_his):
+    """입력 지문을 비교해 학습을 건너뛰거나 일부만 다시 학습
+
+    - 입력(역대 + 2025)이 이전과 같으면: 저장된 결과를 그대로 반환
+    - 2025 데이터만 바뀌었으면: 역대 데이터 기준으로 저장된 변수 선택/군집 개수를 재사용하고
+      그 결과에 의존하는 스케일러, KMeans, 예측 모델만 새 행으로 다시 학습
+    - 그 외: 전체 학습 후 결과를 저장
+    """
+    kind = config.kind
+    his_fingerprint = _frame_fingerprint(data_his)
+    result_name = f"{kind}-result-{_cache_key(kind, his_fingerprint, _frame_fingerprint(data_2025))}"
+    selection_name = f"{kind}-selection-{_cache_key(kind, his_fingerprint)}"
+
+    cached_result = _load_cached(result_name)
+    if cached_result is not None:
+        print(f"💾 {kind} 입력 데이터 변경 없음 - 학습 생략")
+        return cached_result.copy()
+
+    all_data = config.prepare(data_2025, data_his)
+
+    selection = _load_cached(selection_name)
+    if selection is not None and datetime.datetime.now() - selection['created_at'] > datetime.timedelta(days=SELECTION_MAX_AGE_DAYS):
+        selection = None
+    fitted_kmeans = None
+    if selection is None:
+        selection = _select_features(config, all_data)
+        fitted_kmeans = selection.pop('kmeans')
+        selection['created_at'] = datetime.datetime.now()
+        _save_cached(selection_name, selection)
+    else:
+        print(f"♻️ {kind} 2025 데이터만 변경 - 변수 선택/군집 개수 재사용 (k={selection['k']})")
+
+    predictions, artifacts = _fit_predict(config, all_data, selection, fitted_kmeans)
+    all_data[config.prediction_column] = predictions
+
+    # 학습된 모델은 버전별로 저장되어 예측 전용(predict_*_data)으로 재사용하거나 롤백할 수 있습니다.
+    try:
+        model_registry.save_artifacts(kind, artifacts, {
+            'pipeline_version': PIPELINE_VERSION,
+            'trained_at': datetime.datetime.now().isoformat(),
+            'historical_fingerprint': his_fingerprint,
+            'current_fingerprint': _frame_fingerprint(data_2025),
+            'rows': len(all_data),
+            'n': selection['n'],
+            'k': selection['k'],
+            'features': selection['top_n_features'],
+            'cluster_search': selection.get('cluster_search'),
+        })
+    except OSError as e:
+        print(f"⚠️ {kind} 모델 아티팩트 저장 실패: {e}")
+
+    _save_cached(result_name, all_data)
+    return all_data.copy()
+
+
+def _new_kmeans(n_clusters, n_rows, random_state):
+    """행 수에 따라 KMeans 또는 MiniBatchKMeans 생성"""
+    if n_rows > CLUSTER_LARGE_ROWS:
+        return MiniBatchKMeans(n_clusters=n_clusters, random_state=random_state, batch_size=1024, n_init=3)
+    return KMeans(n_clusters=n_clusters, random_state=random_state)
+
+
+def _fit_cluster_candidate(df_c, n_clusters):
+    """k 후보 하나를 학습하고 (모델, inertia, 실루엣 계수, 소요 시간) 반환"""
+    start = time.perf_counter()
+    kmeans = _new_kmeans(n_clusters, len(df_c), random_state=CLUSTER_RANDOM_STATE).fit(df_c)
+
+    # 행이 많으면 O(n²) 전체 실루엣 대신 표본으로 추정
+    sample_size = CLUSTER_SILHOUETTE_SAMPLE_SIZE if len(df_c) > CLUSTER_LARGE_ROWS else None
+    score = silhouette_score(df_c, kmeans.labels_, sample_size=sample_size, random_state=42)
+
+    return kmeans, kmeans.inertia_, score, time.perf_counter() - start
+
+
+@traced('kmeans_search')
+def _search_cluster_count(df_c):
+    """k 후보를 코어별로 병렬 학습하고 inertia와 실루엣 계수 평균 기준으로 최적 k 선택
+
+    (선택된 k, 그 KMeans 모델, k별 inertia/실루엣/소요 시간 목록) 반환
+    """
+    # KMeans와 실루엣 계산은 대부분 GIL 밖(OpenMP/NumPy)에서 실행되므로 스레드로 충분하고 데이터 복사도 없습니다.
+    results = Parallel(n_jobs=CLUSTER_SEARCH_JOBS, prefer='threads')(
+        delayed(_fit_cluster_candidate)(df_c, n_clusters) for n_clusters in CLUSTER_RANGE
+    )
+
+    inertia = [result[1] for result in results]
+    silhouette_scores = [result[2] for result in results]
 
+    # 두 지표의 평균을 사용하여 최적의 군집 개수 결정
+    average_scores = [(inertia[i] + silhouette_scores[i - 1]) / 2 for i in range(1, len(inertia))]
+    k = average_scores.index(min(average_scores)) + 2
 
-def process_hitter_data(hitter_data_2025, hitter_data_his):
-    """타자 데이터 처리"""
-    # 현재 데이터와 역대 데이터 합치기
-    all_hitter_data = pd.concat([hitter_data_his, hitter_data_2025], ignore_index=True)
-
-    # '순위', '선수명', '팀명' 컬럼을 제외한 나머지 컬럼을 실수형으로 변환
-    columns_to_convert = all_hitter_data.columns.difference(['선수명', '팀명', '연도'])
-
-    # 실수형으로 변환
-    all_hitter_data[columns_to_convert] = all_hitter_data[columns_to_convert].astype(float)
-
-    # OPS 계산
-    all_hitter_data['OBP'] = (all_hitter_data['H'] + all_hitter_data['RBI'] + all_hitter_data['SAC']) / (
-                all_hitter_data['AB'] + all_hitter_data['RBI'] + all_hitter_data['SAC'] + all_hitter_data['SF'])
-    all_hitter_data['SLG'] = all_hitter_data['TB'] / all_hitter_data['AB']
-    all_hitter_data['OPS'] = all_hitter_data['OBP'] + all_hitter_data['SLG']
-
-    # 선수명, 순위, 팀명 열 제거
-    X = all_hitter_data.drop(columns=['선수명', '팀명', '연도'])
-
-    # 데이터 표준화
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-
-    # PCA 수행
-    pca = PCA()
-    pca.fit(X_scaled)
-
-    # 주성분의 분산 비율
-    explained_variance = pca.explained_variance_ratio_
-    cumulative_variance = explained_variance.cumsum()
-
-    # 최적의 주성분 개수 판단 (90% 누적 분산 비율)
-    n = next(i for i, total in enumerate(cumulative_variance) if total >= 0.90) + 1
-
-    # 데이터 프레임에서 종속 변수와 독립 변수 분리
-    y = X['OPS']
-    X = X.drop(columns=['OPS', 'SLG', 'OBP'])
-
-    # 데이터 분할 (훈련 세트와 테스트 세트)
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-    # 랜덤 포레스트 모델 생성 및 훈련
-    model = RandomForestRegressor(n_estimators=100, random_state=42)
-    model.fit(X_train, y_train)
+    cluster_search = [
+        {'k': n_clusters, 'inertia': float(result[1]), 'silhouette': float(result[2]), 'seconds': round(result[3], 3)}
+        for n_clusters, result in zip(CLUSTER_RANGE, results)
+    ]
+    timings = ', '.join(f"k={item['k']}: {item['seconds']}s" for item in cluster_search)
+    method = 'MiniBatchKMeans, 표본 실루엣' if len(df_c) > CLUSTER_LARGE_ROWS else 'KMeans'
+    print(f"⏱️ 군집 개수 탐색 ({len(df_c)}행, {method}) → k={k} ({timings})")
 
-    # 변수 중요도 추출
-    importances = model.feature_importances_
-    indices = np.argsort(importances)[::-1]
+    return k, results[list(CLUSTER_RANGE).index(k)][0], cluster_search
 
-    # 변수 중요도 높은 순서대로 n개 까지 냅두고 다른 열은 삭제
-    top_n_features = X.columns[indices][:n]
-    X_reduced = X[top_n_features]
 
-    sc = StandardScaler()
-    df_scaled = sc.fit_transform(X_reduced)
-    df_scaled_df = pd.DataFrame(df_scaled, columns=X_reduced.columns)
-    df_c = df_scaled_df.dropna()
+@traced('prepare', kind='hitter')
+def _prepare_hitter_data(hitter_data_2025, hitter_data_his):
+    """타자 데이터 병합 및 OPS 계산 (컬럼 dtype은 schema_registry 계약을 따름)"""
+    # 현재 데이터와 역대 데이터 합치기
+    all_hitter_data = schema_registry.concat([hitter_data_his, hitter_data_2025], 'hitter')
 
-    # 군집 개수 범위 설정
-    range_n_clusters = range(2, 11)
+    # OPS 계산 (float64로 계산한 뒤 다른 비율 컬럼과 같은 float32로 저장)
+    h, ab = all_hitter_data['H'].astype(np.float64), all_hitter_data['AB'].astype(np.float64)
+    rbi, sac, sf = (all_hitter_data[c].astype(np.float64) for c in ('RBI', 'SAC', 'SF'))
+    obp = (h + rbi + sac) / (ab + rbi + sac + sf)
+    slg = all_hitter_data['TB'] / ab
+    all_hitter_data['OBP'] = obp.astype(np.float32)
+    all_hitter_data['SLG'] = slg.astype(np.float32)
+    all_hitter_data['OPS'] = (obp + slg).astype(np.float32)
 
-    # Elbow method와 실루엣 계수 저장을 위한 리스트 초기화
-    inertia = []
-    silhouette_scores = []
+    return all_hitter_data
 
-    # KMeans 클러스터링 수행
-    for n_clusters in range_n_clusters:
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        kmeans.fit(df_c)
 
-        # inertia (Elbow method)
-        inertia.append(kmeans.inertia_)
+@traced('prepare', kind='pitcher')
+def _prepare_pitcher_data(pitcher_data_2025, pitcher_data_his):
+    """투수 데이터 병합 (IP 변환과 dtype은 schema_registry 계약을 따름)"""
+    # 현재 데이터와 역대 데이터 합치기
+    return schema_registry.concat([pitcher_data_his, pitcher_data_2025], 'pitcher')
 
-        # 실루엣 계수
-        if n_clusters > 1:
-            score = silhouette_score(df_c, kmeans.labels_)
-            silhouette_scores.append(score)
-        else:
-            silhouette_scores.append(-1)
 
-    # 최적의 군집 개수 찾기
-    optimal_k_elbow = np.diff(inertia, 2).argmin() + 2
-    optimal_k_silhouette = silhouette_scores.index(max(silhouette_scores[1:])) + 2
+@dataclass(frozen=True)
+class PlayerModelConfig:
+    """선수 유형별 학습 설정. 타자/투수는 같은 학습 과정(_select_features, _fit_predict)을 공유합니다."""
+    kind: str
+    target: str
+    # 목표 값을 계산하는 데 쓰였거나 목표와 같은 정보를 담은 컬럼 (설명 변수에서 제외)
+    derived_columns: tuple
+    # (2025 데이터, 역대 데이터) -> 병합/변환된 전체 DataFrame
+    prepare: object
+    id_columns: tuple = ('선수명', '팀명', '연도')
 
-    # 두 지표의 평균을 사용하여 최적의 군집 개수 결정
-    average_scores = [(inertia[i] + silhouette_scores[i - 1]) / 2 for i in range(1, len(inertia))]
-    optimal_k_combined = average_scores.index(min(average_scores)) + 2
+    @property
+    def prediction_column(self):
+        return f"{self.target}_predict"
 
-    # 최적의 군집 개수를 변수 k에 저장
-    k = optimal_k_combined
+    @property
+    def drop_columns(self):
+        return [*self.id_columns, self.target, *self.derived_columns]
 
-    kmeans = KMeans(n_clusters=k, random_state=0, init='k-means++')
-    clusters = kmeans.fit(df_c)
 
-    # 클러스터링 결과 저장
-    df_c['cluster'] = clusters.labels_
-    df_c['선수명'] = all_hitter_data['선수명']
-    df_c['팀명'] = all_hitter_data['팀명']
-    df_c['OPS'] = all_hitter_data['OPS']
+HITTER = PlayerModelConfig(kind='hitter', target='OPS', derived_columns=('SLG', 'OBP'), prepare=_prepare_hitter_data)
+PITCHER = PlayerModelConfig(kind='pitcher', target='WHIP', derived_columns=('H', 'BB', 'IP'), prepare=_prepare_pitcher_data)
 
-    df_r = df_c.drop(columns=['선수명', '팀명'])
 
-    X = df_r.drop(['OPS'], axis=1)
-    y = df_r['OPS']
+def _scale_features(X):
+    """결측/무한값이 있는 행을 뺀 (스케일러, 표준화 행렬, 사용한 행 마스크) 반환"""
+    # StandardScaler는 inf(0으로 나눈 비율)를 받지 못하므로 학습 전에 행을 걸러냄
+    mask = np.isfinite(X).all(axis=1)
+    X = X[mask]
+    scaler = StandardScaler().fit(X)
+    return scaler, scaler.transform(X), mask
 
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-    # 모델 정의
-    models = {
-        'Random Forest Regression': RandomForestRegressor(n_estimators=100, random_state=42)
-    }
+def _with_cluster(scaled, labels):
+    """표준화 행렬 오른쪽에 군집 번호 열을 붙인 랜덤 포레스트 입력"""
+    return np.column_stack([scaled, labels.astype(np.float32)])
 
-    # 최적의 모델 학습
-    best_model = models['Random Forest Regression']
-    best_model.fit(X_train, y_train)
 
-    # 전체 데이터에 대한 예측
-    X_full = df_r.drop(['OPS'], axis=1)
-    y_full_pred = best_model.predict(X_full)
+def _select_features(config, all_data):
+    """PCA로 주성분 개수를 정하고, RF 변수 중요도 상위 변수와 최적 군집 개수 선택"""
+    # 학습은 float32 행렬 하나로 진행하고 컬럼 이름은 위치로만 참조 (중간 DataFrame 복사 없음)
+    numeric_columns = [c for c in all_data.columns if c not in config.id_columns]
+    X_all = all_data[numeric_columns].to_numpy(dtype=np.float32)
+    # 기록이 '-'(NaN)이거나 0으로 나눈 비율(inf)이 있는 행은 PCA와 변수 중요도 계산에서 제외
+    finite = np.isfinite(X_all).all(axis=1)
 
-    # 예측 결과를 DataFrame으로 변환
-    predictions_df = pd.DataFrame({
-        'Actual OPS': df_r['OPS'],
-        'Predicted OPS': y_full_pred
-    })
+    # 데이터 표준화 후 PCA 수행
+    X_scaled = StandardScaler().fit_transform(X_all[finite])
+    with span('pca', rows_in=len(X_scaled), kind=config.kind):
+        pca = PCA()
+        pca.fit(X_scaled)
+    del X_scaled
 
-    all_hitter_data['OPS_predict'] = predictions_df['Predicted OPS']
+    # 최적의 주성분 개수 판단 (90% 누적 분산 비율)
+    cumulative_variance = pca.explained_variance_ratio_.cumsum()
+    n = next(i for i, total in enumerate(cumulative_variance) if total >= 0.90) + 1
 
-    return all_hitter_data
+    # 종속 변수와 독립 변수 분리 (목표 값은 sklearn이 어차피 float64로 다루므로 float64 유지)
+    excluded = {config.target, *config.derived_columns}
+    feature_positions = [i for i, c in enumerate(numeric_columns) if c not in excluded]
+    X = X_all[:, feature_positions]
+    y = all_data[config.target].to_numpy(dtype=np.float64)
 
+    # 랜덤 포레스트 변수 중요도 (훈련 세트 기준)
+    X_train, X_test, y_train, y_test = train_test_split(X[finite], y[finite], test_size=0.2, random_state=42)
+    model = RandomForestRegressor(n_estimators=100, random_state=42)
+    with span('rf_fit', rows_in=len(X_train), kind=config.kind, phase='selection'):
+        model.fit(X_train, y_train)
 
-def process_pitcher_data(pitcher_data_2025, pitcher_data_his):
-    """투수 데이터 처리"""
-    # 현재 데이터와 역대 데이터 합치기
-    all_pitcher_data = pd.concat([pitcher_data_his, pitcher_data_2025], ignore_index=True)
-
-    # 'IP' 컬럼을 실수형으로 변환하는 함수 정의
-    def convert_ip_to_float(ip_str):
-        if isinstance(ip_str, (int, float)):
-            return float(ip_str)
-        ip_str = str(ip_str).strip()
-        if ' ' in ip_str:
-            parts = ip_str.split(' ')
-            whole = float(parts[0])
-            numerator, denominator = map(float, parts[1].split('/'))
-            return whole + numerator / denominator
-        elif '/' in ip_str:
-            numerator, denominator = map(float, ip_str.split('/'))
-            return numerator / denominator
-        else:
-            return float(ip_str)
-
-    # 'IP' 컬럼 변환
-    all_pitcher_data['IP'] = all_pitcher_data['IP'].apply(convert_ip_to_float)
-
-    # '순위', '선수명', '팀명' 컬럼을 제외한 나머지 컬럼을 실수형으로 변환
-    columns_to_convert = all_pitcher_data.columns.difference(['선수명', '팀명', '연도'])
-
-    # 실수형으로 변환
-    all_pitcher_data[columns_to_convert] = all_pitcher_data[columns_to_convert].astype(float)
-
-    # 선수명, 순위, 팀명 열 제거
-    X = all_pitcher_data.drop(columns=['선수명', '팀명', '연도'])
-
-    # 데이터 표준화
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-
-    # PCA 수행
-    pca = PCA()
-    pca.fit(X_scaled)
-
-    # 주성분의 분산 비율
-    explained_variance = pca.explained_variance_ratio_
-    cumulative_variance = explained_variance.cumsum()
+    # 변수 중요도 높은 순서대로 n개
+    indices = np.argsort(model.feature_importances_)[::-1][:n]
+    top_n_features = [numeric_columns[feature_positions[i]] for i in indices]
 
-    # 최적의 주성분 개수 판단 (90% 누적 분산 비율)
-    n = next(i for i, total in enumerate(cumulative_variance) if total >= 0.90) + 1
+    # 최적의 군집 개수 탐색 (선택된 k의 KMeans 모델은 최종 학습에서 그대로 재사용하므로 _fit_predict와 같은 행을 사용)
+    _, df_c, _ = _scale_features(X[:, indices])
+    k, kmeans, cluster_search = _search_cluster_count(df_c)
 
-    # 데이터 프레임에서 종속 변수와 독립 변수 분리
-    y = X['WHIP']
-    X = X.drop(columns=['WHIP', 'H', 'BB', 'IP'])
+    return {'n': n, 'top_n_features': top_n_features, 'k': k, 'kmeans': kmeans, 'cluster_search': cluster_search}
 
-    # 데이터 분할 (훈련 세트와 테스트 세트)
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-    # 랜덤 포레스트 모델 생성 및 훈련
-    model = RandomForestRegressor(n_estimators=100, random_state=42)
-    model.fit(X_train, y_train)
+def _fit_predict(config, all_data, selection, fitted_kmeans=None):
+    """선택된 변수와 군집 개수로 스케일러, KMeans, 랜덤 포레스트를 학습하고 (전체 예측값 배열, 모델 아티팩트) 반환
 
-    # 변수 중요도 추출
-    importances = model.feature_importances_
-    indices = np.argsort(importances)[::-1]
+    선택된 변수에 결측/무한값이 있는 행의 예측값은 NaN이고, 목표 값이 결측/무한인 행(타수 0인 타자 등)은
+    학습에서만 빼고 예측은 합니다.
+    """
+    sc, df_c, mask = _scale_features(all_data[selection['top_n_features']].to_numpy(dtype=np.float32))
 
-    # 변수 중요도 높은 순서대로 n개 까지 냅두고 다른 열은 삭제
-    top_n_features = X.columns[indices][:n]
-    X_reduced = X[top_n_features]
+    # 같은 데이터로 방금 탐색한 모델이 있으면 재사용하고, 없으면(2025 데이터만 바뀐 경우) k로 다시 학습
+    # 탐색과 같은 random_state를 써야 입력이 같을 때 선택 캐시 사용 여부와 관계없이 군집 번호(예측값)가 같습니다.
+    kmeans = fitted_kmeans
+    if kmeans is None:
+        with span('kmeans_fit', rows_in=len(df_c), kind=config.kind):
+            kmeans = _new_kmeans(selection['k'], len(df_c), random_state=CLUSTER_RANDOM_STATE).fit(df_c)
 
-    sc = StandardScaler()
-    df_scaled = sc.fit_transform(X_reduced)
-    df_scaled_df = pd.DataFrame(df_scaled, columns=X_reduced.columns)
-    df_c = df_scaled_df.dropna()
+    # 군집 번호를 설명 변수로 추가
+    X = _with_cluster(df_c, kmeans.labels_)
+    y = all_data[config.target].to_numpy(dtype=np.float64)[mask]
+    has_target = np.isfinite(y)
 
-    # 군집 개수 범위 설정
-    range_n_clusters = range(2, 11)
+    X_train, X_test, y_train, y_test = train_test_split(X[has_target], y[has_target], test_size=0.2, random_state=42)
 
-    # Elbow method와 실루엣 계수 저장을 위한 리스트 초기화
-    inertia = []
-    silhouette_scores = []
+    best_model = RandomForestRegressor(n_estimators=100, random_state=42)
+    with span('rf_fit', rows_in=len(X_train), kind=config.kind, phase='final'):
+        best_model.fit(X_train, y_train)
 
-    # KMeans 클러스터링 수행
-    for n_clusters in range_n_clusters:
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        kmeans.fit(df_c)
+    # 전체 데이터에 대한 예측
+    predictions = np.full(len(all_data), np.nan)
+    predictions[mask] = best_model.predict(X)
+
+    artifacts = {
+        'target': config.target,
+        'drop_columns': config.drop_columns,
+        'features': list(selection['top_n_features']),
+        'scaler': sc,
+        'kmeans': kmeans,
+        'model': best_model,
+    }
+    return predictions, artifacts
 
-        # inertia (Elbow method)
-        inertia.append(kmeans.inertia_)
 
-        # 실루엣 계수
-        if n_clusters > 1:
-            score = silhouette_score(df_c, kmeans.labels_)
-            silhouette_scores.append(score)
-        else:
-            silhouette_scores.append(-1)
+def _fitted_input(estimator, X, columns):
+    """PIPELINE_VERSION 3 이전 아티팩트(DataFrame으로 학습)는 같은 컬럼 이름의 DataFrame으로 전달"""
+    if hasattr(estimator, 'feature_names_in_'):
+        return pd.DataFrame(X, columns=columns)
+    return X
 
-    # 최적의 군집 개수 찾기
-    optimal_k_elbow = np.diff(inertia, 2).argmin() + 2
-    optimal_k_silhouette = silhouette_scores.index(max(silhouette_scores[1:])) + 2
 
-    # 두 지표의 평균을 사용하여 최적의 군집 개수 결정
-    average_scores = [(inertia[i] + silhouette_scores[i - 1]) / 2 for i in range(1, len(inertia))]
-    optimal_k_combined = average_scores.index(min(average_scores)) + 2
+def _predict_with_artifacts(all_data, artifacts):
+    """저장된 아티팩트로 학습 없이 예측 (스케일러 변환 → KMeans 군집 할당 → 랜덤 포레스트 예측)"""
+    features = artifacts['features']
+    X = all_data[features].to_numpy(dtype=np.float32)
 
-    # 최적의 군집 개수를 변수 k에 저장
-    k = optimal_k_combined
+    mask = np.isfinite(X).all(axis=1)
+    scaled = np.asarray(artifacts['scaler'].transform(_fitted_input(artifacts['scaler'], X[mask], features)))
+    # KMeans는 학습할 때와 같은 dtype(이전 아티팩트는 float64)만 받습니다.
+    df_c = scaled.astype(artifacts['kmeans'].cluster_centers_.dtype, copy=False)
+    labels = artifacts['kmeans'].predict(_fitted_input(artifacts['kmeans'], df_c, features))
+    X_r = _with_cluster(df_c, labels)
 
-    kmeans = KMeans(n_clusters=k, random_state=0, init='k-means++')
-    clusters = kmeans.fit(df_c)
+    predictions = np.full(len(all_data), np.nan)
+    predictions[mask] = artifacts['model'].predict(_fitted_input(artifacts['model'], X_r, [*features, 'cluster']))
+    return pd.Series(predictions, index=all_data.index)
 
-    # 클러스터링 결과 저장
-    df_c['cluster'] = clusters.labels_
-    df_c['선수명'] = all_pitcher_data['선수명']
-    df_c['팀명'] = all_pitcher_data['팀명']
-    df_c['WHIP'] = all_pitcher_data['WHIP']
 
-    df_r = df_c.drop(columns=['선수명', '팀명'])
+def process_hitter_data(hitter_data_2025, hitter_data_his):
+    """타자 데이터 처리 (입력이 바뀌지 않았으면 이전 학습 결과 재사용)"""
+    return _run_incremental(HITTER, hitter_data_2025, hitter_data_his)
 
-    X = df_r.drop(['WHIP'], axis=1)
-    y = df_r['WHIP']
 
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+def process_pitcher_data(pitcher_data_2025, pitcher_data_his):
+    """투수 데이터 처리 (입력이 바뀌지 않았으면 이전 학습 결과 재사용)"""
+    return _run_incremental(PITCHER, pitcher_data_2025, pitcher_data_his)
 
-    # 모델 정의
-    models = {
-        'Random Forest Regression': RandomForestRegressor(n_estimators=100, random_state=42)
-    }
 
-    # 최적의 모델 학습
-    best_model = models['Random Forest Regression']
-    best_model.fit(X_train, y_train)
+def _predict_from_registry(config, data_2025, data_his, version):
+    artifacts = model_registry.load_artifacts(config.kind, version)
+    if artifacts is None:
+        return None
+    all_data = config.prepare(data_2025, data_his)
+    all_data[config.prediction_column] = _predict_with_artifacts(all_data, artifacts)
+    return all_data
 
-    # 전체 데이터에 대한 예측
-    X_full = df_r.drop(['WHIP'], axis=1)
-    y_full_pred = best_model.predict(X_full)
 
-    # 예측 결과를 DataFrame으로 변환
-    predictions_df = pd.DataFrame({
-        'Actual WHIP': df_r['WHIP'],
-        'Predicted WHIP': y_full_pred
-    })
+def predict_hitter_data(hitter_data_2025, hitter_data_his, version=None):
+    """모델 저장소의 타자 모델(기본: 현재 버전)로 학습 없이 OPS 예측. 저장된 모델이 없으면 None"""
+    return _predict_from_registry(HITTER, hitter_data_2025, hitter_data_his, version)
 
-    all_pitcher_data['WHIP_predict'] = predictions_df['Predicted WHIP']
 
-    return all_pitcher_data
+def predict_pitcher_data(pitcher_data_2025, pitcher_data_his, version=None):
+    """모델 저장소의 투수 모델(기본: 현재 버전)로 학습 없이 WHIP 예측. 저장된 모델이 없으면 None"""
+    return _predict_from_registry(PITCHER, pitcher_data_2025, pitcher_data_his, version)
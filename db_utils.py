@@ -1,16 +1,59 @@
 # db_utils.py
 import os
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from dotenv import load_dotenv
 import datetime
+import threading
+from instrumentation import span
+from win_probability import WinProbabilityMatrix
 
 # .env 파일 로드는 이 스크립트가 독립적으로 실행될 때 필요할 수 있습니다.
 # GitHub Actions에서는 Secrets로 환경 변수를 직접 주입하므로 필수는 아니지만,
 # 로컬 개발 및 테스트를 위해 남겨두는 것이 좋습니다.
 load_dotenv()
 
+# to_sql이 한 번의 executemany로 보내는 행 수 (PyMySQL은 이를 여러 행 INSERT 문으로 묶어 전송)
+DB_CHUNK_SIZE = int(os.getenv('DB_CHUNK_SIZE', '1000'))
+
+# 스냅샷을 먼저 써 둘 임시 테이블 접미사 (다 쓴 뒤 원래 이름으로 교체)
+STAGING_SUFFIX = '__staging'
+
+# 예측 이력 보관 기간(일). 지난 이력은 삭제합니다 (MySQL은 월 파티션 단위로 DROP).
+HISTORY_RETENTION_DAYS = int(os.getenv('PREDICTION_HISTORY_RETENTION_DAYS', '730'))
+# 이 기간(일)이 지난 이력은 하루에 마지막 스냅샷 하나만 남기고 정리합니다 (같은 날 재실행분 제거).
+HISTORY_COMPACT_AFTER_DAYS = int(os.getenv('PREDICTION_HISTORY_COMPACT_AFTER_DAYS', '14'))
+# 한 번 정리할 때 확인하는 기간(일). 이미 정리된 오래된 구간은 다시 훑지 않습니다.
+HISTORY_COMPACT_WINDOW_DAYS = 7
+
+# 추가만 하는 예측 이력 테이블 (현재 테이블은 최신 스냅샷 보기로 유지)
+# 기본 키 (prediction_date, ...)가 시점 조회용 인덱스 역할을 합니다.
+HISTORY_TABLES = {
+    'win_probability_history': {
+        'columns': [('prediction_date', None), ('team1', 'VARCHAR(20) NOT NULL'), ('team2', 'VARCHAR(20) NOT NULL'),
+                    ('win_probability', 'DOUBLE NULL')],
+        'primary_key': ['prediction_date', 'team1', 'team2'],
+    },
+    'team_ranking_history': {
+        'columns': [('prediction_date', None), ('`rank`', 'INTEGER NOT NULL'), ('team_name', 'VARCHAR(20) NOT NULL'),
+                    ('predicted_ops', 'DOUBLE NULL'), ('predicted_whip', 'DOUBLE NULL'), ('ops_minus_whip', 'DOUBLE NULL')],
+        'primary_key': ['prediction_date', '`rank`'],
+    },
+}
+
+# 프로세스 전체에서 공유하는 엔진 (커넥션 풀 포함)
+_engine = None
+_engine_lock = threading.Lock()
+
 def get_db_engine():
+    """DB 연결을 위한 SQLAlchemy 엔진 반환 (프로세스당 한 번 생성해 커넥션 풀을 공유)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = _create_db_engine()
+        return _engine
+
+def _create_db_engine():
     """DB 연결을 위한 SQLAlchemy 엔진 생성"""
     # 환경 변수 'DB_URI'에서 DB 연결 문자열을 가져옵니다.
     # 환경 변수가 설정되지 않았을 경우를 대비하여 기본값(하드코딩된 값)을 제공합니다.
@@ -40,91 +83,255 @@ def get_db_engine():
     if not db_uri:
         raise ValueError("DB URI 환경 변수 (DB_URI)가 설정되지 않았습니다.")
 
-    engine = create_engine(db_uri)
+    # pool_pre_ping: RDS가 유휴 연결을 끊어도 풀에서 꺼낼 때 확인 후 재연결
+    engine = create_engine(db_uri, pool_pre_ping=True, pool_recycle=3600)
     return engine
 
+def _replace_table(engine, table_name, df):
+    """df를 임시 테이블에 모두 쓴 뒤 원래 테이블과 원자적으로 교체 (읽는 쪽은 이전 또는 새 데이터 전체만 봄)
+
+    DB별 보장:
+    - MySQL: RENAME TABLE 한 문장으로 두 이름을 함께 바꿉니다. 읽는 쪽은 교체 중 잠시 대기한 뒤 새 테이블을 봅니다.
+    - PostgreSQL: DROP과 ALTER TABLE ... RENAME이 한 트랜잭션으로 커밋됩니다 (DDL도 트랜잭션 처리).
+      읽는 쪽은 테이블 잠금을 기다린 뒤 새 테이블을 봅니다.
+    - SQLite: BEGIN IMMEDIATE로 쓰기 잠금을 잡고 DROP과 RENAME을 한 트랜잭션으로 커밋합니다.
+      읽는 쪽은 커밋 전까지 이전 테이블(WAL) 또는 잠금 대기(rollback journal) 상태이고, 테이블이 없는 순간은 보지 않습니다.
+    """
+    with span('db_write', rows_in=len(df), table=table_name, mode='replace') as current:
+        staging_name = table_name + STAGING_SUFFIX
+        exists = inspect(engine).has_table(table_name)
+
+        # 1. 임시 테이블에 새 데이터 저장 (MySQL은 기존 테이블의 컬럼 타입/인덱스를 그대로 복사)
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {staging_name}"))
+            if exists and engine.dialect.name == 'mysql':
+                connection.execute(text(f"CREATE TABLE {staging_name} LIKE {table_name}"))
+        # method='multi'(SQLAlchemy가 VALUES 목록을 직접 컴파일)는 드라이버 executemany보다 훨씬 느려 기본 방식을 사용합니다.
+        df.to_sql(staging_name, con=engine, if_exists='append', index=False, chunksize=DB_CHUNK_SIZE)
+
+        # 2. 교체
+        if engine.dialect.name == 'mysql':
+            # RENAME TABLE은 여러 테이블 이름을 한 번에 원자적으로 바꿉니다.
+            with engine.begin() as connection:
+                if exists:
+                    old_name = table_name + '__old'
+                    connection.execute(text(f"DROP TABLE IF EXISTS {old_name}"))
+                    connection.execute(text(f"RENAME TABLE {table_name} TO {old_name}, {staging_name} TO {table_name}"))
+                    connection.execute(text(f"DROP TABLE {old_name}"))
+                else:
+                    connection.execute(text(f"RENAME TABLE {staging_name} TO {table_name}"))
+        else:
+            with engine.begin() as connection:
+                if engine.dialect.name == 'sqlite':
+                    # pysqlite(기본 트랜잭션 처리)는 DML 앞에서만 BEGIN을 보내고 DDL은 문장마다 바로 커밋하므로,
+                    # 직접 BEGIN을 보내 삭제와 이름 변경을 한 트랜잭션으로 묶습니다 (커밋/롤백은 engine.begin()이 처리).
+                    connection.exec_driver_sql("BEGIN IMMEDIATE")
+                connection.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+                connection.execute(text(f"ALTER TABLE {staging_name} RENAME TO {table_name}"))
+        current.rows_out = len(df)
+
+def _ensure_history_table(engine, table_name):
+    """이력 테이블이 없으면 생성. MySQL은 prediction_date 기준 월별 RANGE 파티션 테이블로 만듭니다."""
+    spec = HISTORY_TABLES[table_name]
+    is_mysql = engine.dialect.name == 'mysql'
+    # 날짜는 'YYYY-MM-DD HH:MM:SS' 형식이라 SQLite에서는 문자열 비교로도 시간 순서가 유지됩니다.
+    date_type = 'DATETIME NOT NULL' if is_mysql else 'TEXT NOT NULL'
+    columns = ', '.join(f"{name} {column_type or date_type}" for name, column_type in spec['columns'])
+    statement = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns}, PRIMARY KEY ({', '.join(spec['primary_key'])}))"
+    if is_mysql:
+        # 처음에는 MAXVALUE 파티션 하나로 시작하고, 저장할 때마다 필요한 월 파티션을 분리합니다.
+        statement += " PARTITION BY RANGE (TO_DAYS(prediction_date)) (PARTITION pmax VALUES LESS THAN MAXVALUE)"
+    with engine.begin() as connection:
+        connection.execute(text(statement))
+
+def _month_start(date):
+    return datetime.datetime(date.year, date.month, 1)
+
+def _next_month(date):
+    return _month_start(_month_start(date) + datetime.timedelta(days=32))
+
+def _history_partitions(connection, table_name):
+    """MySQL 이력 테이블의 파티션 이름 목록"""
+    return [row[0] for row in connection.execute(
+        text("SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+             "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND PARTITION_NAME IS NOT NULL"),
+        {'table_name': table_name},
+    )]
+
+def _maintain_mysql_partitions(engine, table_name, now):
+    """이번 달과 다음 달 파티션을 미리 만들고, 보관 기간이 지난 월 파티션은 통째로 삭제"""
+    with engine.begin() as connection:
+        partitions = _history_partitions(connection, table_name)
+        for month in (_month_start(now), _next_month(now)):
+            name = month.strftime('p%Y%m')
+            if name in partitions:
+                continue
+            # pmax를 [해당 월, pmax]로 분리. 월 파티션은 항상 증가하는 순서로 추가됩니다.
+            connection.execute(text(
+                f"ALTER TABLE {table_name} REORGANIZE PARTITION pmax INTO ("
+                f"PARTITION {name} VALUES LESS THAN (TO_DAYS('{_next_month(month):%Y-%m-%d}')), "
+                f"PARTITION pmax VALUES LESS THAN MAXVALUE)"
+            ))
+            partitions.append(name)
+
+        cutoff = now - datetime.timedelta(days=HISTORY_RETENTION_DAYS)
+        expired = [name for name in partitions if name != 'pmax'
+                   and _next_month(datetime.datetime.strptime(name, 'p%Y%m')) <= _month_start(cutoff)]
+        if expired:
+            connection.execute(text(f"ALTER TABLE {table_name} DROP PARTITION {', '.join(expired)}"))
+            print(f"🧹 '{table_name}' 보관 기간이 지난 파티션 삭제: {', '.join(expired)}")
+
+def _compact_history(engine, table_name, now):
+    """보관 기간이 지난 이력 삭제, 정리 기간이 지난 날짜는 하루의 마지막 스냅샷만 유지"""
+    fmt = '%Y-%m-%d %H:%M:%S'
+    compact_before = (now - datetime.timedelta(days=HISTORY_COMPACT_AFTER_DAYS)).replace(hour=0, minute=0, second=0, microsecond=0)
+    params = {
+        'window_start': (compact_before - datetime.timedelta(days=HISTORY_COMPACT_WINDOW_DAYS)).strftime(fmt),
+        'compact_before': compact_before.strftime(fmt),
+        'retention_cutoff': (now - datetime.timedelta(days=HISTORY_RETENTION_DAYS)).strftime(fmt),
+    }
+    with engine.begin() as connection:
+        if engine.dialect.name != 'mysql':
+            # MySQL은 파티션 DROP으로 처리 (_maintain_mysql_partitions)
+            connection.execute(text(f"DELETE FROM {table_name} WHERE prediction_date < :retention_cutoff"), params)
+        # MySQL은 DELETE 대상 테이블을 바로 서브쿼리에서 읽을 수 없어 파생 테이블로 한 번 감쌉니다.
+        result = connection.execute(text(
+            f"DELETE FROM {table_name} "
+            f"WHERE prediction_date >= :window_start AND prediction_date < :compact_before "
+            f"AND prediction_date NOT IN (SELECT keep_date FROM ("
+            f"SELECT MAX(prediction_date) AS keep_date FROM {table_name} "
+            f"WHERE prediction_date >= :window_start AND prediction_date < :compact_before "
+            f"GROUP BY DATE(prediction_date)) AS keep_dates)"
+        ), params)
+        if result.rowcount:
+            print(f"🧹 '{table_name}' 같은 날 중복 스냅샷 {result.rowcount}건 정리")
+
+def _append_history(engine, table_name, df):
+    """스냅샷을 이력 테이블에 추가 (기존 이력은 그대로 두고 보관/정리 정책 적용)"""
+    with span('db_write', rows_in=len(df), table=table_name, mode='append') as current:
+        _ensure_history_table(engine, table_name)
+        now = datetime.datetime.now()
+        if engine.dialect.name == 'mysql':
+            _maintain_mysql_partitions(engine, table_name, now)
+
+        columns = [name.strip('`') for name, _ in HISTORY_TABLES[table_name]['columns']]
+        df[columns].to_sql(table_name, con=engine, if_exists='append', index=False, chunksize=DB_CHUNK_SIZE)
+        _compact_history(engine, table_name, now)
+        current.rows_out = len(df)
+
 def save_hitter_data(hitter_df):
-    """타자 데이터를 DB에 저장 (기존 데이터 삭제 후)"""
+    """타자 데이터를 DB에 저장 (기존 테이블을 새 데이터로 교체)"""
     try:
         engine = get_db_engine()
         table_name = 'hitter_data'
 
-        # 1. 기존 데이터 삭제
-        with engine.connect() as connection:
-            connection.execute(text(f"TRUNCATE TABLE {table_name};"))
-            connection.commit()
-        print(f"✅ 기존 '{table_name}' 테이블의 모든 데이터가 삭제되었습니다.")
-
-        # 2. 새로운 데이터 저장
-        hitter_df.to_sql(table_name, con=engine, if_exists='append', index=False)
+        # 임시 테이블에 저장한 뒤 기존 테이블과 교체
+        _replace_table(engine, table_name, hitter_df)
         print(f"✅ 타자 데이터 {len(hitter_df)}건이 '{table_name}' 테이블에 성공적으로 저장되었습니다.")
     except Exception as e:
         print(f"❌ 타자 데이터 DB 저장 중 오류 발생: {e}")
 
 def save_pitcher_data(pitcher_df):
-    """투수 데이터를 DB에 저장 (기존 데이터 삭제 후)"""
+    """투수 데이터를 DB에 저장 (기존 테이블을 새 데이터로 교체)"""
     try:
         engine = get_db_engine()
         table_name = 'pitcher_data'
 
-        # 1. 기존 데이터 삭제
-        with engine.connect() as connection:
-            connection.execute(text(f"TRUNCATE TABLE {table_name};"))
-            connection.commit()
-        print(f"✅ 기존 '{table_name}' 테이블의 모든 데이터가 삭제되었습니다.")
-
-        # 2. 새로운 데이터 저장
-        pitcher_df.to_sql(table_name, con=engine, if_exists='append', index=False)
+        # 임시 테이블에 저장한 뒤 기존 테이블과 교체
+        _replace_table(engine, table_name, pitcher_df)
         print(f"✅ 투수 데이터 {len(pitcher_df)}건이 '{table_name}' 테이블에 성공적으로 저장되었습니다.")
     except Exception as e:
         print(f"❌ 투수 데이터 DB 저장 중 오류 발생: {e}")
 
-def save_win_probabilities(win_probability_df):
-    """승률 예측 DataFrame을 DB에 저장 (기존 데이터 삭제 후)"""
+def save_win_probabilities(win_probability):
+    """승률 예측 결과(WinProbabilityMatrix 또는 DataFrame)를 DB에 저장 (기존 테이블을 새 데이터로 교체)"""
     try:
         engine = get_db_engine()
-
-        # 1. 기존 데이터 삭제
         table_name = 'win_probabilities'
-        with engine.connect() as connection:
-            connection.execute(text(f"TRUNCATE TABLE {table_name};"))
-            connection.commit()
-        print(f"✅ 기존 '{table_name}' 테이블의 모든 데이터가 삭제되었습니다.")
-
-        # DataFrame을 DB에 저장하기 좋은 긴 형식(long format)으로 변환
-        # 인덱스(team1)를 리셋하여 컬럼으로 만듭니다.
-        long_format_df = win_probability_df.reset_index().melt(
-            id_vars=['index'], var_name='team2', value_name='win_probability'
-        )
-        long_format_df = long_format_df.rename(columns={'index': 'team1'})
 
-        # 데이터 타입 변환 및 예측 날짜 추가
-        long_format_df['win_probability'] = pd.to_numeric(long_format_df['win_probability'], errors='coerce') # '-' 값 처리
+        # DB에 저장하기 좋은 긴 형식(long format: team1, team2, win_probability)으로 변환
+        # 기존 DataFrame 형식('-' 문자열 포함)도 받을 수 있도록 행렬로 변환 후 처리합니다.
+        if not isinstance(win_probability, WinProbabilityMatrix):
+            win_probability = WinProbabilityMatrix.from_frame(win_probability)
+        long_format_df = win_probability.to_long_frame()
+
+        # 예측 날짜 추가
         long_format_df['prediction_date'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        # 2. 새로운 데이터 저장
-        long_format_df.to_sql(table_name, con=engine, if_exists='append', index=False)
+        # 임시 테이블에 저장한 뒤 기존 테이블과 교체
+        _replace_table(engine, table_name, long_format_df)
         print(f"✅ 승률 예측 결과 {len(long_format_df)}건이 '{table_name}' 테이블에 성공적으로 저장되었습니다.")
+
+        # 3. 이력 테이블에 추가 (지난 예측 조회용)
+        _append_history(engine, 'win_probability_history', long_format_df)
     except Exception as e:
         print(f"❌ 승률 예측 결과 DB 저장 중 오류 발생: {e}")
 
 def save_team_rankings(team_rankings_df):
-    """팀 순위 예측 DataFrame을 DB에 저장 (기존 데이터 삭제 후)"""
+    """팀 순위 예측 DataFrame을 DB에 저장 (기존 테이블을 새 데이터로 교체)"""
     try:
         engine = get_db_engine()
-
-        # 1. 기존 데이터 삭제
         table_name = 'team_rankings'
-        with engine.connect() as connection:
-            connection.execute(text(f"TRUNCATE TABLE {table_name};"))
-            connection.commit()
-        print(f"✅ 기존 '{table_name}' 테이블의 모든 데이터가 삭제되었습니다.")
 
         # 예측 날짜 추가
         team_rankings_df['prediction_date'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        # 2. 새로운 데이터 저장
-        team_rankings_df.to_sql(table_name, con=engine, if_exists='append', index=False)
+        # 임시 테이블에 저장한 뒤 기존 테이블과 교체
+        _replace_table(engine, table_name, team_rankings_df)
         print(f"✅ 팀 순위 예측 결과 {len(team_rankings_df)}건이 '{table_name}' 테이블에 성공적으로 저장되었습니다.")
+
+        # 3. 이력 테이블에 추가 (지난 예측 조회용)
+        _append_history(engine, 'team_ranking_history', team_rankings_df)
     except Exception as e:
         print(f"❌ 팀 순위 예측 결과 DB 저장 중 오류 발생: {e}")
+
+
+def _snapshot_tables(engine):
+    """스냅샷을 읽을 (승률, 팀 순위) 테이블. 이력 테이블이 아직 없는 DB는 현재 테이블을 사용"""
+    if inspect(engine).has_table('win_probability_history') and inspect(engine).has_table('team_ranking_history'):
+        return 'win_probability_history', 'team_ranking_history'
+    return 'win_probabilities', 'team_rankings'
+
+def _snapshot_date_query(table_name, as_of):
+    """가장 최근(as_of가 있으면 그 시점 이전) prediction_date. (prediction_date, ...) 인덱스로 O(log n)에 찾습니다."""
+    if as_of is None:
+        return f"SELECT MAX(prediction_date) FROM {table_name}"
+    return f"SELECT MAX(prediction_date) FROM {table_name} WHERE prediction_date <= :as_of"
+
+def get_latest_prediction_date(engine=None):
+    """가장 최근 승률 예측의 prediction_date 조회 (새 스냅샷 여부를 싸게 확인하는 용도)"""
+    engine = engine or get_db_engine()
+    win_probability_table, _ = _snapshot_tables(engine)
+    with engine.connect() as connection:
+        return connection.execute(text(_snapshot_date_query(win_probability_table, None))).scalar()
+
+def load_prediction_snapshot(engine=None, as_of=None):
+    """저장된 승률/팀 순위 스냅샷을 DB에서 읽어 (prediction_date, WinProbabilityMatrix, 팀 순위 DataFrame) 반환
+
+    as_of('YYYY-MM-DD HH:MM:SS')를 주면 그 시점에 최신이었던 스냅샷을 반환합니다.
+    """
+    engine = engine or get_db_engine()
+    win_probability_table, team_rankings_table = _snapshot_tables(engine)
+    params = {} if as_of is None else {'as_of': str(as_of)}
+    with engine.connect() as connection:
+        # 두 테이블은 저장 시각이 몇 초씩 다르므로 각 테이블의 최신 prediction_date를 따로 사용합니다.
+        win_probability_long_df = pd.read_sql(
+            text(f"SELECT team1, team2, win_probability, prediction_date FROM {win_probability_table} "
+                 f"WHERE prediction_date = ({_snapshot_date_query(win_probability_table, as_of)})"),
+            connection, params=params
+        )
+        team_rankings_df = pd.read_sql(
+            text(f"SELECT `rank`, team_name, predicted_ops, predicted_whip, ops_minus_whip, prediction_date "
+                 f"FROM {team_rankings_table} "
+                 f"WHERE prediction_date = ({_snapshot_date_query(team_rankings_table, as_of)}) ORDER BY `rank`"),
+            connection, params=params
+        )
+
+    if win_probability_long_df.empty:
+        raise ValueError("DB에 저장된 승률 예측 스냅샷이 없습니다.")
+
+    prediction_date = win_probability_long_df['prediction_date'].iloc[0]
+    win_probability_matrix = WinProbabilityMatrix.from_long_frame(win_probability_long_df)
+    team_rankings_df = team_rankings_df.drop(columns=['prediction_date'])
+    print(f"✅ DB 스냅샷 로드 완료 (prediction_date: {prediction_date}, 팀 {len(win_probability_matrix)}개)")
+    return prediction_date, win_probability_matrix, team_rankings_df
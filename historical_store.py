@@ -0,0 +1,149 @@
+# historical_store.py
+# 역대 시즌 기록 저장소
+#
+# 원본은 data/*_historical.tsv 텍스트이고, 빌드 단계에서 컬럼별 .npy 파일(숫자형)과
+# 사전 인코딩(코드 .npy + 값 목록) 컬럼으로 변환해 data/historical/<유형>/에 저장합니다.
+# 로드 시에는 .npy를 메모리 맵으로 열고 프로세스당 한 번만 읽습니다.
+# meta.json의 원본 체크섬이 원본 파일과 다르면(원본 수정) 자동으로 다시 빌드합니다.
+#
+# 수동 빌드: python historical_store.py
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import schema_registry
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+STORE_DIR = os.path.join(DATA_DIR, 'historical')
+
+# 저장 형식이나 schema_registry의 계약이 바뀌면 올려서 기존 빌드를 무효화합니다.
+STORE_VERSION = 2
+
+SOURCES = {
+    'hitter': {
+        'path': os.path.join(DATA_DIR, 'hitter_historical.tsv'),
+        'columns': schema_registry.column_names('hitter'),
+        'read_csv': {'sep': r'\s+', 'engine': 'python'},
+    },
+    'pitcher': {
+        'path': os.path.join(DATA_DIR, 'pitcher_historical.tsv'),
+        'columns': schema_registry.column_names('pitcher'),
+        'read_csv': {'sep': '\t'},
+    },
+}
+
+
+def _source_checksum(kind):
+    with open(SOURCES[kind]['path'], 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _read_source(kind):
+    """원본 텍스트를 DataFrame으로 파싱하고 컬럼 계약(schema_registry) 적용"""
+    source = SOURCES[kind]
+    df = pd.read_csv(source['path'], header=None, names=source['columns'], **source['read_csv'])
+    return schema_registry.apply(df, kind)
+
+
+def _encode(df, checksum):
+    """DataFrame을 (컬럼 배열 dict, meta) 형태로 변환. 문자열 컬럼은 사전 인코딩"""
+    arrays = {}
+    columns = []
+    for i, name in enumerate(df.columns):
+        file_stem = f"c{i:02d}"
+        series = df[name]
+        if series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype):
+            codes, categories = pd.factorize(series, sort=True)
+            arrays[file_stem] = codes.astype(np.int32)
+            columns.append({'name': name, 'file': file_stem, 'encoding': 'dictionary', 'categories': categories.tolist()})
+        else:
+            arrays[file_stem] = series.to_numpy()
+            columns.append({'name': name, 'file': file_stem, 'encoding': 'plain'})
+
+    meta = {'store_version': STORE_VERSION, 'source_sha256': checksum, 'rows': len(df), 'columns': columns}
+    return arrays, meta
+
+
+def build(kind):
+    """원본 텍스트에서 컬럼형 저장소를 다시 생성하고 저장 경로 반환"""
+    checksum = _source_checksum(kind)
+    arrays, meta = _encode(_read_source(kind), checksum)
+
+    # 임시 디렉터리에 모두 쓴 뒤 교체하여, 동시에 로드하는 프로세스가 반쯤 쓰인 저장소를 보지 않도록 합니다.
+    os.makedirs(STORE_DIR, exist_ok=True)
+    target = os.path.join(STORE_DIR, kind)
+    tmp_dir = tempfile.mkdtemp(prefix=f'.{kind}-', dir=STORE_DIR)
+    try:
+        for file_stem, values in arrays.items():
+            np.save(os.path.join(tmp_dir, file_stem + '.npy'), values, allow_pickle=False)
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        old_dir = None
+        if os.path.exists(target):
+            old_dir = tempfile.mkdtemp(prefix=f'.{kind}-old-', dir=STORE_DIR)
+            os.replace(target, os.path.join(old_dir, kind))
+        os.replace(tmp_dir, target)
+        if old_dir is not None:
+            shutil.rmtree(old_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    print(f"✅ 역대 {kind} 데이터 저장소 빌드 완료 ({meta['rows']}행)")
+    return target
+
+
+def _read_meta(kind):
+    try:
+        with open(os.path.join(STORE_DIR, kind, 'meta.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_columns(kind):
+    """컬럼 배열을 메모리 맵으로 로드 (프로세스당 한 번). 빌드가 없거나 오래되었으면 먼저 빌드"""
+    checksum = _source_checksum(kind)
+    meta = _read_meta(kind)
+    if meta is None or meta.get('store_version') != STORE_VERSION or meta.get('source_sha256') != checksum:
+        try:
+            build(kind)
+        except OSError as e:
+            # 읽기 전용 배포 환경 등에서 빌드를 쓸 수 없으면 원본을 메모리에서 바로 변환
+            print(f"⚠️ 역대 {kind} 데이터 저장소를 빌드할 수 없어 원본에서 직접 로드합니다: {e}")
+            arrays, meta = _encode(_read_source(kind), checksum)
+            return meta, arrays
+        meta = _read_meta(kind)
+
+    directory = os.path.join(STORE_DIR, kind)
+    arrays = {
+        column['file']: np.load(os.path.join(directory, column['file'] + '.npy'), mmap_mode='r', allow_pickle=False)
+        for column in meta['columns']
+    }
+    return meta, arrays
+
+
+def load_frame(kind):
+    """역대 기록 DataFrame 반환 (문자열 컬럼은 category 타입)"""
+    meta, arrays = _load_columns(kind)
+    data = {}
+    for column in meta['columns']:
+        values = arrays[column['file']]
+        if column['encoding'] == 'dictionary':
+            data[column['name']] = pd.Categorical.from_codes(np.asarray(values), categories=column['categories'])
+        else:
+            data[column['name']] = np.asarray(values)
+    return pd.DataFrame(data)
+
+
+if __name__ == '__main__':
+    for source_kind in SOURCES:
+        build(source_kind)
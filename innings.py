@@ -0,0 +1,78 @@
+# innings.py
+# 투구 이닝(IP) 문자열을 실수로 변환 (pandas 문자열 연산 한 번으로 벡터화)
+#
+# 지원 형식: "157" (정수), "149 1/3" (대분수), "2/3" (분수), "149.1" / "149.2" (KBO 표기: .1 = 1/3, .2 = 2/3)
+# 이미 숫자인 값(크롤러가 변환한 값 등)은 그대로 사용합니다.
+import re
+
+import numpy as np
+import pandas as pd
+
+_IP_PATTERN = re.compile(
+    r'^(?:(?P<whole>\d+)(?:\s+(?P<num>\d+)/(?P<den>\d+)|\.(?P<outs>[0-2]))?'
+    r'|(?P<frac_num>\d+)/(?P<frac_den>\d+))$'
+)
+
+# 오류 메시지에 보여줄 잘못된 값의 최대 개수
+MAX_REPORTED_VALUES = 10
+
+
+class InningsParseError(ValueError):
+    """해석할 수 없는 이닝 값들. invalid는 {인덱스: 원래 값} 형태의 Series"""
+
+    def __init__(self, invalid):
+        self.invalid = invalid
+        shown = ', '.join(f"{index}: {value!r}" for index, value in invalid.head(MAX_REPORTED_VALUES).items())
+        more = f" 외 {len(invalid) - MAX_REPORTED_VALUES}개" if len(invalid) > MAX_REPORTED_VALUES else ''
+        super().__init__(f"이닝 값 {len(invalid)}개를 해석할 수 없습니다: {shown}{more}")
+
+    def __reduce__(self):
+        # 프로세스 풀 단계에서 발생해도 부모 프로세스로 그대로 전달되도록 (기본 pickle은 메시지로 __init__을 호출함)
+        return type(self), (self.invalid,)
+
+
+def parse_innings(values, errors='raise'):
+    """IP 값을 float64 Series(같은 인덱스)로 변환
+
+    잘못된 값은 모두 모아서 errors='raise'면 InningsParseError 한 번으로, 'coerce'면 NaN으로 처리합니다.
+    결측값(None/NaN)은 오류 없이 NaN입니다.
+    """
+    if errors not in ('raise', 'coerce'):
+        raise ValueError(f"errors는 'raise' 또는 'coerce'여야 합니다: {errors!r}")
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.float64)
+
+    # 같은 이닝 값이 많이 반복되므로 고유값만 해석한 뒤 코드로 펼칩니다 (결측값 코드는 -1).
+    codes, uniques = pd.factorize(values)
+    parsed, bad_unique = _parse_unique(pd.Series(uniques, dtype=object))
+    result = pd.Series(np.append(parsed, np.nan)[codes], index=values.index)
+    bad = pd.Series(np.append(bad_unique, False)[codes], index=values.index)
+
+    if bad.any():
+        if errors == 'raise':
+            raise InningsParseError(values[bad])
+        print(f"⚠️ {InningsParseError(values[bad])} (NaN으로 처리)")
+    return result
+
+
+def _parse_unique(values):
+    """결측값이 없는 값 목록을 (float64 배열, 잘못된 값 마스크)로 변환"""
+    # 문자열이 아닌 값은 .str 연산 결과가 NaN이 되므로 숫자 값과 문자열을 한 번에 구분할 수 있습니다.
+    text = values.str.strip()
+    is_text = text.notna().to_numpy()
+
+    parts = text.str.extract(_IP_PATTERN).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = (
+            parts['whole'].fillna(0)
+            + (parts['num'] / parts['den']).fillna(0)
+            + (parts['outs'] / 3).fillna(0)
+            + (parts['frac_num'] / parts['frac_den']).fillna(0)
+        ).to_numpy()
+    matched = (parts['whole'].notna() | parts['frac_num'].notna()).to_numpy()
+    bad_text = is_text & (~matched | (parts['den'] == 0).to_numpy() | (parts['frac_den'] == 0).to_numpy())
+
+    numbers = pd.to_numeric(values.where(~is_text), errors='coerce').to_numpy(dtype=np.float64)
+    result = np.where(is_text, np.where(bad_text, np.nan, result), numbers)
+    return result, bad_text | (~is_text & np.isnan(numbers))
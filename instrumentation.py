@@ -0,0 +1,246 @@
+# instrumentation.py
+# 단계별 계측 (소요 시간, 입력/출력 행 수, 최대 RSS)
+#
+# with span('pca', rows_in=len(X)) as s:
+#     ...
+#     s.rows_out = n
+#
+# - 완료된 구간은 이름(+라벨)별로 누적되어 /metrics(Prometheus 텍스트 형식)로 노출됩니다.
+# - 최근 구간 기록은 일일 작업의 JSON 실행 보고서에 들어갑니다 (tasks.py).
+# - 프로세스 풀에서 실행된 구간은 capture()로 모아 부모 프로세스에서 merge()합니다.
+import collections
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없음
+    resource = None
+
+# JSON 보고서용으로 보관할 최근 구간 수
+MAX_RECORDS = 5000
+
+_lock = threading.Lock()
+_totals = {}  # (이름, 라벨 튜플) -> 누적값
+_records = collections.deque(maxlen=MAX_RECORDS)
+_captures = []  # 진행 중인 capture()가 구간 기록을 모으는 목록들
+_local = threading.local()
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss_bytes():
+    """현재 RSS (Linux /proc 기준, 읽을 수 없으면 None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes():
+    """프로세스 시작 이후 최대 RSS (Linux는 ru_maxrss가 KB 단위, resource 모듈이 없으면 0)"""
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Span:
+    """진행 중인 계측 구간. rows_out은 구간 안에서 설정합니다."""
+
+    def __init__(self, name, rows_in, labels):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.labels = labels
+
+
+@contextlib.contextmanager
+def span(name, rows_in=None, **labels):
+    """이름과 라벨(예: table='hitter_data')로 구간을 계측. 예외가 나도 기록하고 다시 발생시킵니다."""
+    current = Span(name, rows_in, {key: str(value) for key, value in labels.items()})
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    parent = stack[-1].name if stack else None
+    stack.append(current)
+
+    started_at = time.time()
+    start = time.perf_counter()
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        stack.pop()
+        _record({
+            'name': name,
+            'labels': current.labels,
+            'parent': parent,
+            'started_at': started_at,
+            'seconds': round(duration, 6),
+            'rows_in': current.rows_in,
+            'rows_out': current.rows_out,
+            'rss_bytes': current_rss_bytes(),
+            'peak_rss_bytes': peak_rss_bytes(),
+            'pid': os.getpid(),
+            'error': error,
+        })
+
+
+def _default_rows(value):
+    """DataFrame/Series/ndarray면 행 수, 튜플이면 첫 번째 값의 행 수, 그 외는 None"""
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    return len(value) if hasattr(value, 'shape') and getattr(value, 'ndim', 0) >= 1 else None
+
+
+def traced(name, rows_in=None, rows_out=None, **labels):
+    """함수 전체를 구간으로 계측하는 데코레이터
+
+    rows_in(args)/rows_out(result)를 주지 않으면 표 형태 인자의 행 수 합과 결과의 행 수를 사용합니다.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if rows_in is not None:
+                n_in = rows_in(*args, **kwargs)
+            else:
+                counts = [n for n in (_default_rows(arg) for arg in args) if n is not None]
+                n_in = sum(counts) if counts else None
+            with span(name, rows_in=n_in, **labels) as current:
+                result = fn(*args, **kwargs)
+                current.rows_out = (rows_out or _default_rows)(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _record(record):
+    key = (record['name'], tuple(sorted(record['labels'].items())))
+    with _lock:
+        total = _totals.get(key)
+        if total is None:
+            total = _totals[key] = {'calls': 0, 'errors': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                                    'rows_in': 0, 'rows_out': 0, 'peak_rss_bytes': 0}
+        total['calls'] += 1
+        total['errors'] += record['error'] is not None
+        total['seconds'] += record['seconds']
+        total['max_seconds'] = max(total['max_seconds'], record['seconds'])
+        total['rows_in'] += record['rows_in'] or 0
+        total['rows_out'] += record['rows_out'] or 0
+        total['peak_rss_bytes'] = max(total['peak_rss_bytes'], record['peak_rss_bytes'])
+        _records.append(record)
+        for captured in _captures:
+            captured.append(record)
+
+
+def records():
+    """보관 중인 최근 구간 기록 (오래된 순)"""
+    with _lock:
+        return list(_records)
+
+
+def reset():
+    """누적값과 기록 초기화 (일일 작업 시작 시)"""
+    with _lock:
+        _totals.clear()
+        _records.clear()
+
+
+def capture(fn, *args, **kwargs):
+    """fn을 실행하고 (결과, 그 동안 기록된 구간 목록) 반환. 프로세스 풀 작업의 구간을 부모로 옮길 때 사용"""
+    captured = []
+    with _lock:
+        _captures.append(captured)
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        with _lock:
+            _captures.remove(captured)
+    return result, captured
+
+
+def merge(captured):
+    """다른 프로세스에서 capture()로 가져온 구간 기록을 합침"""
+    for record in captured:
+        _record(record)
+
+
+def summary():
+    """구간 이름(+라벨)별 누적값 목록 (총 소요 시간 내림차순)"""
+    with _lock:
+        items = [dict(total, name=name, labels=dict(labels)) for (name, labels), total in _totals.items()]
+    return sorted(items, key=lambda item: item['seconds'], reverse=True)
+
+
+def write_run_report(path, **extra):
+    """실행 보고서(JSON)를 path에 저장하고 보고서 dict 반환"""
+    report = dict(extra)
+    report.update({
+        'peak_rss_bytes': peak_rss_bytes(),
+        'summary': summary(),
+        'spans': records(),
+    })
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    print(f"📝 실행 보고서 저장: {path}")
+    return report
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels_text(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + '}'
+
+
+def render_prometheus(refresh_stats=None):
+    """누적값을 Prometheus 텍스트 형식(0.0.4)으로 변환. refresh_stats는 SingleFlight.stats() 결과"""
+    metrics = [
+        ('kbo_span_calls_total', 'counter', '구간 실행 횟수', 'calls'),
+        ('kbo_span_errors_total', 'counter', '예외로 끝난 구간 실행 횟수', 'errors'),
+        ('kbo_span_seconds_total', 'counter', '구간 누적 소요 시간(초)', 'seconds'),
+        ('kbo_span_seconds_max', 'gauge', '구간 최대 소요 시간(초)', 'max_seconds'),
+        ('kbo_span_rows_in_total', 'counter', '구간 입력 행 수 누적', 'rows_in'),
+        ('kbo_span_rows_out_total', 'counter', '구간 출력 행 수 누적', 'rows_out'),
+        ('kbo_span_peak_rss_bytes', 'gauge', '구간 종료 시점의 프로세스 최대 RSS(바이트)', 'peak_rss_bytes'),
+    ]
+    items = summary()
+    lines = []
+    for metric, metric_type, help_text, field in metrics:
+        lines.append(f'# HELP {metric} {help_text}')
+        lines.append(f'# TYPE {metric} {metric_type}')
+        for item in items:
+            lines.append(f"{metric}{_labels_text(dict(span=item['name'], **item['labels']))} {item[field]}")
+
+    lines.append('# HELP kbo_process_resident_memory_bytes 현재 RSS(바이트)')
+    lines.append('# TYPE kbo_process_resident_memory_bytes gauge')
+    lines.append(f'kbo_process_resident_memory_bytes {current_rss_bytes() or 0}')
+    lines.append('# HELP kbo_process_peak_resident_memory_bytes 최대 RSS(바이트)')
+    lines.append('# TYPE kbo_process_peak_resident_memory_bytes gauge')
+    lines.append(f'kbo_process_peak_resident_memory_bytes {peak_rss_bytes()}')
+
+    if refresh_stats is not None:
+        for metric, metric_type, help_text, field in (
+            ('kbo_refresh_flights_total', 'counter', '실행된 스냅샷 새로고침 수', 'flights'),
+            ('kbo_refresh_coalesced_callers_total', 'counter', '진행 중인 새로고침에 합류한 호출 수', 'coalesced_callers'),
+            ('kbo_refresh_in_flight', 'gauge', '진행 중인 새로고침 수', 'in_flight'),
+        ):
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            value = refresh_stats[field]
+            lines.append(f'{metric} {len(value) if isinstance(value, list) else value}')
+
+    return '\n'.join(lines) + '\n'
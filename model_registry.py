@@ -0,0 +1,143 @@
+# model_registry.py
+# OPS/WHIP 예측 모델 아티팩트 저장소
+#
+# 학습된 스케일러, 선택된 변수 목록, KMeans, 랜덤 포레스트를 버전별로 저장합니다.
+# - <MODEL_REGISTRY_DIR>/<유형>/<버전>/artifacts.joblib : 모델 객체
+# - <MODEL_REGISTRY_DIR>/<유형>/<버전>/meta.json        : 학습 시각, 입력 지문, 파이프라인 버전 등
+# - <MODEL_REGISTRY_DIR>/<유형>/CURRENT                 : 현재 사용 중인 버전 (롤백 시 이전 버전으로 교체)
+#
+# 사용법:
+#   python model_registry.py list hitter
+#   python model_registry.py rollback hitter            # 바로 이전 버전으로
+#   python model_registry.py rollback hitter 20250501-000112
+import datetime
+import functools
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import joblib
+
+REGISTRY_DIR = os.getenv('MODEL_REGISTRY_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models'))
+
+# 유형별로 보관할 최대 버전 수 (오래된 버전부터 삭제, CURRENT 버전은 항상 유지)
+KEEP_VERSIONS = int(os.getenv('MODEL_REGISTRY_KEEP_VERSIONS', '14'))
+
+
+def _kind_dir(kind):
+    return os.path.join(REGISTRY_DIR, kind)
+
+
+def _write_text_atomic(path, text):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def list_versions(kind):
+    """저장된 버전 목록 (오래된 순)"""
+    directory = _kind_dir(kind)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name for name in os.listdir(directory)
+                  if os.path.isfile(os.path.join(directory, name, 'meta.json')))
+
+
+def current_version(kind):
+    """CURRENT가 가리키는 버전 (없으면 None)"""
+    try:
+        with open(os.path.join(_kind_dir(kind), 'CURRENT'), encoding='utf-8') as f:
+            version = f.read().strip()
+    except OSError:
+        return None
+    return version if version in list_versions(kind) else None
+
+
+def set_current(kind, version):
+    """CURRENT를 지정한 버전으로 변경 (롤백/고정)"""
+    if version not in list_versions(kind):
+        raise ValueError(f"'{kind}' 모델에 '{version}' 버전이 없습니다.")
+    _write_text_atomic(os.path.join(_kind_dir(kind), 'CURRENT'), version)
+    print(f"✅ {kind} 모델 현재 버전: {version}")
+
+
+def rollback(kind, version=None):
+    """지정한 버전 또는 현재 버전 바로 이전 버전으로 되돌림"""
+    if version is None:
+        versions = list_versions(kind)
+        current = current_version(kind)
+        older = [v for v in versions if current is None or v < current]
+        if not older:
+            raise ValueError(f"'{kind}' 모델에 되돌릴 이전 버전이 없습니다.")
+        version = older[-1]
+    set_current(kind, version)
+    return version
+
+
+def save_artifacts(kind, artifacts, metadata):
+    """새 버전으로 아티팩트를 저장하고 CURRENT로 지정한 뒤 버전 문자열 반환"""
+    directory = _kind_dir(kind)
+    os.makedirs(directory, exist_ok=True)
+    version = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+    while os.path.exists(os.path.join(directory, version)):
+        version += '-1'
+
+    # 임시 디렉터리에 다 쓴 뒤 이름을 바꿔, 읽는 쪽이 반쯤 저장된 버전을 보지 않도록 합니다.
+    tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=directory)
+    try:
+        joblib.dump(artifacts, os.path.join(tmp_dir, 'artifacts.joblib'))
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(dict(metadata, kind=kind, version=version), f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_dir, os.path.join(directory, version))
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _write_text_atomic(os.path.join(directory, 'CURRENT'), version)
+    _prune(kind)
+    print(f"✅ {kind} 모델 아티팩트 저장 완료 (버전: {version})")
+    return version
+
+
+def _prune(kind):
+    versions = list_versions(kind)
+    current = current_version(kind)
+    for version in versions[:max(len(versions) - KEEP_VERSIONS, 0)]:
+        if version != current:
+            shutil.rmtree(os.path.join(_kind_dir(kind), version), ignore_errors=True)
+
+
+def load_metadata(kind, version=None):
+    version = version or current_version(kind)
+    if version is None:
+        return None
+    with open(os.path.join(_kind_dir(kind), version, 'meta.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_version(kind, version):
+    return joblib.load(os.path.join(_kind_dir(kind), version, 'artifacts.joblib'))
+
+
+def load_artifacts(kind, version=None):
+    """지정한 버전(기본: CURRENT)의 아티팩트를 읽어 반환 (프로세스 안에서 버전별로 한 번만 로드). 없으면 None"""
+    version = version or current_version(kind)
+    if version is None:
+        return None
+    return _load_version(kind, version)
+
+
+if __name__ == '__main__':
+    command, model_kind = sys.argv[1], sys.argv[2]
+    if command == 'list':
+        active = current_version(model_kind)
+        for v in list_versions(model_kind):
+            print(('* ' if v == active else '  ') + v)
+    elif command == 'rollback':
+        rollback(model_kind, sys.argv[3] if len(sys.argv) > 3 else None)
+    else:
+        raise SystemExit(f"알 수 없는 명령: {command} (list | rollback)")
@@ -0,0 +1,236 @@
+# page_cache.py
+# KBO 기록 페이지 디스크 캐시 (원본 HTML + 파싱된 테이블)
+#
+# 디렉터리 구조
+# - objects/<내용 sha256>.html : 원본 HTML (내용 주소 방식이라 같은 내용은 한 번만 저장)
+# - entries/<키 sha256>.json   : URL+날짜(+폼 변형)별 메타데이터 (ETag, Last-Modified, 내용 해시, 가져온 시각)
+# - latest/<URL sha256>.json   : 날짜와 상관없이 URL별 가장 최근 항목 (조건부 GET 검증자, 오프라인 재생용)
+# - tables/<내용 sha256>-<파서 키>.pkl : 파싱된 DataFrame
+import collections
+import datetime
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+
+import requests
+
+from instrumentation import span
+
+CACHE_DIR = os.getenv('KBO_PAGE_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'pages'))
+# 이 시간(초) 안에 가져온 페이지는 네트워크 요청 없이 재사용하고, 지나면 ETag/Last-Modified로 조건부 GET
+CACHE_TTL_SECONDS = int(os.getenv('KBO_PAGE_CACHE_TTL_SECONDS', '600'))
+# 캐시 전체 크기 상한. 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+CACHE_MAX_BYTES = int(os.getenv('KBO_PAGE_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+# '1'이면 네트워크 없이 캐시된 페이지만 재생 (오늘 날짜 항목이 없으면 가장 최근 항목 사용)
+OFFLINE = os.getenv('KBO_CRAWLER_OFFLINE', '') == '1'
+
+REQUEST_TIMEOUT_SECONDS = 30
+
+CachedPage = collections.namedtuple('CachedPage', ['url', 'text', 'content_hash', 'status'])
+
+
+class PageCacheMiss(LookupError):
+    """오프라인 모드에서 재생할 캐시 페이지가 없음"""
+
+
+def _sha256(value):
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return hashlib.sha256(value).hexdigest()
+
+
+def _write_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (일일 작업과 웹 앱이 같은 캐시를 동시에 써도 깨진 파일이 보이지 않도록)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _unlink(path):
+    """파일 삭제. 이미 없으면(다른 프로세스가 먼저 정리) 0, 삭제했으면 1"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return 0
+    return 1
+
+
+class PageCache:
+    """URL+날짜 기준 HTML 캐시. 조건부 GET, TTL, 크기 기반 정리, 오프라인 재생을 지원합니다."""
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl_seconds=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES, offline=OFFLINE):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.offline = offline
+
+    def fetch(self, url, headers=None, session=None, method='GET', data=None, variant='', date=None):
+        """페이지 HTML을 캐시 또는 네트워크에서 가져옴. variant는 같은 URL의 다른 폼 요청(시즌/페이지 등)을 구분하는 키"""
+        date = date or datetime.date.today().isoformat()
+        url_key = _sha256(f"{method} {url} {variant}")
+        entry_path = self._path('entries', _sha256(f"{url_key} {date}") + '.json')
+        latest_path = self._path('latest', url_key + '.json')
+
+        entry = self._read_json(entry_path)
+        if entry is not None and self._has_object(entry):
+            if self.offline or time.time() - entry['fetched_at'] < self.ttl_seconds:
+                return self._cached_page(url, entry, 'cached')
+
+        # 날짜와 관계없이 가장 최근 항목 (조건부 GET 검증자, 오프라인 재생에 사용)
+        latest = self._read_json(latest_path)
+        if latest is not None and not self._has_object(latest):
+            latest = None
+
+        if self.offline:
+            if latest is None:
+                raise PageCacheMiss(f"오프라인 모드: 캐시된 페이지가 없습니다 ({url} {variant})")
+            return self._cached_page(url, latest, 'offline')
+
+        request_headers = dict(headers or {})
+        if latest is not None:
+            if latest.get('etag'):
+                request_headers['If-None-Match'] = latest['etag']
+            if latest.get('last_modified'):
+                request_headers['If-Modified-Since'] = latest['last_modified']
+
+        with span('http_fetch', method=method):
+            response = (session or requests).request(method, url, headers=request_headers, data=data,
+                                                     timeout=REQUEST_TIMEOUT_SECONDS)
+        if response.status_code == 304 and latest is not None:
+            content_hash = latest['content_hash']
+            encoding = latest.get('encoding')
+            status = 'revalidated'
+        else:
+            response.raise_for_status()  # HTTP 에러 확인
+            content = response.content
+            content_hash = _sha256(content)
+            encoding = response.encoding or response.apparent_encoding
+            object_path = self._path('objects', content_hash + '.html')
+            if not os.path.exists(object_path):
+                _write_atomic(object_path, content)
+            status = 'fetched'
+
+        entry = {
+            'url': url,
+            'variant': variant,
+            'date': date,
+            'content_hash': content_hash,
+            'encoding': encoding or 'utf-8',
+            'etag': response.headers.get('ETag') or (latest or {}).get('etag'),
+            'last_modified': response.headers.get('Last-Modified') or (latest or {}).get('last_modified'),
+            'fetched_at': time.time(),
+        }
+        payload = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        _write_atomic(entry_path, payload)
+        _write_atomic(latest_path, payload)
+
+        self.evict()
+        return self._cached_page(url, entry, status)
+
+    def load_table(self, page, parser_key, parse):
+        """page를 parse(html)로 파싱한 DataFrame을 내용 해시 기준으로 캐시. parser_key는 파서 버전이 바뀌면 올려야 함"""
+        table_path = self._path('tables', f"{page.content_hash}-{parser_key}.pkl")
+        try:
+            with open(table_path, 'rb') as f:
+                table = pickle.load(f)
+            os.utime(table_path)
+            return table
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        table = parse(page.text)
+        _write_atomic(table_path, pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL))
+        return table
+
+    def evict(self):
+        """만료된 날짜별 항목을 지우고, 캐시 크기가 상한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+
+        원본(objects)이 삭제되면 그 원본을 가리키는 entries/latest 항목도 함께 지웁니다.
+        """
+        now = time.time()
+        removed = 0
+        files = []
+        for kind in ('objects', 'tables', 'entries', 'latest'):
+            for mtime, size, path in self._list_files(kind):
+                # 날짜별 항목은 TTL이 지나면 다시 쓰이지 않음 (조건부 GET 검증자와 오프라인 재생은 latest 항목 사용)
+                if kind == 'entries' and now - mtime >= self.ttl_seconds:
+                    removed += _unlink(path)
+                    continue
+                files.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in files)
+        evicted_hashes = set()
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if not _unlink(path):
+                continue
+            total -= size
+            removed += 1
+            if os.path.basename(os.path.dirname(path)) == 'objects':
+                evicted_hashes.add(os.path.basename(path)[:-len('.html')])
+
+        if evicted_hashes:
+            removed += self._remove_entries_for(evicted_hashes)
+        if removed:
+            print(f"🧹 페이지 캐시 정리: {removed}개 파일 삭제")
+        return removed
+
+    def _remove_entries_for(self, content_hashes):
+        """삭제된 원본을 가리키는 entries/latest 항목 삭제"""
+        removed = 0
+        for kind in ('entries', 'latest'):
+            for _, _, path in self._list_files(kind):
+                entry = self._read_json(path)
+                if entry is not None and entry.get('content_hash') in content_hashes:
+                    removed += _unlink(path)
+        return removed
+
+    def _list_files(self, kind):
+        """kind 디렉터리의 (수정 시각, 크기, 경로) 목록 (임시 파일 제외)"""
+        directory = self._path(kind)
+        if not os.path.isdir(directory):
+            return []
+        files = []
+        for name in os.listdir(directory):
+            if name.startswith('.tmp-'):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _cached_page(self, url, entry, status):
+        object_path = self._path('objects', entry['content_hash'] + '.html')
+        with open(object_path, 'rb') as f:
+            content = f.read()
+        os.utime(object_path)  # 최근 사용 시각 갱신 (정리 순서에 사용)
+        return CachedPage(url=url, text=content.decode(entry.get('encoding') or 'utf-8', errors='replace'),
+                          content_hash=entry['content_hash'], status=status)
+
+    def _has_object(self, entry):
+        return os.path.exists(self._path('objects', entry['content_hash'] + '.html'))
+
+    def _path(self, *parts):
+        return os.path.join(self.cache_dir, *parts)
+
+    @staticmethod
+    def _read_json(path):
+        try:
+            with open(path, 'rb') as f:
+                return json.loads(f.read().decode('utf-8'))
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,123 @@
+# pipeline_dag.py
+# 일일 작업용 작은 DAG 실행기
+# - 단계(stage)는 이름, 함수, 선행 단계 목록, 실행기 종류('thread' 또는 'process')로 정의합니다.
+# - 선행 단계가 모두 끝난 단계는 바로 제출되며, 선행 단계의 결과가 순서대로 인자로 전달됩니다.
+# - 크롤링/DB 저장 같은 I/O 단계는 스레드 풀에서, sklearn 학습 같은 CPU 단계는 프로세스 풀에서 실행합니다.
+# - 실행이 끝나면 단계별 소요 시간과 크리티컬 패스(가장 늦게 끝난 선행 단계를 따라간 경로)를 출력합니다.
+# - 각 단계는 instrumentation 'stage' 구간으로 기록되며, 프로세스 단계의 구간 기록은 부모 프로세스로 옮겨 합칩니다.
+# - 프로파일링(profiling.py)이 켜져 있으면 단계마다 실행되는 스레드/프로세스 안에서 cProfile을 수집합니다.
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import instrumentation
+import profiling
+
+
+def _run_stage(pipeline_name, name, fn, *args):
+    with instrumentation.span('stage', stage=name), profiling.profile(f"{pipeline_name}.{name}"):
+        return fn(*args)
+
+
+def _run_process_stage(pipeline_name, name, fn, *args):
+    """프로세스 풀에서 단계를 실행하고 (결과, 자식 프로세스에서 기록된 구간 목록) 반환"""
+    return instrumentation.capture(_run_stage, pipeline_name, name, fn, *args)
+
+
+class Pipeline:
+    """단계 간 의존 관계에 따라 독립적인 단계를 동시에 실행하는 DAG"""
+
+    def __init__(self, name='pipeline', max_threads=4, max_processes=2):
+        self.name = name
+        self.max_threads = max_threads
+        # 0이면 프로세스 풀 없이 'process' 단계도 스레드에서 실행 (디버깅용)
+        self.max_processes = max_processes
+        self.stages = {}
+        self.timings = {}
+
+    def add(self, name, fn, deps=(), executor='thread'):
+        """단계 추가. 프로세스 단계의 fn과 인자는 pickle 가능해야 합니다 (모듈 최상위 함수)."""
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+        missing = [dep for dep in deps if dep not in self.stages]
+        if missing:
+            raise ValueError(f"'{name}' 단계의 선행 단계가 등록되지 않았습니다: {missing}")
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"알 수 없는 실행기입니다: {executor}")
+        self.stages[name] = {'fn': fn, 'deps': tuple(deps), 'executor': executor}
+        return name
+
+    def run(self):
+        """모든 단계를 실행하고 {단계 이름: 결과} 반환. 한 단계라도 실패하면 남은 단계를 취소하고 예외를 다시 발생시킵니다."""
+        results = {}
+        self.timings = {}
+        run_start = time.perf_counter()
+
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix='stage')
+        process_pool = None
+        if self.max_processes and any(stage['executor'] == 'process' for stage in self.stages.values()):
+            # 크롤링 스레드가 도는 중에 fork하면 잠금 상태가 복사될 수 있으므로 spawn으로 새 인터프리터를 띄웁니다.
+            process_pool = ProcessPoolExecutor(max_workers=self.max_processes,
+                                               mp_context=multiprocessing.get_context('spawn'))
+
+        running = {}
+        pending = dict(self.stages)
+        in_process = set()  # 프로세스 풀에 제출된 단계 (결과에 구간 기록이 함께 옴)
+        try:
+            while pending or running:
+                for name in [n for n, stage in pending.items() if all(dep in results for dep in stage['deps'])]:
+                    stage = pending.pop(name)
+                    pool = process_pool if stage['executor'] == 'process' and process_pool else thread_pool
+                    args = [results[dep] for dep in stage['deps']]
+                    self.timings[name] = {'start': time.perf_counter() - run_start, 'executor': stage['executor']}
+                    if pool is process_pool:
+                        in_process.add(name)
+                    runner = _run_process_stage if pool is process_pool else _run_stage
+                    running[pool.submit(runner, self.name, name, stage['fn'], *args)] = name
+
+                if not running:
+                    raise ValueError(f"실행할 수 없는 단계가 남았습니다 (순환 의존): {sorted(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self.timings[name]['end'] = time.perf_counter() - run_start
+                    self.timings[name]['seconds'] = self.timings[name]['end'] - self.timings[name]['start']
+                    # 실패한 단계의 예외를 그대로 전달 (finally에서 나머지 단계 취소)
+                    result = future.result()
+                    if name in in_process:
+                        result, captured = result
+                        instrumentation.merge(captured)
+                    results[name] = result
+                    print(f"⏱️ [{name}] {self.timings[name]['seconds']:.2f}초 ({self.timings[name]['executor']})")
+        finally:
+            for future in running:
+                future.cancel()
+            thread_pool.shutdown(wait=True, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=True, cancel_futures=True)
+
+        self._print_summary(time.perf_counter() - run_start)
+        return results
+
+    def critical_path(self):
+        """가장 늦게 끝난 단계에서 시작해 가장 늦게 끝난 선행 단계를 거꾸로 따라간 경로 (실행 순서대로)"""
+        finished = {name: timing for name, timing in self.timings.items() if 'end' in timing}
+        if not finished:
+            return []
+        path = [max(finished, key=lambda n: finished[n]['end'])]
+        while True:
+            deps = [dep for dep in self.stages[path[-1]]['deps'] if dep in finished]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda n: finished[n]['end']))
+        return path[::-1]
+
+    def _print_summary(self, total_seconds):
+        print("📊 단계별 소요 시간")
+        for name, timing in sorted(self.timings.items(), key=lambda item: item[1]['start']):
+            print(f"   - {name}: {timing['seconds']:.2f}초 "
+                  f"({timing['start']:.2f}s → {timing['end']:.2f}s, {timing['executor']})")
+        path = self.critical_path()
+        path_seconds = sum(self.timings[name]['seconds'] for name in path)
+        print(f"🧭 크리티컬 패스: {' → '.join(path)} ({path_seconds:.2f}초 / 전체 {total_seconds:.2f}초)")
@@ -0,0 +1,100 @@
+# prebuilt_response.py
+# 스냅샷 단위로 미리 직렬화/압축해 둔 응답 본문
+# - 본문 바이트와 gzip(및 brotli 모듈이 있으면 br) 변형을 스냅샷이 바뀔 때 한 번만 생성합니다.
+# - 변형마다 내용 해시로 만든 강한 ETag를 붙이고, If-None-Match가 일치하면 304로 응답할 수 있게 합니다.
+# - 헤더 파싱은 Flask/werkzeug에 의존하지 않으므로 다른 서버 어댑터에서도 그대로 사용할 수 있습니다.
+import gzip
+import hashlib
+from dataclasses import dataclass
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip과 원본만 제공
+    brotli = None
+
+# 압축 변형을 만들 최소 본문 크기 (이보다 작으면 압축 이득이 없음)
+MIN_COMPRESS_BYTES = 256
+
+
+@dataclass(frozen=True)
+class PrebuiltResponse:
+    """인코딩별 (본문 바이트, ETag). variants['identity']는 항상 존재"""
+    variants: dict
+    content_type: str = 'application/json'
+
+    def negotiate(self, accept_encoding):
+        """Accept-Encoding 헤더에 맞는 (인코딩, 본문, ETag) 선택. br > gzip > identity 순으로 선호"""
+        accepted = _parse_accept_encoding(accept_encoding)
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and accepted.get(encoding, accepted.get('*', 0)) > 0:
+                return (encoding, *self.variants[encoding])
+        return ('identity', *self.variants['identity'])
+
+    def headers(self, encoding, etag, cache_control):
+        """본문/304 응답에 공통으로 붙는 헤더"""
+        headers = {'ETag': etag, 'Cache-Control': cache_control, 'Vary': 'Accept-Encoding'}
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return headers
+
+
+def _etag(body, encoding):
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    # 같은 내용이라도 인코딩이 다르면 바이트가 다르므로 강한 ETag도 달라야 합니다.
+    return f'"{digest}"' if encoding == 'identity' else f'"{digest}-{encoding}"'
+
+
+def build(body, content_type='application/json'):
+    """본문 바이트로 원본/gzip/br 변형을 모두 만들어 반환"""
+    variants = {'identity': (body, _etag(body, 'identity'))}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        # mtime=0: 같은 본문이면 워커와 상관없이 같은 gzip 바이트(같은 ETag)가 나오도록
+        variants['gzip'] = (gzip.compress(body, compresslevel=9, mtime=0), _etag(body, 'gzip'))
+        if brotli is not None:
+            variants['br'] = (brotli.compress(body), _etag(body, 'br'))
+    return PrebuiltResponse(variants=variants, content_type=content_type)
+
+
+def _parse_accept_encoding(header):
+    """Accept-Encoding 헤더를 {인코딩: q값} dict로 변환"""
+    accepted = {}
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더에 etag가 포함되어 있는지 (또는 '*')"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    # 프록시가 압축 후 붙인 약한 비교용 W/ 접두사는 무시 (GET의 If-None-Match는 약한 비교)
+    return '*' in tags or etag in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+
+
+class SnapshotResponseCache:
+    """스냅샷 객체가 바뀔 때만 build_body(snapshot)으로 응답을 다시 만듦. 그 외에는 참조 비교 한 번"""
+
+    def __init__(self, build_body, content_type='application/json'):
+        self.build_body = build_body
+        self.content_type = content_type
+        self._entry = (None, None)
+
+    def get(self, snapshot):
+        cached_snapshot, response = self._entry
+        if cached_snapshot is not snapshot:
+            response = build(self.build_body(snapshot), self.content_type)
+            # 튜플 한 번의 대입으로 교체하므로 다른 스레드가 스냅샷과 응답이 어긋난 상태를 보지 않습니다.
+            self._entry = (snapshot, response)
+        return response
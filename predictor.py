@@ -2,12 +2,15 @@
 import pandas as pd
 import numpy as np
 import datetime
-from crawler import crawl_hitter_data, crawl_pitcher_data, load_historical_data
-from data_processor import process_hitter_data, process_pitcher_data
+import os
+import db_utils
+from instrumentation import traced
+from singleflight import SingleFlight
+from win_probability import build_win_probability_matrix
 
 
-def generate_win_probability_df(all_hitter_data, all_pitcher_data):
-    """팀별 승률 계산 및 OPS-WHIP 기반 팀 순위 예측"""
+def generate_win_probability_matrix(all_hitter_data, all_pitcher_data):
+    """팀별 승률 계산 및 OPS-WHIP 기반 팀 순위 예측 (WinProbabilityMatrix, 팀 순위 DataFrame 반환)"""
     # 연도가 2025인 데이터만 추출
     df_2025_hitter = all_hitter_data[all_hitter_data['연도'] == 2025]
     df_2025_pitcher = all_pitcher_data[all_pitcher_data['연도'] == 2025]
@@ -20,13 +23,13 @@ def generate_win_probability_df(all_hitter_data, all_pitcher_data):
 
 
     # 팀별 OPS 값 평균 산출
-    team_ops_avg = df_2025_hitter.groupby('팀명')['OPS_predict'].mean().reset_index()
+    team_ops_avg = df_2025_hitter.groupby('팀명', observed=True)['OPS_predict'].mean().reset_index()
 
     # OPS 기준 내림차순으로 팀 정렬
     team_ops_avg_sorted = team_ops_avg.sort_values(by='OPS_predict', ascending=False)
 
     # 팀별 WHIP 값 평균 산출
-    team_whip_avg = df_2025_pitcher.groupby('팀명')['WHIP_predict'].mean().reset_index()
+    team_whip_avg = df_2025_pitcher.groupby('팀명', observed=True)['WHIP_predict'].mean().reset_index()
 
     # WHIP 기준 내림차순으로 팀 정렬
     team_whip_avg_sorted = team_whip_avg.sort_values(by='WHIP_predict', ascending=False)
@@ -65,93 +68,343 @@ def generate_win_probability_df(all_hitter_data, all_pitcher_data):
     # 조정된 점수 계산 (모든 점수를 양수로 만듦)
     victory_predict_df['Adjusted_Score'] = victory_predict_df['OPS_minus_WHIP'] + adjustment_value
 
-    # 팀 목록 추출
-    teams = victory_predict_df['팀명'].tolist()
+    # 팀 간 승률 계산 (NumPy 브로드캐스트 한 번으로 전체 행렬 생성)
+    win_probability_matrix = build_win_probability_matrix(
+        victory_predict_df['팀명'].tolist(), victory_predict_df['Adjusted_Score'].to_numpy()
+    )
+    # --- 승률 예측 로직 끝 ---
 
-    # 승률 결과를 저장할 데이터프레임 초기화
-    win_probability_df = pd.DataFrame(index=teams, columns=teams)
 
-    # 팀 간 승률 계산 및 데이터프레임 채우기
-    for team_a in teams:
-        score_a = victory_predict_df[victory_predict_df['팀명'] == team_a]['Adjusted_Score'].iloc[0]
-        for team_b in teams:
-            if team_a == team_b:
-                win_probability_df.loc[team_a, team_b] = '-'  # 같은 팀 간 승률은 의미 없음
-            else:
-                score_b = victory_predict_df[victory_predict_df['팀명'] == team_b]['Adjusted_Score'].iloc[0]
-                # 분모가 0이 되는 경우를 방지 (score_a + score_b가 0이 되는 경우)
-                if (score_a + score_b) == 0:
-                    win_prob = 50.0 # 0으로 나누는 경우를 대비하여 기본값 설정 (예: 50%)
-                else:
-                    win_prob = (score_a / (score_a + score_b)) * 100
-                win_probability_df.loc[team_a, team_b] = round(win_prob, 2)  # 소수점 둘째 자리까지 반올림
-    # --- 승률 예측 로직 끝 ---
+    return win_probability_matrix, predicted_team_rankings_df
 
 
-    # generate_win_probability_df 함수는 여전히 두 개의 DataFrame을 반환해야 합니다.
-    return win_probability_df, predicted_team_rankings_df
+def generate_win_probability_df(all_hitter_data, all_pitcher_data):
+    """팀별 승률 DataFrame(float64, 대각선 NaN)과 팀 순위 예측 DataFrame 반환"""
+    win_probability_matrix, predicted_team_rankings_df = generate_win_probability_matrix(all_hitter_data, all_pitcher_data)
+    return win_probability_matrix.to_frame(), predicted_team_rankings_df
 
 
-def get_win_probability_df(cached_data):
-    """승률 데이터를 가져오거나 캐시된 데이터 사용"""
-    current_time = datetime.datetime.now()
+# 캐시 유효 시간 (24시간)
+CACHE_TTL_SECONDS = 86400
+
+# 예측 데이터 출처
+# - 'compute': 크롤링 + 모델 학습으로 프로세스 안에서 직접 계산 (기존 동작)
+# - 'database': tasks.py(GitHub Actions)가 DB에 저장한 최신 prediction_date 스냅샷을 읽어서 사용.
+#   웹 워커가 sklearn/xgboost를 임포트하거나 크롤링하지 않습니다.
+PREDICTION_SOURCE = os.getenv('PREDICTION_SOURCE', 'compute')
+
+# compute 모드의 모델 사용 방식
+# - 'train': 새로고침마다 학습 (입력이 같으면 data_processor가 이전 결과를 재사용)
+# - 'registry': model_registry에 저장된 현재 버전 모델로 예측만 수행 (저장된 모델이 없으면 학습)
+MODEL_SOURCE = os.getenv('PREDICTION_MODEL_SOURCE', 'train')
+
+# database 모드에서 더 새로운 스냅샷이 있는지 DB를 확인하는 주기(초)
+DB_CHECK_SECONDS = int(os.getenv('PREDICTION_DB_CHECK_SECONDS', '300'))
+
+# gunicorn 워커 간 공유 스냅샷 파일 경로 (예: /dev/shm/kbo_prediction.snapshot). 설정하면 한 워커만 새로고침하여 게시하고,
+# 나머지 워커는 메모리 맵으로 붙어서 같은 행렬을 복사 없이 사용합니다. 비어 있으면 워커별로 따로 캐시합니다.
+SHARED_SNAPSHOT_PATH = os.getenv('PREDICTION_SHARED_SNAPSHOT_PATH')
+
+# 새로고침 방식
+# - 'sync': 캐시가 만료되면 요청 스레드에서 바로 새로고침 (기존 동작)
+# - 'background': 마지막 정상 스냅샷을 계속 제공하고, 백그라운드 스레드 하나가 새 스냅샷을 만든 뒤 교체
+REFRESH_MODE = os.getenv('PREDICTION_REFRESH_MODE', 'sync')
+
+# background 모드에서 만료된 스냅샷을 제공할 수 있는 최대 나이(초). 이보다 오래되면 요청 스레드에서 새로고침을 기다립니다.
+MAX_STALENESS_SECONDS = int(os.getenv('PREDICTION_MAX_STALENESS_SECONDS', str(3 * 86400)))
+
+# 백그라운드 새로고침 실패 후 재시도까지 대기 시간(초)
+REFRESH_RETRY_SECONDS = int(os.getenv('PREDICTION_REFRESH_RETRY_SECONDS', '60'))
+
+# 새로고침은 프로세스 안에서 한 번에 하나만 실행되고, 동시에 들어온 요청은 그 결과에 합류합니다.
+_refresh_flight = SingleFlight()
+_REFRESH_KEY = 'prediction_snapshot'
+_last_refresh_failure = None
+_shared_reader = None
+if SHARED_SNAPSHOT_PATH:
+    # shared_snapshot은 fcntl(POSIX 전용)을 사용하므로 공유 스냅샷을 켰을 때만 불러옵니다 (Windows에서도 임포트 가능).
+    from shared_snapshot import SharedSnapshotReader
+    _shared_reader = SharedSnapshotReader(SHARED_SNAPSHOT_PATH)
+
+
+_db_engine = None
+
+
+def _get_db_engine():
+    """database 모드에서 재사용할 엔진 (확인 주기마다 새 엔진을 만들지 않도록)"""
+    global _db_engine
+    if _db_engine is None:
+        _db_engine = db_utils.get_db_engine()
+    return _db_engine
+
+
+@traced('snapshot_build', source=PREDICTION_SOURCE)
+def _build_snapshot(previous):
+    """새 캐시 스냅샷 생성 (공유 스냅샷을 쓰면 워커 간 조정 후 생성)"""
+    if _shared_reader is not None:
+        return _build_shared_snapshot(previous)
+    return _build_local_snapshot(previous)
+
+
+def _build_shared_snapshot(previous):
+    """다른 워커가 게시한 최신 스냅샷이 있으면 붙고, 없으면 워커 간 잠금을 잡은 한 워커만 새로 만들어 게시"""
+    from shared_snapshot import publish_snapshot, refresh_lock
+
+    shared = _shared_reader.current()
+    if shared is not None and not _needs_refresh(shared, datetime.datetime.now()):
+        return shared
+
+    # 캐시가 비어 있는 워커는 다른 워커의 새로고침이 끝날 때까지 기다리고, 이전 스냅샷이 있으면 기다리지 않습니다.
+    with refresh_lock(SHARED_SNAPSHOT_PATH, blocking=previous is None) as acquired:
+        if not acquired:
+            print("♻️ 다른 워커가 새로고침 중 - 이전 스냅샷을 계속 사용합니다.")
+            return previous
+
+        # 잠금을 기다리는 사이 다른 워커가 이미 게시했을 수 있습니다.
+        shared = _shared_reader.current()
+        if shared is not None and not _needs_refresh(shared, datetime.datetime.now()):
+            return shared
+
+        base = shared or previous
+        snapshot = _build_local_snapshot(base)
+        if snapshot is base:
+            # DB가 그대로여도 다른 워커들이 확인 시각을 알 수 있도록 last_update만 바꿔 다시 게시
+            snapshot = dict(base, last_update=datetime.datetime.now())
+        publish_snapshot(SHARED_SNAPSHOT_PATH, snapshot)
+
+    # 게시한 워커도 타자/투수 원본 DataFrame 대신 공유 파일에 붙은 스냅샷을 사용합니다.
+    return _shared_reader.current()
+
+
+def _build_local_snapshot(previous):
+    """PREDICTION_SOURCE에 따라 이 프로세스에서 새 캐시 스냅샷 생성"""
+    if PREDICTION_SOURCE == 'database':
+        return _load_database_snapshot(previous)
+    return _compute_snapshot()
+
+
+def _load_database_snapshot(previous):
+    """DB의 최신 스냅샷을 읽어 메모리 인덱스(WinProbabilityMatrix)로 만듦. prediction_date가 그대로면 previous를 그대로 반환"""
+    engine = _get_db_engine()
+    if previous is not None and previous.get('prediction_date') is not None:
+        latest_prediction_date = db_utils.get_latest_prediction_date(engine)
+        # 공유 스냅샷을 거치면 prediction_date가 문자열이 되므로 문자열로 비교합니다.
+        if str(latest_prediction_date) == str(previous['prediction_date']):
+            print(f"💾 DB 스냅샷 변경 없음 (prediction_date: {latest_prediction_date})")
+            return previous
+
+    print("🔁 DB 스냅샷 로드 시작...")
+    prediction_date, win_probability_matrix, predicted_team_rankings_df = db_utils.load_prediction_snapshot(engine)
+    return {
+        'hitter_data': None,
+        'pitcher_data': None,
+        'win_probability_matrix': win_probability_matrix,
+        'win_probability_df': win_probability_matrix.to_frame(),
+        'predicted_team_rankings_df': predicted_team_rankings_df,
+        'prediction_date': prediction_date,
+        'last_update': datetime.datetime.now(),
+    }
+
+
+def _compute_snapshot():
+    """크롤링 → 데이터 처리 → 승률 계산을 수행하여 새 캐시 스냅샷 생성"""
+    # 무거운 의존성(sklearn, xgboost, 크롤러)은 compute 모드에서만 임포트합니다.
+    from crawler import crawl_hitter_data, crawl_pitcher_data, load_historical_data
+    from data_processor import process_hitter_data, process_pitcher_data, predict_hitter_data, predict_pitcher_data
+
+    print("🔁 데이터 새로고침 시작...")
+
+    # 크롤링 수행
+    hitter_data_2025 = crawl_hitter_data()
+    pitcher_data_2025 = crawl_pitcher_data()
+
+    # 역대 데이터 로드
+    hitter_data_his, pitcher_data_his = load_historical_data()
+
+    # 데이터 처리 (registry 모드면 저장된 모델로 예측만 수행)
+    all_hitter_data = all_pitcher_data = None
+    if MODEL_SOURCE == 'registry':
+        all_hitter_data = predict_hitter_data(hitter_data_2025, hitter_data_his)
+        all_pitcher_data = predict_pitcher_data(pitcher_data_2025, pitcher_data_his)
+    if all_hitter_data is None:
+        all_hitter_data = process_hitter_data(hitter_data_2025, hitter_data_his)
+    if all_pitcher_data is None:
+        all_pitcher_data = process_pitcher_data(pitcher_data_2025, pitcher_data_his)
+
+    # 승률 계산 및 팀 순위 예측 (두 개 모두 반환되도록)
+    win_probability_matrix, predicted_team_rankings_df = generate_win_probability_matrix(all_hitter_data, all_pitcher_data)
+
+    return {
+        'hitter_data': all_hitter_data,
+        'pitcher_data': all_pitcher_data,
+        'win_probability_matrix': win_probability_matrix,
+        'win_probability_df': win_probability_matrix.to_frame(),
+        'predicted_team_rankings_df': predicted_team_rankings_df,
+        'prediction_date': None,
+        'last_update': datetime.datetime.now(),
+    }
+
+
+def _swap_snapshot(cached_data, snapshot):
+    """완성된 스냅샷으로 캐시를 교체. 'snapshot' 키 대입 한 번이 교체 시점이므로 읽는 쪽은 항상 완전한 스냅샷만 봅니다."""
+    cached_data.update(snapshot)
+    cached_data['snapshot'] = snapshot
+
+
+def _refresh_now(cached_data, stale_snapshot):
+    """새 스냅샷을 만들어 캐시에 반영하고 반환 (_refresh_flight 안에서만 호출)"""
+    # 만료를 확인한 뒤 순서를 기다리는 사이 다른 새로고침이 이미 끝났다면 다시 크롤링하지 않습니다.
+    current = cached_data.get('snapshot')
+    if current is not stale_snapshot and not _needs_refresh(current, datetime.datetime.now(), cached_data.get('checked_at')):
+        return current
+
+    snapshot = _build_snapshot(current)
+    # 스냅샷 객체를 그대로 유지해야 객체별로 미리 만든 응답(팀 순위 JSON/gzip)을 다시 만들지 않으므로,
+    # DB가 그대로였을 때는 확인 시각만 따로 기록합니다.
+    cached_data['checked_at'] = datetime.datetime.now()
+    if snapshot is current:
+        return current
+    _swap_snapshot(cached_data, snapshot)
+
+    # 다음 업데이트 시간 계산 (로그 메시지에만 사용)
+    next_update = snapshot['last_update'] + datetime.timedelta(seconds=_refresh_interval())
+    print(f"✅ 데이터 새로고침 완료! 다음 업데이트: {next_update.strftime('%Y-%m-%d %H:%M')}")
+    return snapshot
+
+
+def _refresh(cached_data, stale_snapshot):
+    """새로고침을 수행하거나, 다른 스레드가 이미 진행 중이면 그 결과를 기다려 반환"""
+    return _refresh_flight.do(_REFRESH_KEY, lambda: _refresh_now(cached_data, stale_snapshot))
+
+
+def _background_refresh(cached_data, stale_snapshot):
+    """백그라운드 스레드에서 실행되는 새로고침. 실패해도 이전 스냅샷은 그대로 유지됩니다.
+
+    같은 키로 합류한 동기 호출자(_refresh)도 이 결과를 받으므로, 새 스냅샷을 반환하고 실패는 기록한 뒤 다시 발생시킵니다.
+    """
+    global _last_refresh_failure
+    try:
+        snapshot = _refresh_now(cached_data, stale_snapshot)
+    except Exception as e:
+        _last_refresh_failure = datetime.datetime.now()
+        print(f"❌ 백그라운드 데이터 새로고침 실패 (이전 스냅샷 유지): {e}")
+        raise
+    _last_refresh_failure = None
+    return snapshot
 
-    # Render 배포 시 초기 데이터 로드를 위해, 만약 캐시가 비어있다면 강제로 새로고침
-    if cached_data['hitter_data'] is None or cached_data['pitcher_data'] is None:
-        print("Initial data load for Render deployment: Forcing data refresh.")
-        cached_data['last_update'] = None # 캐시 업데이트 시간을 초기화하여 새로고침을 강제합니다.
 
-    # 24시간(86,400초) 지났는지 확인
-    # 스케줄러가 매일 00:01에 실행되므로, 이 강제 업데이트 로직은 필요 없을 수 있으나,
-    # API 요청 시에도 최신 데이터를 보장하기 위해 유지하는 것이 좋습니다.
-    # 다만, tasks.py의 스케줄러와 중복될 수 있으니, 스케줄러가 정확히 작동한다면 이 부분은 더 간결하게 수정 가능합니다.
-    # 현재는 '매일 00:00~00:04 사이 강제 업데이트' 로직이 있으므로 그대로 따릅니다.
+def _start_background_refresh(cached_data, stale_snapshot):
+    """진행 중인 새로고침이 없을 때만 백그라운드 새로고침을 시작 (진행 중이면 합류만 기록)"""
+    if (_last_refresh_failure is not None and
+            (datetime.datetime.now() - _last_refresh_failure).total_seconds() < REFRESH_RETRY_SECONDS):
+        return False
+    return _refresh_flight.start(_REFRESH_KEY, lambda: _background_refresh(cached_data, stale_snapshot))
+
+
+def get_refresh_stats():
+    """새로고침 횟수와 각 새로고침에 합류한 호출자 수"""
+    return _refresh_flight.stats()
+
+
+def _refresh_interval():
+    """스냅샷 유효 시간(초): compute 모드는 24시간, database 모드는 DB 확인 주기"""
+    return DB_CHECK_SECONDS if PREDICTION_SOURCE == 'database' else CACHE_TTL_SECONDS
+
+
+def _last_checked(snapshot, checked_at):
+    """스냅샷이 최신인지 마지막으로 확인한 시각 (checked_at이 스냅샷보다 오래됐으면 스냅샷 생성 시각)"""
+    if checked_at is None or checked_at < snapshot['last_update']:
+        return snapshot['last_update']
+    return checked_at
+
+
+def _needs_refresh(snapshot, current_time, checked_at=None):
+    """스냅샷이 없거나, 유효 시간이 지났거나, 오늘 00:00 이후 아직 새로고침되지 않았다면 True
+
+    checked_at은 database 모드에서 DB에 변경이 없어 스냅샷을 유지한 마지막 확인 시각입니다.
+    """
+    if snapshot is None or snapshot['last_update'] is None:
+        return True
+
+    if PREDICTION_SOURCE == 'database':
+        return (current_time - _last_checked(snapshot, checked_at)).total_seconds() > DB_CHECK_SECONDS
+
+    # 매일 00:00~00:04 사이에는 강제 업데이트. 단, 이미 자정 이후에 새로고침된 스냅샷이라면 다시 하지 않습니다.
     if current_time.hour == 0 and current_time.minute < 5:
-        print("⚠️ 일일 강제 업데이트 시간(00:00) - 캐시 초기화")
-        cached_data['last_update'] = None # 캐시 업데이트 시간을 초기화하여 새로고침을 강제합니다.
+        midnight = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        if snapshot['last_update'] < midnight:
+            print("⚠️ 일일 강제 업데이트 시간(00:00) - 캐시 초기화")
+            return True
 
-    if (cached_data['win_probability_df'] is None or
-            cached_data['last_update'] is None or
-            (current_time - cached_data['last_update']).total_seconds() > 86400):
+    return (current_time - snapshot['last_update']).total_seconds() > CACHE_TTL_SECONDS
 
-        print("🔁 데이터 새로고침 시작...")
 
-        # 크롤링 수행
-        hitter_data_2025 = crawl_hitter_data()
-        pitcher_data_2025 = crawl_pitcher_data()
+def _adopt_shared_snapshot(cached_data, snapshot):
+    """공유 파일의 스냅샷이 현재 캐시보다 새로우면 캐시를 교체하고 반환"""
+    try:
+        shared = _shared_reader.current()
+    except Exception as e:
+        print(f"❌ 공유 스냅샷 읽기 실패: {e}")
+        return snapshot
 
-        # 역대 데이터 로드
-        hitter_data_his, pitcher_data_his = load_historical_data()
+    if shared is None or shared is snapshot:
+        return snapshot
+    if snapshot is not None and shared['last_update'] < snapshot['last_update']:
+        return snapshot
+    _swap_snapshot(cached_data, shared)
+    return shared
 
-        # 데이터 처리
-        all_hitter_data = process_hitter_data(hitter_data_2025, hitter_data_his)
-        all_pitcher_data = process_pitcher_data(pitcher_data_2025, pitcher_data_his)
 
-        # 승률 계산 및 팀 순위 예측 (두 개 모두 반환되도록)
-        win_probability_df, predicted_team_rankings_df = generate_win_probability_df(all_hitter_data, all_pitcher_data)
+def get_snapshot_nowait(cached_data):
+    """요청 스레드를 막지 않고 응답할 수 있으면 현재 스냅샷, 요청 스레드에서 새로고침해야 하면 None 반환 (비동기 서버용)"""
+    current_time = datetime.datetime.now()
+    snapshot = cached_data.get('snapshot')
 
-        # 캐시 업데이트
-        cached_data['hitter_data'] = all_hitter_data
-        cached_data['pitcher_data'] = all_pitcher_data
-        cached_data['win_probability_df'] = win_probability_df
-        cached_data['predicted_team_rankings_df'] = predicted_team_rankings_df # 추가된 예측 순위 저장
-        cached_data['last_update'] = current_time
+    # 다른 워커가 더 새로운 스냅샷을 게시했다면 바로 교체 (파일이 그대로면 stat 한 번)
+    if _shared_reader is not None:
+        snapshot = _adopt_shared_snapshot(cached_data, snapshot)
 
-        # 다음 업데이트 시간 계산 (로그 메시지에만 사용)
-        next_update = current_time + datetime.timedelta(hours=24)
-        print(f"✅ 데이터 새로고침 완료! 다음 업데이트: {next_update.strftime('%Y-%m-%d %H:%M')}")
-    else:
+    checked_at = cached_data.get('checked_at')
+    if not _needs_refresh(snapshot, current_time, checked_at):
         # 남은 시간 계산 (로그 메시지에만 사용)
-        remaining_time = 86400 - (current_time - cached_data['last_update']).total_seconds()
+        remaining_time = _refresh_interval() - (current_time - _last_checked(snapshot, checked_at)).total_seconds()
         print(f"💾 캐시된 데이터 사용 (남은 시간: {round(remaining_time / 3600, 1)}시간)")
+        return snapshot
+
+    # Render 배포 시 초기 데이터 로드를 위해, 만약 캐시가 비어있다면 강제로 새로고침
+    if snapshot is None:
+        print("Initial data load for Render deployment: Forcing data refresh.")
+        return None
+
+    if REFRESH_MODE == 'background':
+        age = (current_time - _last_checked(snapshot, checked_at)).total_seconds()
+        if age <= MAX_STALENESS_SECONDS:
+            if _start_background_refresh(cached_data, snapshot):
+                print("♻️ 백그라운드 데이터 새로고침 시작 - 이전 스냅샷으로 응답합니다.")
+            else:
+                print(f"♻️ 이전 스냅샷으로 응답 (스냅샷 나이: {round(age / 3600, 1)}시간)")
+            return snapshot
+        print(f"⚠️ 스냅샷이 허용 시간({MAX_STALENESS_SECONDS}초)보다 오래되어 요청 스레드에서 새로고침합니다.")
+
+    return None
+
+
+def get_snapshot(cached_data):
+    """현재 캐시 스냅샷을 반환 (필요 시 REFRESH_MODE에 따라 새로고침)"""
+    snapshot = get_snapshot_nowait(cached_data)
+    if snapshot is None:
+        snapshot = _refresh(cached_data, cached_data.get('snapshot'))
+    return snapshot
+
+
+def get_win_probability_df(cached_data):
+    """승률 데이터를 가져오거나 캐시된 데이터 사용"""
+    return get_snapshot(cached_data)['win_probability_df']
 
-    return cached_data['win_probability_df']
+def get_win_probability_matrix(cached_data):
+    """캐시된 WinProbabilityMatrix 반환 (필요 시 새로고침)"""
+    return get_snapshot(cached_data)['win_probability_matrix']
 
 def get_predicted_team_rankings_df(cached_data):
-    """캐시된 팀 순위 예측 DataFrame을 반환"""
-    # get_win_probability_df 함수가 호출될 때 이미 데이터가 업데이트되었으므로,
-    # 여기서는 단순히 캐시된 데이터를 반환합니다.
-    if 'predicted_team_rankings_df' not in cached_data or cached_data['predicted_team_rankings_df'] is None:
-        print("⏳ 팀 순위 예측 데이터가 캐시되지 않았습니다. 데이터를 새로고침합니다.")
-        get_win_probability_df(cached_data)
-    return cached_data['predicted_team_rankings_df']
+    """캐시된 팀 순위 예측 DataFrame을 반환 (필요 시 새로고침)"""
+    return get_snapshot(cached_data)['predicted_team_rankings_df']
@@ -0,0 +1,130 @@
+# profiling.py
+# 선택적으로 켜는 cProfile 프로파일링 (API 요청과 일일 작업)
+#
+# - PROFILING=1 이면 모든 API 요청/일일 작업 단계를 프로파일링하고, PROFILE_SLOW_SECONDS 이상 걸린 것만 저장합니다.
+# - PROFILE_ADMIN_TOKEN을 설정하면 X-Profile-Token 헤더가 일치하는 요청은 PROFILING과 상관없이 항상 저장합니다.
+# - 저장 파일: PROFILE_DIR/<시각>_<이름>_<ms>ms.prof (snakeviz, pstats로 열기) + 누적 시간 상위 함수 요약(.txt)
+# - 파일은 최근 PROFILE_MAX_FILES개만 남기고 오래된 것부터 삭제합니다.
+#
+# cProfile은 시작한 스레드만 측정하므로, 일일 작업은 DAG 단계마다(스레드/자식 프로세스 안에서) 따로 프로파일링합니다.
+import cProfile
+import datetime
+import hmac
+import io
+import os
+import pstats
+import re
+import threading
+import time
+
+PROFILING_ENABLED = os.getenv('PROFILING', '0') == '1'
+PROFILE_SLOW_SECONDS = float(os.getenv('PROFILE_SLOW_SECONDS', '1.0'))
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'profiles'))
+PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', '50'))
+PROFILE_TOP_N = int(os.getenv('PROFILE_TOP_N', '30'))
+PROFILE_ADMIN_TOKEN = os.getenv('PROFILE_ADMIN_TOKEN')
+
+PROFILE_TOKEN_HEADER = 'X-Profile-Token'
+
+_local = threading.local()
+_rotate_lock = threading.Lock()
+
+
+class Session:
+    """진행 중인 프로파일링. stop()이 저장한 .prof 경로(저장하지 않았으면 None)를 반환합니다."""
+
+    def __init__(self, name, force):
+        self.name = name
+        self.force = force
+        self.profiler = cProfile.Profile()
+        self.start = time.perf_counter()
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+        _local.active = False
+        seconds = time.perf_counter() - self.start
+        if not self.force and seconds < PROFILE_SLOW_SECONDS:
+            return None
+        # 프로파일 저장 실패(디스크 가득 참, 권한 등)로 API 응답이나 일일 작업이 실패하지 않도록 로그만 남김
+        try:
+            return _save(self.profiler, self.name, seconds)
+        except Exception as e:
+            print(f"❌ 프로파일 저장 실패 ({self.name}): {e}")
+            return None
+
+
+def is_admin_token(token):
+    """요청 헤더의 토큰이 PROFILE_ADMIN_TOKEN과 일치하는지 (토큰이 설정되지 않았으면 항상 False)"""
+    if not PROFILE_ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode('utf-8'), PROFILE_ADMIN_TOKEN.encode('utf-8'))
+
+
+def start(name, force=False):
+    """프로파일링 시작. 꺼져 있거나 이 스레드에서 이미 프로파일링 중이면 None"""
+    if not (PROFILING_ENABLED or force) or getattr(_local, 'active', False):
+        return None
+    _local.active = True
+    try:
+        return Session(name, force)
+    except ValueError:
+        # 다른 프로파일러(디버거 등)가 이미 켜져 있으면 건너뜀
+        _local.active = False
+        return None
+
+
+class profile:
+    """with profile('daily_job'): ... 형태로 쓰는 start()/stop() 래퍼"""
+
+    def __init__(self, name, force=False):
+        self.name = name
+        self.force = force
+        self.session = None
+        self.path = None
+
+    def __enter__(self):
+        self.session = start(self.name, self.force)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.session is not None:
+            self.path = self.session.stop()
+        return False
+
+
+def summarize(profiler, top_n=PROFILE_TOP_N):
+    """누적 시간(cumulative) 기준 상위 함수 목록 텍스트"""
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats('cumulative').print_stats(top_n)
+    return stream.getvalue()
+
+
+def _save(profiler, name, seconds):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    safe_name = re.sub(r'[^0-9A-Za-z._-]+', '_', name).strip('_') or 'profile'
+    base = f"{datetime.datetime.now():%Y%m%d-%H%M%S-%f}_{safe_name}_{seconds * 1000:.0f}ms"
+    path = os.path.join(PROFILE_DIR, base + '.prof')
+    profiler.dump_stats(path)
+    with open(os.path.join(PROFILE_DIR, base + '.txt'), 'w', encoding='utf-8') as f:
+        f.write(f"{name}: {seconds:.3f}초 (pid {os.getpid()})\n\n")
+        f.write(summarize(profiler))
+    print(f"🔬 프로파일 저장 ({name}, {seconds:.2f}초): {path}")
+    _rotate()
+    return path
+
+
+def _rotate():
+    """최근 PROFILE_MAX_FILES개의 .prof(와 요약 .txt)만 남김"""
+    with _rotate_lock:
+        try:
+            names = sorted(name for name in os.listdir(PROFILE_DIR) if name.endswith('.prof'))
+        except OSError:
+            return
+        # 파일 이름이 시각으로 시작하므로 이름 순서가 곧 생성 순서
+        for name in names[:max(len(names) - PROFILE_MAX_FILES, 0)]:
+            for path in (name, name[:-len('.prof')] + '.txt'):
+                try:
+                    os.remove(os.path.join(PROFILE_DIR, path))
+                except OSError:
+                    pass
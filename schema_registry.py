@@ -0,0 +1,130 @@
+# schema_registry.py
+# 타자/투수 기록 프레임의 컬럼 계약 (이름, dtype, 단위, 원본 헤더)
+#
+# - 역대 데이터(historical_store 빌드)와 크롤링 데이터(crawler)는 수집 시점에 apply()로 한 번 변환합니다.
+# - 선수명/팀명은 category, 횟수는 int16, 비율/이닝은 float32이므로 object 컬럼 없이 합칠 수 있습니다 (concat).
+# - 컬럼을 추가하거나 dtype을 바꾸면 historical_store.STORE_VERSION과 crawl_engine.RECORD_PAGE_PARSER_KEY도 올려야 합니다.
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from innings import parse_innings
+from table_extract import TableSchema
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """컬럼 하나의 계약. source는 KBO 기록 페이지(Basic1) 헤더 이름 (페이지에 없는 컬럼은 None)"""
+    name: str
+    dtype: str  # 'int16' | 'float32' | 'category'
+    unit: str
+    source: str = None
+    # 원본 문자열이 일반 숫자 표기가 아닐 때의 형식 ('innings': "149 1/3" 등)
+    text_format: str = None
+
+
+def _columns(*specs):
+    return tuple(ColumnSpec(*spec) for spec in specs)
+
+
+PLAYER_SCHEMAS = {
+    'hitter': _columns(
+        ('선수명', 'category', '', '선수명'),
+        ('팀명', 'category', '', '팀명'),
+        ('AVG', 'float32', '비율', 'AVG'),
+        ('G', 'int16', '경기', 'G'),
+        ('PA', 'int16', '타석', 'PA'),
+        ('AB', 'int16', '타수', 'AB'),
+        ('R', 'int16', '득점', 'R'),
+        ('H', 'int16', '안타', 'H'),
+        ('2B', 'int16', '2루타', '2B'),
+        ('3B', 'int16', '3루타', '3B'),
+        ('HR', 'int16', '홈런', 'HR'),
+        ('TB', 'int16', '루타', 'TB'),
+        ('RBI', 'int16', '타점', 'RBI'),
+        ('SAC', 'int16', '희생번트', 'SAC'),
+        ('SF', 'int16', '희생플라이', 'SF'),
+        ('연도', 'int16', '시즌'),
+    ),
+    'pitcher': _columns(
+        ('선수명', 'category', '', '선수명'),
+        ('팀명', 'category', '', '팀명'),
+        ('ERA', 'float32', '자책점/9이닝', 'ERA'),
+        ('G', 'int16', '경기', 'G'),
+        ('W', 'int16', '승', 'W'),
+        ('L', 'int16', '패', 'L'),
+        ('SV', 'int16', '세이브', 'SV'),
+        ('HLD', 'int16', '홀드', 'HLD'),
+        ('WPCT', 'float32', '비율', 'WPCT'),
+        ('IP', 'float32', '이닝', 'IP', 'innings'),
+        ('H', 'int16', '피안타', 'H'),
+        ('HR', 'int16', '피홈런', 'HR'),
+        ('BB', 'int16', '볼넷', 'BB'),
+        ('HBP', 'int16', '사구', 'HBP'),
+        ('SO', 'int16', '탈삼진', 'SO'),
+        ('R', 'int16', '실점', 'R'),
+        ('ER', 'int16', '자책점', 'ER'),
+        ('WHIP', 'float32', '(피안타+볼넷)/이닝', 'WHIP'),
+        ('연도', 'int16', '시즌'),
+    ),
+}
+
+# 기록 페이지 셀 문자열을 읽을 때의 타입 (table_extract.COLUMN_TYPES)
+_TEXT_TYPES = {'int16': 'int', 'float32': 'float', 'category': 'str'}
+
+
+def column_names(kind):
+    """계약 순서대로의 컬럼 이름 (역대 데이터 원본 파일의 컬럼 순서와 같음)"""
+    return [spec.name for spec in PLAYER_SCHEMAS[kind]]
+
+
+def record_table_schema(kind):
+    """기록 페이지(Basic1) 테이블 스키마: 순위 + 원본 헤더가 있는 컬럼"""
+    columns = [('순위', 'int')]
+    columns += [(spec.source, spec.text_format or _TEXT_TYPES[spec.dtype])
+                for spec in PLAYER_SCHEMAS[kind] if spec.source is not None]
+    return TableSchema(tuple(columns))
+
+
+def _cast(series, spec):
+    if spec.dtype == 'category':
+        return series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    if spec.text_format == 'innings':
+        series = parse_innings(series)
+    elif series.dtype == object:
+        series = pd.to_numeric(series)
+    if spec.dtype == 'int16' and series.dtype != np.int16 and len(series):
+        # astype는 범위를 넘는 값을 조용히 잘라내므로 먼저 확인
+        info = np.iinfo(np.int16)
+        if series.min() < info.min or series.max() > info.max:
+            raise ValueError(f"'{spec.name}' 값이 int16 범위를 벗어납니다 ({series.min()} ~ {series.max()})")
+    return series.astype(spec.dtype, copy=False)
+
+
+def apply(df, kind):
+    """원본 헤더를 계약 이름으로 바꾸고 계약 dtype으로 변환 (계약 컬럼이 먼저, 나머지 컬럼은 그 뒤에 그대로)"""
+    specs = PLAYER_SCHEMAS[kind]
+    df = df.rename(columns={spec.source: spec.name for spec in specs if spec.source and spec.source != spec.name})
+    missing = [spec.name for spec in specs if spec.name not in df.columns]
+    if missing:
+        raise ValueError(f"{kind} 데이터에 계약 컬럼이 없습니다: {missing}")
+
+    names = [spec.name for spec in specs]
+    data = {spec.name: _cast(df[spec.name], spec) for spec in specs}
+    data.update({name: df[name] for name in df.columns if name not in data})
+    return pd.DataFrame(data, index=df.index, columns=names + [c for c in df.columns if c not in names])
+
+
+def concat(frames, kind):
+    """프레임들을 계약 dtype으로 합침. category 컬럼은 범주를 합쳐서 object로 바뀌지 않게 합니다.
+
+    수집 시점에 이미 변환된 프레임은 dtype이 같으므로 다시 변환하지 않습니다.
+    """
+    frames = [apply(frame, kind) for frame in frames]
+    for spec in PLAYER_SCHEMAS[kind]:
+        if spec.dtype != 'category':
+            continue
+        categories = pd.api.types.union_categoricals([frame[spec.name] for frame in frames], sort_categories=True).categories
+        frames = [frame.assign(**{spec.name: frame[spec.name].cat.set_categories(categories)}) for frame in frames]
+    return pd.concat(frames, ignore_index=True)
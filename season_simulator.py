@@ -0,0 +1,188 @@
+# season_simulator.py
+# 승률 행렬과 남은 경기 일정으로 정규시즌을 몬테카를로 방식으로 시뮬레이션 (순위 분포, 포스트시즌 진출 확률, 기대 승수)
+#
+# - 시즌 묶음(chunk)마다 모든 경기 결과를 난수 배열 한 번으로 뽑고, 팀별 승수는 (시즌 x 경기) @ (경기 x 팀) 행렬 곱 한 번으로 셉니다.
+# - 묶음마다 SeedSequence.spawn으로 독립 난수열을 쓰므로 결과는 seed와 시즌 수로만 정해집니다 (프로세스 수와 무관).
+# - 묶음이 여러 개면 프로세스 풀에 나눠 실행하고, 각 묶음은 집계값(팀별 순위 횟수, 승수 합)만 돌려줍니다.
+# - 일정의 승률은 원정팀(away)이 홈팀(home)을 이길 확률(API와 같은 방향)이며, 무승부/취소 경기는 고려하지 않습니다.
+# - 순위는 승률(승 / 경기 수) 순서이고, 승률이 같으면 시즌마다 무작위로 정합니다.
+import datetime
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import span
+
+# 포스트시즌 진출 팀 수 (KBO: 정규시즌 5위까지 와일드카드 결정전 진출)
+POSTSEASON_SPOTS = 5
+
+# 묶음 하나의 시즌 수 (경기 720개 기준 난수/승패 배열 약 30MB)
+SEASONS_PER_CHUNK = 10000
+
+# 묶음을 실행할 최대 프로세스 수 (1이면 현재 프로세스에서 실행)
+SIMULATION_PROCESSES = int(os.getenv('SEASON_SIMULATION_PROCESSES', str(os.cpu_count() or 1)))
+
+# 이보다 적은 시즌 수는 프로세스를 띄우는 비용이 더 크므로 현재 프로세스에서 실행
+MIN_PARALLEL_SEASONS = 200000
+
+
+@dataclass(frozen=True)
+class SeasonSimulation:
+    """시뮬레이션 집계 결과. rank_counts[i, r]는 teams[i]가 r+1위로 끝난 시즌 수"""
+    teams: tuple
+    n_seasons: int
+    rank_counts: np.ndarray
+    expected_wins: np.ndarray
+    games: np.ndarray
+    postseason_spots: int
+    seed: int
+
+    def rank_distribution(self):
+        """팀 x 최종 순위(1부터) 확률(%) DataFrame"""
+        ranks = range(1, len(self.teams) + 1)
+        return pd.DataFrame(self.rank_counts / self.n_seasons * 100, index=list(self.teams), columns=list(ranks))
+
+    def postseason_odds(self):
+        """팀별 포스트시즌 진출 확률(%)"""
+        spots = self.rank_counts[:, :self.postseason_spots].sum(axis=1)
+        return pd.Series(spots / self.n_seasons * 100, index=list(self.teams))
+
+    def to_frame(self):
+        """팀별 요약 (기대 승수/패수, 평균 순위, 포스트시즌 진출 확률) - 평균 순위 오름차순"""
+        ranks = np.arange(1, len(self.teams) + 1)
+        frame = pd.DataFrame({
+            'team_name': list(self.teams),
+            'expected_wins': self.expected_wins,
+            'expected_losses': self.games - self.expected_wins,
+            'average_rank': self.rank_counts @ ranks / self.n_seasons,
+            'postseason_probability': self.postseason_odds().to_numpy(),
+        })
+        return frame.sort_values('average_rank', kind='stable').reset_index(drop=True)
+
+
+def _schedule_arrays(win_probability_matrix, schedule):
+    """일정(away, home)을 팀 인덱스 배열과 원정팀 승리 확률(0~1) 배열로 변환"""
+    unknown = sorted(set(schedule['away']).union(schedule['home']) - set(win_probability_matrix.teams))
+    if unknown:
+        raise ValueError(f"승률 행렬에 없는 팀이 일정에 있습니다: {unknown}")
+    away = schedule['away'].map(win_probability_matrix.team_index).to_numpy(dtype=np.intp)
+    home = schedule['home'].map(win_probability_matrix.team_index).to_numpy(dtype=np.intp)
+
+    p_away = win_probability_matrix.probabilities[away, home] / 100
+    if np.isnan(p_away).any():
+        games = schedule[np.isnan(p_away)][['away', 'home']].head().to_dict(orient='records')
+        raise ValueError(f"승률을 계산할 수 없는 경기가 있습니다 (같은 팀 간 경기 등): {games}")
+    return away, home, p_away
+
+
+def _team_counts(win_probability_matrix, counts, name):
+    """{팀: 횟수}를 행렬 팀 순서의 배열로 변환 (없는 팀은 0)"""
+    result = np.zeros(len(win_probability_matrix), dtype=np.int64)
+    for team, count in (counts or {}).items():
+        if team not in win_probability_matrix:
+            raise ValueError(f"{name}에 승률 행렬에 없는 팀이 있습니다: {team!r}")
+        result[win_probability_matrix.team_index[team]] = count
+    return result
+
+
+def _simulate_chunk(seed_sequence, n_seasons, away, home, p_away, current_wins, games):
+    """n_seasons개 시즌을 한 번에 시뮬레이션해 (팀 x 순위 횟수, 팀별 승수 합) 반환 (프로세스 풀에서 실행되므로 최상위 함수)"""
+    rng = np.random.default_rng(seed_sequence)
+    n_teams = len(current_wins)
+    n_games = len(p_away)
+
+    # 경기마다 원정팀이 이기면 원정팀 +1, 지면 홈팀 +1 이므로
+    # 승수 = 현재 승수 + 홈 경기 수 + 원정 승리 여부 @ (원정팀 +1, 홈팀 -1)
+    swing = np.zeros((n_games, n_teams), dtype=np.float32)
+    np.add.at(swing, (np.arange(n_games), away), 1)
+    np.add.at(swing, (np.arange(n_games), home), -1)
+    base_wins = current_wins + np.bincount(home, minlength=n_teams)
+
+    away_won = rng.random((n_seasons, n_games), dtype=np.float32) < p_away.astype(np.float32)
+    # float32 행렬 곱은 2^24까지의 정수를 정확히 셉니다.
+    wins = (away_won.astype(np.float32) @ swing).astype(np.int64) + base_wins
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        win_rate = np.where(games > 0, wins / games, 0.0)
+    # 승률 내림차순, 같으면 무작위 (lexsort는 마지막 키가 우선)
+    order = np.lexsort((rng.random(win_rate.shape), -win_rate), axis=-1)
+
+    # order[s, r]는 시즌 s에서 r+1위 팀이므로 (팀, 순위) 쌍을 한 번에 셉니다.
+    rank_counts = np.bincount((order * n_teams + np.arange(n_teams)).ravel(), minlength=n_teams * n_teams)
+    return rank_counts.reshape(n_teams, n_teams), wins.sum(axis=0)
+
+
+def simulate_season(win_probability_matrix, schedule, n_seasons=100000, current_wins=None, current_losses=None,
+                    seed=None, processes=None, postseason_spots=POSTSEASON_SPOTS):
+    """남은 일정(DataFrame: away, home)을 n_seasons번 시뮬레이션한 SeasonSimulation 반환
+
+    current_wins/current_losses({팀: 횟수})를 주면 현재 성적에 더해 최종 승률과 순위를 정합니다.
+    seed가 같으면 processes와 상관없이 같은 결과가 나옵니다.
+    """
+    if n_seasons < 1:
+        raise ValueError(f"n_seasons는 1 이상이어야 합니다: {n_seasons}")
+    away, home, p_away = _schedule_arrays(win_probability_matrix, schedule)
+    wins = _team_counts(win_probability_matrix, current_wins, 'current_wins')
+    losses = _team_counts(win_probability_matrix, current_losses, 'current_losses')
+    n_teams = len(win_probability_matrix)
+    games = wins + losses + np.bincount(away, minlength=n_teams) + np.bincount(home, minlength=n_teams)
+
+    seed_sequence = np.random.SeedSequence(seed)
+    chunk_sizes = [SEASONS_PER_CHUNK] * (n_seasons // SEASONS_PER_CHUNK)
+    if n_seasons % SEASONS_PER_CHUNK:
+        chunk_sizes.append(n_seasons % SEASONS_PER_CHUNK)
+    chunks = [(child, size, away, home, p_away, wins, games)
+              for child, size in zip(seed_sequence.spawn(len(chunk_sizes)), chunk_sizes)]
+
+    processes = SIMULATION_PROCESSES if processes is None else processes
+    processes = min(processes, len(chunks)) if n_seasons >= MIN_PARALLEL_SEASONS else 1
+
+    with span('season_simulation', rows_in=n_seasons * len(p_away), processes=str(processes)):
+        if processes > 1:
+            # 스레드가 도는 웹/일일 작업 프로세스에서도 안전하도록 pipeline_dag와 같이 spawn 사용
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as pool:
+                results = list(pool.map(_simulate_chunk, *zip(*chunks)))
+        else:
+            results = [_simulate_chunk(*chunk) for chunk in chunks]
+
+    rank_counts = sum(counts for counts, _ in results)
+    wins_total = sum(total for _, total in results)
+    return SeasonSimulation(
+        teams=win_probability_matrix.teams,
+        n_seasons=n_seasons,
+        rank_counts=rank_counts,
+        expected_wins=wins_total / n_seasons,
+        games=games,
+        postseason_spots=postseason_spots,
+        seed=seed_sequence.entropy,
+    )
+
+
+def crawl_remaining_schedule(end_date, start_date=None):
+    """start_date(기본: 오늘)부터 end_date까지의 정규시즌 일정 (크롤러는 이 경로에서만 불러옴)"""
+    import crawler
+
+    start_date = start_date or datetime.date.today()
+    if end_date < start_date:
+        return pd.DataFrame(columns=['date', 'time', 'away', 'home'])
+    return crawler.crawl_schedule(start_date, (end_date - start_date).days + 1)
+
+
+if __name__ == '__main__':
+    # 사용법: python season_simulator.py <정규시즌 마지막 날짜 YYYY-MM-DD> [시즌 수]
+    # DB에 저장된 최신 승률 행렬(tasks.py 결과)과 오늘부터의 남은 일정을 사용합니다.
+    import db_utils
+
+    season_end = datetime.date.fromisoformat(sys.argv[1])
+    seasons = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    _, matrix, _ = db_utils.load_prediction_snapshot(db_utils.get_db_engine())
+    remaining = crawl_remaining_schedule(season_end)
+    print(f"🎲 남은 경기 {len(remaining)}개를 {seasons}번 시뮬레이션합니다.")
+    simulation = simulate_season(matrix, remaining, n_seasons=seasons)
+    print(simulation.to_frame().to_string(index=False))
+    print(simulation.rank_distribution().round(1).to_string())
@@ -0,0 +1,135 @@
+# shared_snapshot.py
+# gunicorn 워커 간 예측 스냅샷 공유 (메모리 맵 파일)
+#
+# 파일 구조: [헤더][메타데이터 JSON][8바이트 정렬된 float64 승률 행렬]
+# - 헤더: 매직 바이트, 버전, 팀 수, 메타데이터 길이, 행렬 오프셋
+# - 게시(publish)는 임시 파일을 다 쓴 뒤 os.replace로 바꿔치기하므로, 읽는 워커는 항상 완전한 파일만 봅니다.
+# - 읽는 쪽은 파일을 mmap으로 열고 행렬을 np.frombuffer로 복사 없이 참조합니다.
+import contextlib
+import datetime
+import fcntl
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from win_probability import WinProbabilityMatrix
+
+_MAGIC = b'KBOSNAP1'
+_HEADER = struct.Struct('<8sQQQQ')  # magic, version, n_teams, meta_length, matrix_offset
+
+
+def _read_version(path):
+    """현재 게시된 파일의 버전 (없거나 손상되었으면 0)"""
+    try:
+        with open(path, 'rb') as f:
+            magic, version, _, _, _ = _HEADER.unpack(f.read(_HEADER.size))
+    except (OSError, struct.error):
+        return 0
+    return version if magic == _MAGIC else 0
+
+
+def publish_snapshot(path, snapshot):
+    """스냅샷(승률 행렬, 팀 순위, 갱신 시각)을 공유 파일로 원자적으로 게시하고 새 버전 번호 반환"""
+    matrix = snapshot['win_probability_matrix']
+    rankings_df = snapshot['predicted_team_rankings_df']
+    prediction_date = snapshot.get('prediction_date')
+
+    meta = json.dumps({
+        'teams': list(matrix.teams),
+        'rankings': rankings_df.to_dict(orient='split', index=False),
+        'last_update': snapshot['last_update'].isoformat(),
+        'prediction_date': None if prediction_date is None else str(prediction_date),
+    }, ensure_ascii=False).encode('utf-8')
+
+    # 같은 시각에 게시되어도 버전이 항상 증가하도록 이전 버전 + 1 이상으로 설정
+    version = max(_read_version(path) + 1, time.time_ns())
+    matrix_offset = (_HEADER.size + len(meta) + 7) // 8 * 8
+    probabilities = np.ascontiguousarray(matrix.probabilities, dtype=np.float64)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.snapshot-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, version, len(matrix.teams), len(meta), matrix_offset))
+            f.write(meta)
+            f.write(b'\0' * (matrix_offset - _HEADER.size - len(meta)))
+            f.write(probabilities.tobytes())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+    print(f"📤 공유 스냅샷 게시 완료 (버전: {version}, 팀 {len(matrix.teams)}개)")
+    return version
+
+
+class SharedSnapshotReader:
+    """공유 스냅샷 파일을 메모리 맵으로 붙어서 읽음. 파일이 교체되면 다음 current() 호출에서 새 버전을 엽니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file_id = None
+        self._snapshot = None
+
+    def current(self):
+        """최신 게시 스냅샷 반환 (없으면 None). 파일이 바뀌지 않았다면 stat 한 번으로 끝납니다."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_id != self._file_id:
+            self._snapshot = self._attach()
+            self._file_id = file_id
+        return self._snapshot
+
+    def _attach(self):
+        with open(self.path, 'rb') as f:
+            # 매핑은 파일을 닫거나 다른 파일로 교체한 뒤에도 유효하며, 이전 버전은 참조가 사라질 때 해제됩니다.
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n_teams, meta_length, matrix_offset = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"공유 스냅샷 파일 형식이 올바르지 않습니다: {self.path}")
+
+        meta = json.loads(bytes(mapped[_HEADER.size:_HEADER.size + meta_length]).decode('utf-8'))
+        probabilities = np.frombuffer(mapped, dtype=np.float64, count=n_teams * n_teams, offset=matrix_offset)
+        matrix = WinProbabilityMatrix(teams=meta['teams'], probabilities=probabilities.reshape(n_teams, n_teams))
+        rankings_df = pd.DataFrame(meta['rankings']['data'], columns=meta['rankings']['columns'])
+
+        print(f"📥 공유 스냅샷 연결 (버전: {version}, 팀 {n_teams}개)")
+        return {
+            'hitter_data': None,
+            'pitcher_data': None,
+            'win_probability_matrix': matrix,
+            'win_probability_df': matrix.to_frame(),
+            'predicted_team_rankings_df': rankings_df,
+            'prediction_date': meta['prediction_date'],
+            'last_update': datetime.datetime.fromisoformat(meta['last_update']),
+            'shared_version': version,
+        }
+
+
+@contextlib.contextmanager
+def refresh_lock(path, blocking=False):
+    """워커 간 새로고침 잠금 (flock). 잠금을 얻으면 True, 다른 워커가 갖고 있으면(blocking=False) False를 넘겨줌"""
+    with open(path + '.lock', 'a') as lock_file:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(lock_file, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
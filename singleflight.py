@@ -0,0 +1,107 @@
+# singleflight.py
+# 같은 작업(예: 캐시 새로고침)에 대한 동시 호출을 하나로 합치는 조정자
+import collections
+import datetime
+import threading
+import time
+
+
+class _Call:
+    """진행 중인 호출 하나의 상태"""
+
+    def __init__(self, key):
+        self.key = key
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.coalesced = 0
+        self.started_at = datetime.datetime.now()
+
+
+class SingleFlight:
+    """키별로 한 호출자만 작업을 실행하고, 그 사이 들어온 호출자는 결과를 기다리거나(do) 건너뛰게(start) 합니다."""
+
+    def __init__(self, history_size=20):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._flights = 0
+        self._coalesced = 0
+        self._history = collections.deque(maxlen=history_size)
+
+    def in_flight(self, key):
+        """key에 대한 작업이 진행 중이면 True"""
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key, fn):
+        """key에 대해 fn을 실행하고 결과 반환. 이미 진행 중이면 새로 실행하지 않고 그 결과(또는 예외)를 공유"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._begin(key)
+            else:
+                call.coalesced += 1
+                self._coalesced += 1
+
+        if leader:
+            self._run(call, fn)
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def start(self, key, fn):
+        """fn을 백그라운드 스레드에서 실행. 이미 진행 중이면 기다리지 않고 합류만 기록한 뒤 False 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.coalesced += 1
+                self._coalesced += 1
+                return False
+            call = self._begin(key)
+
+        thread = threading.Thread(target=self._run, args=(call, fn), name=f'singleflight-{key}', daemon=True)
+        thread.start()
+        return True
+
+    def stats(self):
+        """누적 카운터와 최근 작업별 합류 호출자 수"""
+        with self._lock:
+            in_flight = [
+                {'key': call.key, 'started_at': call.started_at.isoformat(), 'coalesced': call.coalesced}
+                for call in self._calls.values()
+            ]
+            return {
+                'flights': self._flights,
+                'coalesced_callers': self._coalesced,
+                'in_flight': in_flight,
+                'recent': list(self._history),
+            }
+
+    def _begin(self, key):
+        # self._lock을 잡은 상태에서 호출
+        call = _Call(key)
+        self._calls[key] = call
+        self._flights += 1
+        return call
+
+    def _run(self, call, fn):
+        start = time.perf_counter()
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+        finally:
+            with self._lock:
+                del self._calls[call.key]
+                self._history.append({
+                    'key': call.key,
+                    'started_at': call.started_at.isoformat(),
+                    'duration_seconds': round(time.perf_counter() - start, 3),
+                    'coalesced': call.coalesced,
+                    'error': None if call.error is None else str(call.error),
+                })
+            call.done.set()
@@ -0,0 +1,282 @@
+# table_extract.py
+# 기록 페이지 HTML에서 테이블과 postback 폼 상태를 추출 (BeautifulSoup 트리를 만들지 않는 가벼운 파서)
+#
+# - lxml이 설치되어 있으면 lxml로, 없으면 표준 라이브러리 html.parser를 스트리밍 방식으로 사용합니다.
+# - 셀 값은 선언된 스키마(TableSchema)에 따라 바로 타입별 컬럼 버퍼(array.array)에 쌓이고,
+#   DataFrame을 만들 때 np.frombuffer로 복사 없이 감쌉니다. 스키마가 없으면 모든 값은 문자열입니다.
+# - 헤더는 페이지마다 한 번만 스키마와 비교하고, 변환할 수 없는 값은 페이지 단위로 모아 한 번에 보고합니다.
+import array
+import html.parser
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from innings import InningsParseError, parse_innings
+
+try:
+    import lxml.html
+except ImportError:  # 선택 의존성: 없으면 html.parser 사용
+    lxml = None
+
+# 스키마에서 사용할 수 있는 컬럼 타입
+COLUMN_TYPES = ('str', 'int', 'float', 'innings')
+
+# 실수 컬럼에서 결측으로 처리할 표기 (타수가 없는 선수의 타율 등)
+MISSING_MARKS = frozenset(['', '-'])
+
+# 오류 메시지에 보여줄 잘못된 값의 최대 개수
+MAX_REPORTED_VALUES = 10
+
+
+class TableSchemaError(ValueError):
+    """헤더가 스키마와 다르거나 셀 값을 선언된 타입으로 변환할 수 없음"""
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """테이블 컬럼 이름과 타입 ((이름, 타입), ...) 목록. 타입은 COLUMN_TYPES 중 하나"""
+    columns: tuple
+
+    @property
+    def names(self):
+        return tuple(name for name, _ in self.columns)
+
+    def validate(self, headers):
+        """헤더가 스키마와 같은 순서로 일치하지 않으면 TableSchemaError"""
+        if tuple(headers) == self.names:
+            return
+        missing = [name for name in self.names if name not in headers]
+        unexpected = [name for name in headers if name not in self.names]
+        raise TableSchemaError(
+            f"테이블 헤더가 스키마와 다릅니다 (누락: {missing}, 추가: {unexpected}, 헤더: {list(headers)})"
+        )
+
+
+class _ColumnSink:
+    """셀 값을 컬럼별 타입 버퍼에 쌓고 DataFrame으로 변환"""
+
+    _TYPECODES = {'int': 'q', 'float': 'd'}
+
+    def __init__(self, headers, schema):
+        if schema is not None:
+            schema.validate(headers)
+            types = [column_type for _, column_type in schema.columns]
+        else:
+            types = ['str'] * len(headers)
+        self.headers = list(headers)
+        self.types = types
+        self.buffers = [array.array(self._TYPECODES[t]) if t in self._TYPECODES else [] for t in types]
+        self.errors = {}  # 컬럼 이름 -> [(행 번호(1부터), 값)]
+        self.n_rows = 0
+
+    def add_row(self, cells):
+        if len(cells) != len(self.headers):
+            raise TableSchemaError(f"{self.n_rows + 1}번째 행의 칸 수({len(cells)})가 헤더({len(self.headers)})와 다릅니다.")
+        for j, text in enumerate(cells):
+            column_type = self.types[j]
+            buffer = self.buffers[j]
+            if column_type == 'float':
+                try:
+                    buffer.append(float('nan') if text in MISSING_MARKS else float(text))
+                except ValueError:
+                    buffer.append(float('nan'))
+                    self.errors.setdefault(self.headers[j], []).append((self.n_rows + 1, text))
+            elif column_type == 'int':
+                try:
+                    buffer.append(int(text))
+                except ValueError:
+                    buffer.append(0)
+                    self.errors.setdefault(self.headers[j], []).append((self.n_rows + 1, text))
+            else:
+                buffer.append(text)
+        self.n_rows += 1
+
+    def to_frame(self):
+        data = {}
+        for name, column_type, buffer in zip(self.headers, self.types, self.buffers):
+            if column_type == 'int':
+                data[name] = np.frombuffer(buffer, dtype=np.int64)
+            elif column_type == 'float':
+                data[name] = np.frombuffer(buffer, dtype=np.float64)
+            elif column_type == 'innings':
+                try:
+                    data[name] = parse_innings(pd.Series(buffer, dtype=object)).to_numpy()
+                except InningsParseError as e:
+                    self.errors[name] = [(row + 1, value) for row, value in e.invalid.items()]
+            else:
+                data[name] = np.array(buffer, dtype=object)
+
+        if self.errors:
+            details = '; '.join(
+                f"{name}: " + ', '.join(f"{row}행 {value!r}" for row, value in values[:MAX_REPORTED_VALUES])
+                + (f" 외 {len(values) - MAX_REPORTED_VALUES}개" if len(values) > MAX_REPORTED_VALUES else '')
+                for name, values in self.errors.items()
+            )
+            raise TableSchemaError(f"선언된 타입으로 변환할 수 없는 값이 있습니다 - {details}")
+        return pd.DataFrame(data, columns=self.headers)
+
+
+def _has_class(attrs, name):
+    return name in (dict(attrs).get('class') or '').split()
+
+
+class _RecordPageParser(html.parser.HTMLParser):
+    """html.parser 백엔드: 문서를 한 번 훑으면서 필요한 요소만 모음 (트리를 만들지 않음)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.headers = []
+        self.rows = []
+        self.hidden = {}
+        self.selects = {}
+        self.anchors = []  # (href, 텍스트, class 목록)
+
+        self._div_stack = []  # 열린 div마다 (record_result 여부, paging 여부)
+        self._table_depth = 0  # record_result 테이블 안의 table 중첩 깊이
+        self._table_done = False
+        self._section = None
+        self._row = None
+        self._cell = None
+        self._select = None  # [이름, 첫 option 값, 선택된 option 값]
+        self._anchor = None
+
+    def _in_result_div(self):
+        return bool(self._div_stack) and self._div_stack[-1][0]
+
+    def _in_paging(self):
+        return any(paging for _, paging in self._div_stack)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'div':
+            self._div_stack.append((_has_class(attrs, 'record_result'), _has_class(attrs, 'paging')))
+        elif tag == 'table':
+            # div.record_result의 직속 첫 테이블만 사용
+            if self._table_depth:
+                self._table_depth += 1
+            elif not self._table_done and self._in_result_div():
+                self._table_depth = 1
+        elif self._table_depth == 1 and tag in ('thead', 'tbody'):
+            self._section = tag
+        elif self._table_depth == 1 and tag == 'tr':
+            self._finish_row()
+            if self._section == 'tbody':
+                self._row = []
+        elif self._table_depth == 1 and tag in ('th', 'td'):
+            self._finish_cell()
+            if (self._section == 'thead' and tag == 'th') or (self._row is not None and tag == 'td'):
+                self._cell = []
+        elif tag == 'input':
+            attrs = dict(attrs)
+            if (attrs.get('type') or '').lower() == 'hidden' and attrs.get('name'):
+                self.hidden[attrs['name']] = attrs.get('value') or ''
+        elif tag == 'select':
+            name = dict(attrs).get('name')
+            self._select = [name, None, None] if name else None
+        elif tag == 'option' and self._select is not None:
+            attrs = dict(attrs)
+            value = attrs.get('value') or ''
+            if self._select[1] is None:
+                self._select[1] = value
+            if 'selected' in attrs and self._select[2] is None:
+                self._select[2] = value
+        elif tag == 'a' and self._in_paging():
+            attrs = dict(attrs)
+            self._anchor = [attrs.get('href') or '', [], (attrs.get('class') or '').split()]
+
+    def handle_endtag(self, tag):
+        if tag == 'div':
+            if self._div_stack:
+                self._div_stack.pop()
+        elif tag == 'table' and self._table_depth:
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._finish_row()
+                self._table_done = True
+        elif self._table_depth == 1 and tag in ('th', 'td'):
+            self._finish_cell()
+        elif self._table_depth == 1 and tag == 'tr':
+            self._finish_row()
+        elif self._table_depth == 1 and tag in ('thead', 'tbody'):
+            self._finish_row()
+            self._section = None
+        elif tag == 'select' and self._select is not None:
+            name, first, selected = self._select
+            self.selects[name] = selected if selected is not None else (first or '')
+            self._select = None
+        elif tag == 'a' and self._anchor is not None:
+            href, texts, classes = self._anchor
+            self.anchors.append((href, ''.join(texts), classes))
+            self._anchor = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data.strip())
+        if self._anchor is not None:
+            self._anchor[1].append(data.strip())
+
+    def _finish_cell(self):
+        if self._cell is None:
+            return
+        text = ''.join(self._cell)
+        self._cell = None
+        if self._section == 'thead':
+            self.headers.append(text)
+        elif self._row is not None:
+            self._row.append(text)
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+
+
+def _text(element):
+    # BeautifulSoup get_text(strip=True)와 같이 텍스트 조각마다 공백을 제거한 뒤 이어 붙임
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _extract_lxml(document):
+    doc = lxml.html.document_fromstring(document)
+    tables = doc.xpath("//div[contains(concat(' ', normalize-space(@class), ' '), ' record_result ')]/table")
+    if not tables:
+        raise TableSchemaError("기록 테이블(div.record_result > table)을 찾을 수 없습니다.")
+    table = tables[0]
+    headers = [_text(th) for th in table.xpath('./thead//th')]
+    rows = ([_text(td) for td in tr.xpath('./td')] for tr in table.xpath('./tbody/tr'))
+
+    # type 값은 대소문자를 구분하지 않음 (_RecordPageParser와 같이 'HIDDEN'도 hidden으로 처리)
+    hidden = {tag.get('name'): tag.get('value') or ''
+              for tag in doc.xpath("//input[translate(@type, 'HIDEN', 'hiden')='hidden'][@name]")}
+    selects = {}
+    for select in doc.xpath('//select[@name]'):
+        options = select.xpath('.//option[@selected]') or select.xpath('.//option')
+        selects[select.get('name')] = (options[0].get('value') or '') if options else ''
+    anchors = [
+        (anchor.get('href') or '', _text(anchor), (anchor.get('class') or '').split())
+        for anchor in doc.xpath("//div[contains(concat(' ', normalize-space(@class), ' '), ' paging ')]//a")
+    ]
+    return headers, rows, hidden, selects, anchors
+
+
+def _extract_stdlib(document):
+    parser = _RecordPageParser()
+    parser.feed(document)
+    parser.close()
+    if not parser._table_done and not parser.headers:
+        raise TableSchemaError("기록 테이블(div.record_result > table)을 찾을 수 없습니다.")
+    return parser.headers, parser.rows, parser.hidden, parser.selects, parser.anchors
+
+
+def extract_record_page(document, schema=None):
+    """(테이블 DataFrame, hidden 값, 드롭다운 선택 값, 페이저 링크 [(href, 텍스트, class 목록)]) 반환
+
+    schema가 있으면 헤더를 검증하고 컬럼을 선언된 타입으로 변환합니다.
+    """
+    extract = _extract_lxml if lxml is not None else _extract_stdlib
+    headers, rows, hidden, selects, anchors = extract(document)
+    sink = _ColumnSink(headers, schema)
+    for cells in rows:
+        sink.add_row(cells)
+    return sink.to_frame(), hidden, selects, anchors
@@ -1,44 +1,94 @@
 # tasks.py
 from crawler import crawl_hitter_data, crawl_pitcher_data, load_historical_data
 from data_processor import process_hitter_data, process_pitcher_data
-from predictor import generate_win_probability_df
+from predictor import generate_win_probability_matrix
 from db_utils import save_win_probabilities, save_team_rankings, save_hitter_data, save_pitcher_data # save_hitter_data, save_pitcher_data 임포트 추가 필요
+from pipeline_dag import Pipeline
+import instrumentation
 import datetime
+import os
 
-def run_daily_prediction_job():
-    """매일 실행될 예측 및 DB 저장 작업"""
-    print(f"⏰ {datetime.datetime.now()}: 일일 예측 및 DB 적재 작업을 시작합니다.")
+# 학습 단계를 실행할 프로세스 수 (0이면 모든 단계를 스레드에서 실행)
+DAILY_JOB_PROCESSES = int(os.getenv('DAILY_JOB_PROCESSES', '2'))
 
-    try:
-        # 1. 데이터 크롤링
-        hitter_data_2025 = crawl_hitter_data()
-        pitcher_data_2025 = crawl_pitcher_data()
+# 실행 보고서(JSON) 저장 경로. 지정하지 않으면 .cache/reports/daily_job_<시작 시각>.json
+DAILY_JOB_REPORT_PATH = os.getenv('DAILY_JOB_REPORT_PATH')
+REPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'reports')
+
+
+# 프로세스 풀에서 실행되는 단계는 pickle 가능하도록 모듈 최상위 함수로 둡니다.
+def _process_hitters(hitter_data_2025, historical_data):
+    return process_hitter_data(hitter_data_2025, historical_data[0])
+
+
+def _process_pitchers(pitcher_data_2025, historical_data):
+    return process_pitcher_data(pitcher_data_2025, historical_data[1])
+
+
+def build_daily_pipeline():
+    """일일 작업 DAG: 타자/투수 분기는 승률 계산 전까지 서로 독립적으로 동시에 실행됩니다."""
+    pipeline = Pipeline('daily_job', max_threads=4, max_processes=DAILY_JOB_PROCESSES)
+
+    # 1. 데이터 크롤링 / 2. 역대 데이터 로드 (I/O, 스레드)
+    pipeline.add('crawl_hitters', crawl_hitter_data)
+    pipeline.add('crawl_pitchers', crawl_pitcher_data)
+    pipeline.add('load_history', load_historical_data)
 
-        # 2. 역대 데이터 로드
-        hitter_data_his, pitcher_data_his = load_historical_data()
+    # 3. 데이터 처리 (sklearn 학습, 프로세스)
+    pipeline.add('process_hitters', _process_hitters, deps=('crawl_hitters', 'load_history'), executor='process')
+    pipeline.add('process_pitchers', _process_pitchers, deps=('crawl_pitchers', 'load_history'), executor='process')
 
-        # 3. 데이터 처리
-        all_hitter_data = process_hitter_data(hitter_data_2025, hitter_data_his)
-        all_pitcher_data = process_pitcher_data(pitcher_data_2025, pitcher_data_his)
+    # 4. 승률 예측 및 팀 순위 예측
+    # 승률은 WinProbabilityMatrix, 팀 순위는 DataFrame으로 반환됩니다.
+    pipeline.add('predict', generate_win_probability_matrix, deps=('process_hitters', 'process_pitchers'))
 
-        # 4. 승률 예측 및 팀 순위 예측
-        # generate_win_probability_df는 이제 두 개의 DataFrame을 반환합니다.
-        win_probability_df, predicted_team_rankings_df = generate_win_probability_df(all_hitter_data, all_pitcher_data)
+    # 5. DB 저장 (서로 다른 테이블이므로 동시에 실행, 선수 기록은 해당 분기가 끝나는 즉시 저장)
+    pipeline.add('save_hitter_data', save_hitter_data, deps=('process_hitters',))
+    pipeline.add('save_pitcher_data', save_pitcher_data, deps=('process_pitchers',))
+    pipeline.add('save_win_probabilities', lambda prediction: save_win_probabilities(prediction[0]), deps=('predict',))
+    pipeline.add('save_team_rankings', lambda prediction: save_team_rankings(prediction[1]), deps=('predict',))
+    return pipeline
 
-        # 5. DB 저장
-        # db_utils에 save_hitter_data와 save_pitcher_data 함수가 있다고 가정하고 호출합니다.
-        save_hitter_data(all_hitter_data)
-        save_pitcher_data(all_pitcher_data)
-        save_win_probabilities(win_probability_df)
-        save_team_rankings(predicted_team_rankings_df)
+
+def run_daily_prediction_job():
+    """매일 실행될 예측 및 DB 저장 작업"""
+    started_at = datetime.datetime.now()
+    print(f"⏰ {started_at}: 일일 예측 및 DB 적재 작업을 시작합니다.")
+
+    instrumentation.reset()
+    pipeline = build_daily_pipeline()
+    status, error = 'success', None
+    try:
+        pipeline.run()
 
         print(f"✅ {datetime.datetime.now()}: 일일 예측 및 DB 적재 작업이 성공적으로 완료되었습니다.")
 
     except Exception as e:
+        status, error = 'failed', f"{type(e).__name__}: {e}"
         print(f"❌ {datetime.datetime.now()}: 일일 예측 및 DB 적재 작업 중 치명적인 오류 발생: {e}")
         # GitHub Actions가 실패했음을 명확히 하기 위해 예외를 다시 발생시킵니다.
         raise
 
+    finally:
+        _write_run_report(pipeline, started_at, status, error)
+
+
+def _write_run_report(pipeline, started_at, status, error):
+    """단계별 소요 시간, 크리티컬 패스, 계측 구간을 JSON 실행 보고서로 저장 (실패해도 작업 결과에는 영향 없음)"""
+    path = DAILY_JOB_REPORT_PATH or os.path.join(REPORT_DIR, f"daily_job_{started_at:%Y%m%d-%H%M%S}.json")
+    try:
+        instrumentation.write_run_report(
+            path,
+            started_at=started_at.isoformat(),
+            finished_at=datetime.datetime.now().isoformat(),
+            status=status,
+            error=error,
+            stages=pipeline.timings,
+            critical_path=pipeline.critical_path(),
+        )
+    except Exception as e:
+        print(f"⚠️ 실행 보고서 저장 실패: {e}")
+
 # 이 부분이 핵심입니다: 스크립트가 직접 실행될 때 run_daily_prediction_job 함수를 호출합니다.
 if __name__ == "__main__":
     run_daily_prediction_job()
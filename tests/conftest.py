@@ -0,0 +1,26 @@
+# tests/conftest.py
+# 테스트 공통 설정
+#
+# - 저장소 루트의 모듈(predictor, db_utils 등)을 바로 불러올 수 있도록 import 경로에 추가합니다.
+# - 모듈을 불러오기 전에 캐시/DB/모델 저장 위치를 임시 디렉터리로 돌려 실제 데이터를 건드리지 않습니다.
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORK_DIR = tempfile.mkdtemp(prefix='kbo-tests-')
+
+os.environ['DB_URI'] = 'sqlite:///' + os.path.join(WORK_DIR, 'tests.db')
+os.environ['KBO_PAGE_CACHE_DIR'] = os.path.join(WORK_DIR, 'pages')
+os.environ['TRAINING_CACHE_DIR'] = os.path.join(WORK_DIR, 'training')
+os.environ['MODEL_REGISTRY_DIR'] = os.path.join(WORK_DIR, 'models')
+os.environ.pop('PREDICTION_SHARED_SNAPSHOT_PATH', None)
+os.environ['PREDICTION_SOURCE'] = 'compute'
+os.environ['PROFILING'] = '0'
+
+sys.path.insert(0, ROOT_DIR)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
@@ -0,0 +1,82 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+import app as api
+import predictor
+from win_probability import build_win_probability_matrix
+
+TEAMS = ['LG', 'KIA', '삼성']
+
+
+def _snapshot():
+    matrix = build_win_probability_matrix(TEAMS, [0.6, 0.5, 0.4])
+    return {
+        'hitter_data': None,
+        'pitcher_data': None,
+        'win_probability_matrix': matrix,
+        'win_probability_df': matrix.to_frame(),
+        'predicted_team_rankings_df': pd.DataFrame({
+            'rank': [1, 2, 3], 'team_name': TEAMS, 'predicted_ops': [0.8, 0.7, 0.6],
+            'predicted_whip': [1.2, 1.3, 1.4], 'ops_minus_whip': [-0.4, -0.6, -0.8],
+        }),
+        'prediction_date': None,
+        'last_update': datetime.datetime.now(),
+    }
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(predictor, '_shared_reader', None)
+    monkeypatch.setattr(predictor, 'PREDICTION_SOURCE', 'compute')
+    predictor._swap_snapshot(api.cached_data, _snapshot())
+    return api.app.test_client()
+
+
+def test_batch_matchups(client):
+    response = client.post('/predict_win_probabilities', json={'matchups': [
+        {'team1': 'LG', 'team2': 'KIA'}, {'team1': 'LG', 'team2': 'SSG'}, {'team1': 'LG', 'team2': 'LG'},
+    ]})
+    assert response.status_code == 200
+    matchups = response.get_json()['matchups']
+    assert matchups[0]['win_probability'] == api.cached_data['win_probability_matrix'].get('LG', 'KIA')
+    assert 'error' in matchups[1] and 'error' in matchups[2]
+
+
+@pytest.mark.parametrize('body', [
+    {'date': '2025-05-01', 'days': None},
+    {'date': '2025-05-01', 'days': [1]},
+    {'date': '2025-05-01', 'days': {'n': 1}},
+    {'date': '2025-05-01', 'days': 'a'},
+    {'date': '2025-13-01'},
+    {'date': ['2025-05-01']},
+    {'date': '2025-05-01', 'days': 0},
+    {'matchups': [{'team1': ['LG'], 'team2': 'KIA'}]},
+    {'matchups': [{'team1': 'LG', 'team2': {'name': 'KIA'}}]},
+    {'matchups': [{'team1': 'LG'}]},
+    {'matchups': {'team1': 'LG', 'team2': 'KIA'}},
+    ['matchups'],
+    {},
+])
+def test_batch_rejects_malformed_input(client, body):
+    response = client.post('/predict_win_probabilities', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_batch_rejects_too_many_matchups(client):
+    matchups = [{'team1': 'LG', 'team2': 'KIA'}] * (api.MAX_BATCH_MATCHUPS + 1)
+    assert client.post('/predict_win_probabilities', json={'matchups': matchups}).status_code == 400
+
+
+@pytest.mark.parametrize('body', [{'team1': ['LG'], 'team2': 'KIA'}, {'team1': 'LG', 'team2': None}, ['LG', 'KIA']])
+def test_single_rejects_non_string_teams(client, body):
+    response = client.post('/predict_win_probability', json=body)
+    assert response.status_code == 400
+
+
+def test_single_matchup(client):
+    response = client.post('/predict_win_probability', json={'team1': 'KIA', 'team2': '삼성'})
+    assert response.status_code == 200
+    assert response.get_json()['win_probability'] == api.cached_data['win_probability_matrix'].get('KIA', '삼성')
@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+import pytest
+
+import app as api
+import asgi
+import predictor
+from test_api import _snapshot
+
+
+def _call_asgi(method, path, body=b'', content_type=None):
+    headers = [(b'content-type', content_type.encode())] if content_type else []
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.application({'type': 'http', 'method': method, 'path': path, 'headers': headers}, receive, send))
+    response_headers = {name.decode(): value.decode() for name, value in sent[0]['headers']}
+    return sent[0]['status'], response_headers.get('content-type'), sent[1]['body']
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(predictor, '_shared_reader', None)
+    monkeypatch.setattr(predictor, 'PREDICTION_SOURCE', 'compute')
+    predictor._swap_snapshot(api.cached_data, _snapshot())
+    return api.app.test_client()
+
+
+@pytest.mark.parametrize('method, path, body, content_type', [
+    ('POST', '/predict_win_probability', b'{"team1": "LG"', 'application/json'),
+    ('POST', '/predict_win_probability', b'team1=LG&team2=KIA', 'application/x-www-form-urlencoded'),
+    ('POST', '/predict_win_probability', b'x' * (api.MAX_BODY_BYTES + 1), 'application/json'),
+    ('POST', '/predict_win_probabilities', b'not json', 'application/json'),
+    ('GET', '/predict_win_probability', b'', None),
+    ('GET', '/no_such_route', b'', None),
+    ('POST', '/predict_win_probability', json.dumps({'team1': 'LG', 'team2': 'KIA'}).encode(), 'application/json'),
+])
+def test_asgi_matches_flask(client, method, path, body, content_type):
+    flask_response = client.open(path, method=method, data=body, content_type=content_type)
+    status, response_type, response_body = _call_asgi(method, path, body, content_type)
+
+    assert status == flask_response.status_code
+    assert response_type == flask_response.headers.get('Content-Type')
+    assert response_body == flask_response.get_data()
+
+
+def test_bad_request_body_is_json(client):
+    response = client.post('/predict_win_probability', data=b'{', content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json() == {'error': api.HTTP_ERROR_MESSAGES[400]}
@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+import crawler
+import schema_registry
+
+
+def _record_table(kind):
+    """기록 페이지 한 행 (원본 헤더, 타입 변환된 값)"""
+    row = {'순위': 1, '선수명': '홍길동', '팀명': 'LG'}
+    for spec in schema_registry.PLAYER_SCHEMAS[kind]:
+        if spec.source is not None and spec.source not in row:
+            row[spec.source] = 1.0 if spec.dtype == 'float32' else 1
+    return pd.DataFrame([row])
+
+
+@pytest.mark.parametrize('crawl, kind', [(crawler.crawl_hitter_data, 'hitter'), (crawler.crawl_pitcher_data, 'pitcher')])
+def test_default_page_limit(monkeypatch, crawl, kind):
+    calls = []
+
+    def crawl_table(table_kind, tab, max_pages=None):
+        calls.append(max_pages)
+        return _record_table(table_kind)
+
+    monkeypatch.setattr(crawler.kbo_crawler, 'crawl_table', crawl_table)
+    monkeypatch.setattr(crawler, 'CRAWL_MAX_PAGES', 1)
+
+    df = crawl()
+    crawl(max_pages=0)
+    assert calls == [1, 0]
+    assert list(df.columns[:len(schema_registry.column_names(kind))]) == schema_registry.column_names(kind)
+    assert df['연도'].tolist() == [2025]
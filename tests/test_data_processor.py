@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_processor
+import model_registry
+import schema_registry
+
+
+def _players(kind, n, year, seed):
+    """계약 컬럼을 모두 갖춘 임의의 선수 기록"""
+    rng = np.random.default_rng(seed)
+    data = {'선수명': [f'{kind}{year}-{i}' for i in range(n)], '팀명': [f'팀{i % 10}' for i in range(n)]}
+    for spec in schema_registry.PLAYER_SCHEMAS[kind]:
+        if spec.dtype == 'int16':
+            data.setdefault(spec.name, rng.integers(1, 200, n))
+        elif spec.dtype == 'float32':
+            data.setdefault(spec.name, rng.uniform(0.1, 5.0, n))
+    data['연도'] = np.full(n, year)
+    return schema_registry.apply(pd.DataFrame(data)[schema_registry.column_names(kind)], kind)
+
+
+@pytest.fixture(autouse=True)
+def fresh_training_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_processor, 'TRAINING_CACHE_DIR', str(tmp_path / 'training'))
+    monkeypatch.setattr(data_processor, '_memory_cache', {})
+    monkeypatch.setattr(model_registry, 'REGISTRY_DIR', str(tmp_path / 'models'))
+
+
+def test_hitter_with_zero_at_bats_is_predicted_without_training_on_it():
+    historical = _players('hitter', 80, 2024, seed=1)
+    current = _players('hitter', 20, 2025, seed=2)
+    # 타수 0 → SLG = TB/0 (inf), 타수·타점·희생 모두 0 → OBP = 0/0 (NaN)
+    current.loc[0, ['AB']] = 0
+    current.loc[1, ['AB', 'RBI', 'SAC', 'SF', 'TB']] = 0
+
+    result = data_processor.process_hitter_data(current, historical)
+
+    assert not np.isfinite(result['OPS'].iloc[80:82]).any()
+    assert result['OPS_predict'].notna().sum() >= len(result) - 2
+
+
+def test_dash_record_rows_are_left_out_of_training():
+    historical = _players('pitcher', 80, 2024, seed=3)
+    current = _players('pitcher', 20, 2025, seed=4)
+    # 기록 페이지의 '-'는 계약 변환에서 NaN이 됨
+    current.loc[0, 'WPCT'] = np.nan
+    current.loc[1, 'WHIP'] = np.nan
+
+    result = data_processor.process_pitcher_data(current, historical)
+    features = model_registry.load_artifacts('pitcher')['features']
+
+    # 선택된 변수에 결측이 있는 행만 예측값이 NaN
+    missing_feature = ~np.isfinite(result[features].to_numpy(dtype=np.float64)).all(axis=1)
+    assert result['WHIP_predict'].isna().tolist() == missing_feature.tolist()
+    assert np.isfinite(result['WHIP_predict'].iloc[81])
+
+    # 저장된 모델로 예측할 때도 같은 행만 NaN
+    predicted = data_processor.predict_pitcher_data(current, historical)
+    assert predicted['WHIP_predict'].isna().tolist() == missing_feature.tolist()
+
+
+def test_cached_selection_gives_the_same_predictions():
+    historical = _players('hitter', 80, 2024, seed=5)
+    current = _players('hitter', 20, 2025, seed=6)
+    full = data_processor.process_hitter_data(current, historical)
+
+    # 결과 캐시만 지워 변수 선택/군집 개수는 캐시에서 읽고 KMeans는 다시 학습하게 함
+    for name in [name for name in data_processor._memory_cache if name.startswith('hitter-result-')]:
+        del data_processor._memory_cache[name]
+    for file_name in os.listdir(data_processor.TRAINING_CACHE_DIR):
+        if file_name.startswith('hitter-result-'):
+            os.remove(os.path.join(data_processor.TRAINING_CACHE_DIR, file_name))
+    refit = data_processor.process_hitter_data(current, historical)
+
+    np.testing.assert_array_equal(refit['OPS_predict'].to_numpy(), full['OPS_predict'].to_numpy())
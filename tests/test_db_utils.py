@@ -0,0 +1,171 @@
+import threading
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+
+import db_utils
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _rows(engine, table_name):
+    with engine.connect() as connection:
+        return pd.read_sql(text(f"SELECT * FROM {table_name}"), connection)
+
+
+def test_replace_table_swaps_contents(engine):
+    db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': [1, 2], 'team_name': ['LG', 'KIA']}))
+    db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': [1], 'team_name': ['삼성']}))
+
+    assert _rows(engine, 'team_rankings').to_dict(orient='records') == [{'rank': 1, 'team_name': '삼성'}]
+    assert inspect(engine).get_table_names() == ['team_rankings']
+
+
+def test_sqlite_swap_runs_in_one_transaction(engine):
+    """DROP과 RENAME이 모두 열린 트랜잭션 안에서 실행되어야 함 (pysqlite는 DDL 앞에서 BEGIN을 보내지 않음)"""
+    db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': [1]}))
+    statements = []
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def record(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, connection.connection.dbapi_connection.in_transaction))
+
+    db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': [2]}))
+
+    swap = [(statement, in_transaction) for statement, in_transaction in statements
+            if statement.startswith(('DROP TABLE IF EXISTS team_rankings', 'ALTER TABLE'))
+            and db_utils.STAGING_SUFFIX not in statement.split()[-1]]
+    assert [statement.split()[0] for statement, _ in swap] == ['DROP', 'ALTER']
+    assert all(in_transaction for _, in_transaction in swap)
+
+
+def test_failed_swap_keeps_previous_table(engine, monkeypatch):
+    db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': [1]}))
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def fail_rename(connection, cursor, statement, parameters, context, executemany):
+        if statement.startswith('ALTER TABLE'):
+            raise RuntimeError('rename failed')
+
+    with pytest.raises(RuntimeError):
+        db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': [2]}))
+    assert _rows(engine, 'team_rankings')['rank'].tolist() == [1]
+
+
+def test_reader_never_sees_missing_table(engine):
+    db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': range(10)}))
+    stop = threading.Event()
+    errors = []
+    counts = set()
+
+    def read():
+        reader = create_engine(engine.url)
+        while not stop.is_set():
+            try:
+                with reader.connect() as connection:
+                    counts.add(connection.execute(text("SELECT COUNT(*) FROM team_rankings")).scalar())
+            except Exception as e:
+                errors.append(e)
+        reader.dispose()
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    try:
+        for n in range(1, 30):
+            db_utils._replace_table(engine, 'team_rankings', pd.DataFrame({'rank': range(n % 3 + 10)}))
+    finally:
+        stop.set()
+        thread.join(10)
+
+    assert errors == []
+    assert counts <= {10, 11, 12}
+
+
+def _win_probability_rows(prediction_date, probability=60.0):
+    return pd.DataFrame({
+        'team1': ['LG', 'KIA'], 'team2': ['KIA', 'LG'],
+        'win_probability': [probability, 100 - probability], 'prediction_date': [prediction_date] * 2,
+    })
+
+
+def _ranking_rows(prediction_date):
+    return pd.DataFrame({
+        'rank': [1, 2], 'team_name': ['LG', 'KIA'], 'predicted_ops': [0.8, 0.7], 'predicted_whip': [1.2, 1.3],
+        'ops_minus_whip': [-0.4, -0.6], 'prediction_date': [prediction_date] * 2,
+    })
+
+
+def test_append_history_keeps_previous_snapshots(engine):
+    db_utils._append_history(engine, 'win_probability_history', _win_probability_rows('2025-05-01 05:00:00', 60.0))
+    db_utils._append_history(engine, 'win_probability_history', _win_probability_rows('2025-05-02 05:00:00', 55.0))
+    db_utils._append_history(engine, 'team_ranking_history', _ranking_rows('2025-05-01 05:00:00'))
+    db_utils._append_history(engine, 'team_ranking_history', _ranking_rows('2025-05-02 05:00:00'))
+
+    assert len(_rows(engine, 'win_probability_history')) == 4
+
+    latest_date, latest, rankings = db_utils.load_prediction_snapshot(engine)
+    assert latest_date == '2025-05-02 05:00:00'
+    assert latest.get('LG', 'KIA') == 55.0
+    assert rankings['team_name'].tolist() == ['LG', 'KIA']
+
+    as_of_date, as_of, _ = db_utils.load_prediction_snapshot(engine, as_of='2025-05-01 23:59:59')
+    assert as_of_date == '2025-05-01 05:00:00'
+    assert as_of.get('LG', 'KIA') == 60.0
+
+
+def test_compact_history_applies_retention_and_daily_dedup(engine):
+    db_utils._ensure_history_table(engine, 'win_probability_history')
+    now = pd.Timestamp('2025-06-30 05:00:00').to_pydatetime()
+    dates = [
+        '2023-01-01 05:00:00',  # 보관 기간(730일) 경과 → 삭제
+        '2025-06-10 05:00:00', '2025-06-10 09:00:00', '2025-06-10 21:00:00',  # 정리 구간 → 마지막만 유지
+        '2025-06-29 05:00:00', '2025-06-29 09:00:00',  # 최근 → 모두 유지
+    ]
+    frame = pd.concat([_win_probability_rows(date) for date in dates], ignore_index=True)
+    frame.to_sql('win_probability_history', con=engine, if_exists='append', index=False)
+
+    db_utils._compact_history(engine, 'win_probability_history', now)
+
+    remaining = sorted(set(_rows(engine, 'win_probability_history')['prediction_date']))
+    assert remaining == ['2025-06-10 21:00:00', '2025-06-29 05:00:00', '2025-06-29 09:00:00']
+
+
+class _RecordingConnection:
+    """실행한 SQL만 기록하는 가짜 MySQL 연결 (engine.begin() 대체)"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def begin(self):
+        return self
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+
+def test_mysql_partitions_are_added_ahead_and_dropped_after_retention(monkeypatch):
+    connection = _RecordingConnection()
+    monkeypatch.setattr(db_utils, '_history_partitions', lambda conn, table_name: ['p202301', 'p202305', 'p202506', 'pmax'])
+
+    now = pd.Timestamp('2025-06-15 05:00:00').to_pydatetime()
+    db_utils._maintain_mysql_partitions(connection, 'win_probability_history', now)
+
+    # 이번 달(p202506)은 이미 있으므로 다음 달만 pmax에서 분리
+    assert connection.statements[0] == (
+        "ALTER TABLE win_probability_history REORGANIZE PARTITION pmax INTO ("
+        "PARTITION p202507 VALUES LESS THAN (TO_DAYS('2025-08-01')), PARTITION pmax VALUES LESS THAN MAXVALUE)"
+    )
+    # 보관 기간(730일 → 2023-06-16 이전)이 모두 지난 월 파티션만 삭제
+    assert connection.statements[1:] == ["ALTER TABLE win_probability_history DROP PARTITION p202301, p202305"]
@@ -0,0 +1,49 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from innings import InningsParseError, parse_innings
+
+
+def test_supported_formats():
+    values = pd.Series(['157', '149 1/3', '2/3', '149.1', '149.2', ' 12 ', None], index=list('abcdefg'))
+    result = parse_innings(values)
+
+    assert result.index.tolist() == list('abcdefg')
+    np.testing.assert_allclose(result.to_numpy(), [157, 149 + 1 / 3, 2 / 3, 149 + 1 / 3, 149 + 2 / 3, 12, np.nan])
+
+
+def test_numeric_values_pass_through():
+    result = parse_innings(pd.Series([157, 149.5]))
+    assert result.dtype == np.float64
+    assert result.tolist() == [157.0, 149.5]
+
+    # 문자열 사이에 섞인 숫자 값도 그대로 사용
+    assert parse_innings(pd.Series(['1 1/3', 7.0], dtype=object)).tolist() == [pytest.approx(4 / 3), 7.0]
+
+
+def test_raise_reports_every_invalid_value():
+    values = pd.Series(['10', '1.3', 'abc', '1 1/0', '10'])
+    with pytest.raises(InningsParseError) as excinfo:
+        parse_innings(values)
+    assert excinfo.value.invalid.to_dict() == {1: '1.3', 2: 'abc', 3: '1 1/0'}
+
+
+def test_coerce_turns_invalid_values_into_nan():
+    result = parse_innings(pd.Series(['10', 'abc', '1 1/0']), errors='coerce')
+    assert result.iloc[0] == 10.0
+    assert result.iloc[1:].isna().all()
+
+
+def test_unknown_errors_mode():
+    with pytest.raises(ValueError):
+        parse_innings(pd.Series(['1']), errors='ignore')
+
+
+def test_error_survives_pickle():
+    error = InningsParseError(pd.Series({5: 'abc'}))
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored.invalid.to_dict() == {5: 'abc'}
+    assert str(restored) == str(error)
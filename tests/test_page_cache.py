@@ -0,0 +1,80 @@
+import os
+import time
+
+import requests
+
+from page_cache import PageCache
+
+
+class _Session:
+    """URL마다 고정된 본문을 돌려주는 가짜 세션"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def request(self, method, url, headers=None, data=None, timeout=None):
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response._content = self.pages[url]
+        return response
+
+
+def _files(cache, kind):
+    directory = os.path.join(cache.cache_dir, kind)
+    return sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+
+
+def _age_all(cache, seconds):
+    """캐시 파일을 모두 seconds초 전에 쓴 것으로 만듦"""
+    past = time.time() - seconds
+    for kind in ('objects', 'tables', 'entries', 'latest'):
+        for name in _files(cache, kind):
+            os.utime(os.path.join(cache.cache_dir, kind, name), (past, past))
+
+
+def test_expired_dated_entries_are_removed_but_latest_is_kept(tmp_path):
+    cache = PageCache(cache_dir=str(tmp_path), ttl_seconds=600, max_bytes=10 ** 9)
+    session = _Session({'http://kbo/a': b'a' * 100})
+
+    cache.fetch('http://kbo/a', session=session, date='2025-05-01')
+    _age_all(cache, 3600)
+    cache.fetch('http://kbo/a', session=session, date='2025-05-02')
+
+    # 전날 항목은 TTL이 지나 삭제되고, 오늘 항목과 URL별 최신 항목만 남음
+    assert len(_files(cache, 'entries')) == 1
+    assert len(_files(cache, 'latest')) == 1
+    assert len(_files(cache, 'objects')) == 1
+
+
+def test_entries_of_evicted_objects_are_removed(tmp_path):
+    cache = PageCache(cache_dir=str(tmp_path), ttl_seconds=600, max_bytes=1700)
+    session = _Session({'http://kbo/a': b'a' * 1000, 'http://kbo/b': b'b' * 1000})
+
+    cache.fetch('http://kbo/a', session=session)
+    _age_all(cache, 60)
+    page = cache.fetch('http://kbo/b', session=session)
+
+    # 오래된 a 원본이 삭제되면 a를 가리키는 entries/latest 항목도 남지 않음
+    assert _files(cache, 'objects') == [page.content_hash + '.html']
+    for kind in ('entries', 'latest'):
+        entries = [cache._read_json(os.path.join(cache.cache_dir, kind, name)) for name in _files(cache, kind)]
+        assert [entry['content_hash'] for entry in entries] == [page.content_hash]
+
+
+def test_index_files_count_towards_the_size_limit(tmp_path):
+    cache = PageCache(cache_dir=str(tmp_path), ttl_seconds=10 ** 6, max_bytes=10 ** 9)
+    session = _Session({f'http://kbo/{i}': b'x' for i in range(20)})
+    for i in range(20):
+        cache.fetch(f'http://kbo/{i}', session=session)
+    # 원본은 모두 같은 내용(1바이트)이므로 크기 대부분은 항목 파일
+    assert len(_files(cache, 'objects')) == 1
+    index_bytes = sum(os.path.getsize(os.path.join(cache.cache_dir, kind, name))
+                      for kind in ('entries', 'latest') for name in _files(cache, kind))
+
+    cache.max_bytes = index_bytes // 2
+    assert cache.evict() > 0
+    remaining = sum(os.path.getsize(os.path.join(cache.cache_dir, kind, name))
+                    for kind in ('objects', 'tables', 'entries', 'latest') for name in _files(cache, kind))
+    assert remaining <= cache.max_bytes
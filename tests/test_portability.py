@@ -0,0 +1,22 @@
+import os
+import subprocess
+import sys
+
+from conftest import ROOT_DIR
+
+# Windows에 없는 POSIX 전용 표준 모듈
+POSIX_ONLY_MODULES = ('fcntl', 'resource')
+
+
+def test_api_modules_import_without_posix_only_modules():
+    """공유 스냅샷 모드를 켜지 않았다면 POSIX 전용 모듈 없이도 predictor/app을 불러올 수 있어야 함"""
+    code = (
+        'import sys\n'
+        f'for name in {POSIX_ONLY_MODULES!r}:\n'
+        '    sys.modules[name] = None\n'
+        'import predictor, app\n'
+    )
+    env = dict(os.environ)
+    env.pop('PREDICTION_SHARED_SNAPSHOT_PATH', None)
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
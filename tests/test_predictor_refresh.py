@@ -0,0 +1,123 @@
+import datetime
+import threading
+
+import pytest
+
+import predictor
+from singleflight import SingleFlight
+
+
+def _snapshot(age_seconds):
+    return {
+        'win_probability_matrix': None,
+        'predicted_team_rankings_df': None,
+        'last_update': datetime.datetime.now() - datetime.timedelta(seconds=age_seconds),
+    }
+
+
+def _wait_for_waiter(flight):
+    for _ in range(500):
+        calls = flight.stats()['in_flight']
+        if calls and calls[0]['coalesced'] >= 1:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError('동기 호출자가 백그라운드 새로고침에 합류하지 않았습니다.')
+
+
+@pytest.fixture
+def background_mode(monkeypatch):
+    flight = SingleFlight()
+    monkeypatch.setattr(predictor, 'REFRESH_MODE', 'background')
+    monkeypatch.setattr(predictor, 'PREDICTION_SOURCE', 'compute')
+    monkeypatch.setattr(predictor, '_refresh_flight', flight)
+    monkeypatch.setattr(predictor, '_last_refresh_failure', None)
+    monkeypatch.setattr(predictor, '_shared_reader', None)
+    return flight
+
+
+def _start_blocked_background_refresh(monkeypatch, build):
+    """만료된(허용 시간 안의) 스냅샷으로 백그라운드 새로고침을 시작하고, build가 끝나지 않은 상태로 반환"""
+    stale = _snapshot(predictor.CACHE_TTL_SECONDS + 60)
+    cached_data = {}
+    predictor._swap_snapshot(cached_data, stale)
+    started, release = threading.Event(), threading.Event()
+
+    def blocked_build(previous):
+        started.set()
+        release.wait(5)
+        return build(previous)
+
+    monkeypatch.setattr(predictor, '_build_snapshot', blocked_build)
+    assert predictor.get_snapshot(cached_data) is stale
+    assert started.wait(5)
+    return cached_data, stale, release
+
+
+def _sync_call_past_staleness(monkeypatch, cached_data):
+    """허용 시간을 넘긴 요청: 요청 스레드에서 새로고침을 기다림"""
+    monkeypatch.setattr(predictor, 'MAX_STALENESS_SECONDS', 1)
+    outcome = {}
+
+    def call():
+        try:
+            outcome['snapshot'] = predictor.get_snapshot(cached_data)
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    return thread, outcome
+
+
+def test_sync_caller_joining_background_refresh_gets_new_snapshot(monkeypatch, background_mode):
+    fresh = _snapshot(0)
+    cached_data, _, release = _start_blocked_background_refresh(monkeypatch, lambda previous: fresh)
+
+    thread, outcome = _sync_call_past_staleness(monkeypatch, cached_data)
+    _wait_for_waiter(background_mode)
+    release.set()
+    thread.join(5)
+
+    assert outcome == {'snapshot': fresh}
+    assert cached_data['snapshot'] is fresh
+    assert predictor._last_refresh_failure is None
+
+
+def test_sync_caller_joining_failed_background_refresh_gets_error(monkeypatch, background_mode):
+    def fail(previous):
+        raise RuntimeError('crawl failed')
+
+    cached_data, stale, release = _start_blocked_background_refresh(monkeypatch, fail)
+
+    thread, outcome = _sync_call_past_staleness(monkeypatch, cached_data)
+    _wait_for_waiter(background_mode)
+    release.set()
+    thread.join(5)
+
+    assert isinstance(outcome.get('error'), RuntimeError)
+    assert cached_data['snapshot'] is stale
+    assert predictor._last_refresh_failure is not None
+
+
+def test_unchanged_database_keeps_the_snapshot_object(monkeypatch):
+    monkeypatch.setattr(predictor, 'REFRESH_MODE', 'sync')
+    monkeypatch.setattr(predictor, 'PREDICTION_SOURCE', 'database')
+    monkeypatch.setattr(predictor, '_refresh_flight', SingleFlight())
+    monkeypatch.setattr(predictor, '_shared_reader', None)
+    monkeypatch.setattr(predictor, '_get_db_engine', lambda: None)
+    checks = []
+    monkeypatch.setattr(predictor.db_utils, 'get_latest_prediction_date',
+                        lambda engine: checks.append(engine) or '2025-05-01 05:00:00')
+
+    loaded = dict(_snapshot(predictor.DB_CHECK_SECONDS + 60), prediction_date='2025-05-01 05:00:00')
+    cached_data = {}
+    predictor._swap_snapshot(cached_data, loaded)
+
+    # DB 변경이 없으면 같은 스냅샷 객체를 유지하고 확인 시각만 갱신
+    assert predictor.get_snapshot(cached_data) is loaded
+    assert cached_data['snapshot'] is loaded
+    assert len(checks) == 1
+
+    # 확인 주기 안에서는 DB를 다시 확인하지 않음
+    assert predictor.get_snapshot(cached_data) is loaded
+    assert len(checks) == 1
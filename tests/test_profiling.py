@@ -0,0 +1,33 @@
+import app as api
+import predictor
+import profiling
+from test_api import _snapshot
+
+
+def _fail_save(*args):
+    raise OSError('디스크가 가득 찼습니다')
+
+
+def test_profile_save_failure_keeps_response(monkeypatch):
+    monkeypatch.setattr(predictor, '_shared_reader', None)
+    monkeypatch.setattr(predictor, 'PREDICTION_SOURCE', 'compute')
+    monkeypatch.setattr(profiling, 'PROFILING_ENABLED', True)
+    monkeypatch.setattr(profiling, 'PROFILE_SLOW_SECONDS', 0.0)
+    monkeypatch.setattr(profiling, '_save', _fail_save)
+    predictor._swap_snapshot(api.cached_data, _snapshot())
+
+    response = api.app.test_client().post('/predict_win_probability', json={'team1': 'LG', 'team2': 'KIA'})
+
+    assert response.status_code == 200
+    assert 'X-Profile-File' not in response.headers
+
+
+def test_profile_context_manager_survives_save_failure(monkeypatch):
+    monkeypatch.setattr(profiling, '_save', _fail_save)
+    with profiling.profile('daily_job', force=True) as session:
+        pass
+    assert session.path is None
+    # 실패한 뒤에도 같은 스레드에서 다시 프로파일링할 수 있어야 함
+    next_session = profiling.start('next', force=True)
+    assert next_session is not None
+    assert next_session.stop() is None
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import season_simulator
+from season_simulator import simulate_season
+from win_probability import build_win_probability_matrix
+
+TEAMS = ['LG', 'KIA', '삼성', '두산']
+
+
+@pytest.fixture
+def matrix():
+    return build_win_probability_matrix(TEAMS, [0.6, 0.5, 0.45, 0.4])
+
+
+def _schedule(pairs):
+    return pd.DataFrame(pairs, columns=['away', 'home'])
+
+
+def _round_robin(times=3):
+    return _schedule([(a, h) for _ in range(times) for a in TEAMS for h in TEAMS if a != h])
+
+
+def test_same_seed_gives_same_result_for_any_process_count(matrix, monkeypatch):
+    monkeypatch.setattr(season_simulator, 'SEASONS_PER_CHUNK', 500)
+    monkeypatch.setattr(season_simulator, 'MIN_PARALLEL_SEASONS', 0)
+    schedule = _round_robin()
+
+    single = simulate_season(matrix, schedule, n_seasons=1200, seed=7, processes=1)
+    parallel = simulate_season(matrix, schedule, n_seasons=1200, seed=7, processes=2)
+
+    np.testing.assert_array_equal(single.rank_counts, parallel.rank_counts)
+    np.testing.assert_array_equal(single.expected_wins, parallel.expected_wins)
+
+
+def test_expected_wins_match_win_probabilities(matrix):
+    schedule = _round_robin()
+    simulation = simulate_season(matrix, schedule, n_seasons=20000, seed=1)
+
+    p = matrix.probabilities / 100
+    expected = [
+        sum(p[matrix.team_index[a], matrix.team_index[h]] for a, h in schedule.itertuples(index=False) if a == team)
+        + sum(1 - p[matrix.team_index[a], matrix.team_index[h]] for a, h in schedule.itertuples(index=False) if h == team)
+        for team in TEAMS
+    ]
+    np.testing.assert_allclose(simulation.expected_wins, expected, atol=0.1)
+    assert simulation.games.tolist() == [18] * 4
+
+
+def test_rank_counts_cover_every_season(matrix):
+    simulation = simulate_season(matrix, _round_robin(), n_seasons=1000, seed=2, postseason_spots=2)
+
+    assert (simulation.rank_counts.sum(axis=0) == 1000).all()
+    assert (simulation.rank_counts.sum(axis=1) == 1000).all()
+    np.testing.assert_allclose(simulation.rank_distribution().sum(axis=1), 100.0)
+    assert simulation.postseason_odds().sum() == pytest.approx(200.0)
+    assert simulation.to_frame()['team_name'].iloc[0] == 'LG'
+
+
+def test_current_record_decides_the_standings(matrix):
+    # 남은 경기가 한 경기뿐이면 현재 성적 차이를 뒤집을 수 없음
+    simulation = simulate_season(
+        matrix, _schedule([('LG', 'KIA')]), n_seasons=500, seed=3,
+        current_wins={'두산': 80, '삼성': 70, 'KIA': 60, 'LG': 50},
+        current_losses={'두산': 60, '삼성': 70, 'KIA': 80, 'LG': 90},
+    )
+
+    assert simulation.rank_counts[[matrix.team_index[t] for t in ['두산', '삼성', 'KIA', 'LG']],
+                                  [0, 1, 2, 3]].tolist() == [500] * 4
+    assert simulation.games.tolist() == [141, 141, 140, 140]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'schedule': _schedule([('LG', 'SSG')])},
+    {'schedule': _schedule([('LG', 'LG')])},
+    {'schedule': _schedule([('LG', 'KIA')]), 'current_wins': {'SSG': 10}},
+    {'schedule': _schedule([('LG', 'KIA')]), 'n_seasons': 0},
+])
+def test_invalid_input(matrix, kwargs):
+    with pytest.raises(ValueError):
+        simulate_season(matrix, **kwargs)
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+def _wait_for_coalesced(flight, key, count):
+    """key 작업에 count명이 합류할 때까지 대기"""
+    for _ in range(500):
+        calls = [call for call in flight.stats()['in_flight'] if call['key'] == key]
+        if calls and calls[0]['coalesced'] >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError('합류한 호출자가 없습니다.')
+
+
+def test_do_runs_once_for_concurrent_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def work():
+        runs.append(1)
+        release.wait(5)
+        return 'result'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do('key', work))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    _wait_for_coalesced(flight, 'key', 3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ['result'] * 4
+    assert len(runs) == 1
+    assert flight.stats()['recent'][-1]['coalesced'] == 3
+    assert not flight.in_flight('key')
+
+
+def test_do_shares_the_leader_error():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError('boom')
+
+    errors = []
+
+    def call():
+        try:
+            flight.do('key', fail)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    _wait_for_coalesced(flight, 'key', 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+
+
+def test_start_does_not_wait_and_waiters_join_background_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    assert flight.start('key', lambda: release.wait(5) and 'background') is True
+    # 진행 중이면 새로 시작하지 않음
+    assert flight.start('key', lambda: 'second') is False
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(flight.do('key', lambda: 'sync')))
+    waiter.start()
+    _wait_for_coalesced(flight, 'key', 2)
+    release.set()
+    waiter.join(5)
+
+    assert results == ['background']
+
+
+def test_start_records_error_without_raising():
+    flight = SingleFlight()
+    done = threading.Event()
+
+    def fail():
+        done.set()
+        raise ValueError('bad')
+
+    flight.start('key', fail)
+    done.wait(5)
+    for _ in range(500):
+        if flight.stats()['recent']:
+            break
+        threading.Event().wait(0.01)
+    assert flight.stats()['recent'][-1]['error'] == 'bad'
+    with pytest.raises(ZeroDivisionError):
+        flight.do('key', lambda: 1 / 0)
@@ -0,0 +1,66 @@
+import glob
+import os
+
+import pytest
+
+import table_extract
+from conftest import ROOT_DIR
+
+FIXTURES = sorted(glob.glob(os.path.join(ROOT_DIR, 'benchmarks', 'fixtures', '*.html')))
+
+HIDDEN_CASE_PAGE = """
+<form>
+<input type="HIDDEN" name="__VIEWSTATE" value="abc">
+<input type="Hidden" name="__EVENTVALIDATION" value="def">
+<input type="text" name="search" value="x">
+<div class="record_result"><table>
+<thead><tr><th>순위</th><th>선수명</th></tr></thead>
+<tbody><tr><td>1</td><td> 홍길동 </td></tr></tbody>
+</table></div>
+</form>
+"""
+
+
+def _extract_both(document):
+    lxml_result = table_extract._extract_lxml(document)
+    stdlib_result = table_extract._extract_stdlib(document)
+    # rows는 lxml 쪽이 생성기이므로 목록으로 바꿔 비교
+    return ([*lxml_result[:1], list(lxml_result[1]), *lxml_result[2:]],
+            [*stdlib_result[:1], list(stdlib_result[1]), *stdlib_result[2:]])
+
+
+@pytest.mark.parametrize('path', FIXTURES, ids=os.path.basename)
+def test_lxml_and_stdlib_extract_the_same_page(path):
+    pytest.importorskip('lxml')
+    with open(path, encoding='utf-8') as f:
+        document = f.read()
+
+    lxml_result, stdlib_result = _extract_both(document)
+
+    for part, lxml_value, stdlib_value in zip(('headers', 'rows', 'hidden', 'selects', 'anchors'),
+                                              lxml_result, stdlib_result):
+        assert lxml_value == stdlib_value, part
+
+
+def test_hidden_input_type_is_case_insensitive():
+    expected = {'__VIEWSTATE': 'abc', '__EVENTVALIDATION': 'def'}
+    assert table_extract._extract_stdlib(HIDDEN_CASE_PAGE)[2] == expected
+
+    pytest.importorskip('lxml')
+    lxml_result, stdlib_result = _extract_both(HIDDEN_CASE_PAGE)
+    assert lxml_result == stdlib_result
+
+
+def test_regenerated_fixtures_parse_with_the_record_schema(tmp_path):
+    from benchmarks import make_fixtures
+    import schema_registry
+
+    make_fixtures.build_fixtures(str(tmp_path))
+
+    for kind, season in make_fixtures.FIXTURE_SEASONS.items():
+        with open(tmp_path / f'{kind}_basic1_p1.html', encoding='utf-8') as f:
+            table, hidden, _, _ = table_extract.extract_record_page(f.read(), schema_registry.record_table_schema(kind))
+        expected = make_fixtures.read_season(kind, season).head(make_fixtures.ROWS_PER_PAGE)
+        assert len(table) == len(expected)
+        assert table['선수명'].tolist() == expected['선수명'].tolist()
+        assert hidden['__VIEWSTATE'] == f'fixture-{season}-1'
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+import data_processor
+
+
+@pytest.fixture
+def training_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_processor, 'TRAINING_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(data_processor, '_memory_cache', {})
+    return data_processor._memory_cache
+
+
+def test_memory_cache_keeps_latest_entry_per_kind(training_cache):
+    for day in range(5):
+        data_processor._save_cached(f'hitter-result-{day:032d}', {'day': day})
+    data_processor._save_cached('hitter-selection-' + 'a' * 32, {'selection': 1})
+    data_processor._save_cached('pitcher-result-' + 'b' * 32, {'pitcher': 1})
+
+    assert sorted(training_cache) == [
+        'hitter-result-' + f'{4:032d}', 'hitter-selection-' + 'a' * 32, 'pitcher-result-' + 'b' * 32,
+    ]
+
+
+def test_evicted_entry_is_reloaded_from_disk(training_cache):
+    old_name, new_name = 'hitter-result-' + '0' * 32, 'hitter-result-' + '1' * 32
+    data_processor._save_cached(old_name, {'value': 'old'})
+    data_processor._save_cached(new_name, {'value': 'new'})
+    assert old_name not in training_cache
+
+    assert data_processor._load_cached(old_name) == {'value': 'old'}
+    assert list(training_cache) == [old_name]
+    assert data_processor._load_cached('hitter-result-' + '2' * 32) is None
+
+
+def test_disk_cache_keeps_latest_files_per_kind(training_cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_processor, 'TRAINING_CACHE_KEEP_FILES', 3)
+    for day in range(6):
+        data_processor._save_cached(f'hitter-result-{day:032d}', {'day': day})
+        # 파일 시각이 같은 초에 겹치지 않도록 저장 순서대로 시각을 지정
+        os.utime(tmp_path / f'hitter-result-{day:032d}.pkl', (1000 + day, 1000 + day))
+    data_processor._save_cached('pitcher-result-' + 'b' * 32, {'pitcher': 1})
+
+    assert sorted(os.listdir(tmp_path)) == [
+        *(f'hitter-result-{day:032d}.pkl' for day in (3, 4, 5)), 'pitcher-result-' + 'b' * 32 + '.pkl',
+    ]
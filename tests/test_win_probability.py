@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from win_probability import WinProbabilityMatrix, build_win_probability_matrix
+
+
+def _loop_matrix(teams, scores):
+    """벡터화 이전의 팀 쌍별 반복 계산 (비교 기준)"""
+    expected = np.full((len(teams), len(teams)), np.nan)
+    for i, a in enumerate(scores):
+        for j, b in enumerate(scores):
+            if i != j:
+                expected[i, j] = 50.0 if a + b == 0 else round(a / (a + b) * 100, 2)
+    return expected
+
+
+def test_matrix_matches_pairwise_loop():
+    teams = ['LG', 'KIA', '삼성', '두산']
+    scores = [0.61, 0.55, 0.48, 0.1]
+    matrix = build_win_probability_matrix(teams, scores)
+
+    np.testing.assert_allclose(matrix.probabilities, _loop_matrix(teams, scores), equal_nan=True)
+    assert matrix.teams == tuple(teams)
+    assert np.isnan(np.diag(matrix.probabilities)).all()
+
+
+def test_zero_total_is_even():
+    matrix = build_win_probability_matrix(['A', 'B'], [0.0, 0.0])
+    assert matrix.get('A', 'B') == 50.0
+
+
+def test_get_many_and_lookup():
+    matrix = build_win_probability_matrix(['LG', 'KIA', '삼성'], [0.6, 0.5, 0.4])
+    values = matrix.get_many(['LG', '삼성'], ['KIA', 'LG'])
+    assert values.tolist() == [matrix.get('LG', 'KIA'), matrix.get('삼성', 'LG')]
+    assert 'LG' in matrix and 'SSG' not in matrix
+    with pytest.raises(KeyError):
+        matrix.get('LG', 'SSG')
+
+
+def test_long_frame_round_trip():
+    matrix = build_win_probability_matrix(['LG', 'KIA', '삼성'], [0.6, 0.5, 0.4])
+    restored = WinProbabilityMatrix.from_long_frame(matrix.to_long_frame())
+
+    assert restored.teams == matrix.teams
+    np.testing.assert_array_equal(restored.probabilities, matrix.probabilities)
+
+
+def test_from_frame_accepts_dash_strings():
+    frame = pd.DataFrame([['-', '60.0'], ['40.0', '-']], index=['LG', 'KIA'], columns=['LG', 'KIA'])
+    matrix = WinProbabilityMatrix.from_frame(frame)
+    assert matrix.get('LG', 'KIA') == 60.0
+    assert np.isnan(matrix.get('LG', 'LG'))
@@ -0,0 +1,89 @@
+# win_probability.py
+# 승률 행렬 자료형 (sklearn/크롤러 의존성 없이 API, db_utils에서 공용으로 사용)
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import traced
+
+
+@dataclass(frozen=True)
+class WinProbabilityMatrix:
+    """팀 간 예측 승률(%) 행렬. probabilities[i, j]는 teams[i]가 teams[j]를 이길 확률이며 대각선은 NaN"""
+    teams: tuple
+    probabilities: np.ndarray
+    team_index: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'teams', tuple(self.teams))
+        object.__setattr__(self, 'probabilities', np.asarray(self.probabilities, dtype=np.float64))
+        object.__setattr__(self, 'team_index', {team: i for i, team in enumerate(self.teams)})
+
+    def __contains__(self, team):
+        return team in self.team_index
+
+    def __len__(self):
+        return len(self.teams)
+
+    def get(self, team1, team2):
+        """두 팀 간 예측 승률 반환 (같은 팀이면 NaN, 없는 팀이면 KeyError)"""
+        return float(self.probabilities[self.team_index[team1], self.team_index[team2]])
+
+    def get_many(self, team1s, team2s):
+        """여러 대진의 승률을 한 번에 조회해 float64 배열로 반환 (팀 이름은 team_index로 미리 검증해야 함)"""
+        rows = np.fromiter((self.team_index[team] for team in team1s), dtype=np.intp, count=len(team1s))
+        cols = np.fromiter((self.team_index[team] for team in team2s), dtype=np.intp, count=len(team2s))
+        return self.probabilities[rows, cols]
+
+    def to_frame(self):
+        """팀 x 팀 float64 DataFrame으로 변환"""
+        teams = list(self.teams)
+        return pd.DataFrame(self.probabilities, index=teams, columns=teams)
+
+    def to_long_frame(self):
+        """DB 저장용 긴 형식(team1, team2, win_probability)으로 변환 (기존 melt 결과와 같은 순서)"""
+        teams = np.asarray(self.teams, dtype=object)
+        n = len(teams)
+        return pd.DataFrame({
+            'team1': np.tile(teams, n),
+            'team2': np.repeat(teams, n),
+            'win_probability': self.probabilities.ravel(order='F'),
+        })
+
+    @classmethod
+    def from_frame(cls, win_probability_df):
+        """기존 형식의 승률 DataFrame('-' 문자열 포함 가능)에서 생성"""
+        values = win_probability_df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        return cls(teams=win_probability_df.index.tolist(), probabilities=values)
+
+    @classmethod
+    def from_long_frame(cls, long_format_df):
+        """DB의 긴 형식(team1, team2, win_probability)에서 생성 (팀 순서는 저장 순서 유지)"""
+        teams = pd.unique(long_format_df['team1'])
+        team_index = {team: i for i, team in enumerate(teams)}
+        rows = long_format_df['team1'].map(team_index).to_numpy()
+        cols = long_format_df['team2'].map(team_index).to_numpy()
+
+        probabilities = np.full((len(teams), len(teams)), np.nan)
+        probabilities[rows, cols] = pd.to_numeric(long_format_df['win_probability'], errors='coerce').to_numpy(dtype=np.float64)
+        return cls(teams=teams.tolist(), probabilities=probabilities)
+
+
+@traced('matrix_build', rows_in=lambda teams, scores: len(teams), rows_out=lambda matrix: matrix.probabilities.size)
+def build_win_probability_matrix(teams, scores):
+    """조정 점수 벡터로부터 a / (a + b) 브로드캐스트 한 번으로 승률 행렬 생성"""
+    scores = np.asarray(scores, dtype=np.float64)
+    a = scores[:, np.newaxis]
+    b = scores[np.newaxis, :]
+    total = a + b
+
+    # 분모가 0이 되는 경우는 기존과 같이 50%로 처리
+    with np.errstate(divide='ignore', invalid='ignore'):
+        probabilities = np.where(total == 0, 50.0, a / total * 100)
+
+    # 소수점 둘째 자리까지 반올림, 같은 팀 간 승률은 의미 없으므로 NaN
+    probabilities = np.round(probabilities, 2)
+    np.fill_diagonal(probabilities, np.nan)
+
+    return WinProbabilityMatrix(teams=teams, probabilities=probabilities)